@@ -22,8 +22,16 @@ from core.database import Base
 # Import all models to ensure they're registered with Base.metadata
 from models.user import User
 from models.blog import Blog
+from models.tag import Tag
+from models.related_post import RelatedPost
+from models.view_stat import ViewBucket, TrendingScore
+from models.feed import FeedDocument
 from models.project import Project
 from models.newsletter import Subscriber, Newsletter, NewsletterRequest
+from models.activity import Activity
+from models.ai_job import AIJob
+from models.task import Task
+from models.job_run import JobRun, SchedulerLease
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
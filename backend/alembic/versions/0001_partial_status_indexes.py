@@ -0,0 +1,55 @@
+"""Partial indexes for hot status filters
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:00:00
+
+Indexes match the exact predicates and sort orders used in the services:
+- blog_service.list_blogs (PUBLISHED, published_at DESC NULLS LAST, created_at DESC)
+- newsletter_service.get_active_subscriber_emails / admin subscriber list
+- newsletter_service.get_pending_requests (PENDING, priority DESC, votes DESC)
+
+IF NOT EXISTS keeps the migration safe on databases where the tables were
+created by create_all_tables() with these indexes already in place.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_blog_published_listing
+        ON blogs (published_at DESC NULLS LAST, created_at DESC)
+        WHERE status = 'PUBLISHED'
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_subscriber_active_subscribed
+        ON subscribers (subscribed_at DESC) INCLUDE (email)
+        WHERE is_active = true
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_newsletter_request_pending_rank
+        ON newsletter_requests (priority DESC, votes DESC)
+        WHERE status = 'PENDING'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_newsletter_request_pending_rank")
+    op.execute("DROP INDEX IF EXISTS idx_subscriber_active_subscribed")
+    op.execute("DROP INDEX IF EXISTS idx_blog_published_listing")
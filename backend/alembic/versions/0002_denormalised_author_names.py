@@ -0,0 +1,51 @@
+"""Denormalised author / creator names
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 10:00:00
+
+Adds blogs.author_name and activities.creator_name (copies of users.name)
+so public reads no longer need to load the users table, and backfills them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Blogs
+    op.execute("ALTER TABLE blogs ADD COLUMN IF NOT EXISTS author_name VARCHAR(100)")
+    op.execute(
+        """
+        UPDATE blogs SET author_name = users.name
+        FROM users
+        WHERE blogs.author_id = users.id AND blogs.author_name IS NULL
+        """
+    )
+    op.execute("UPDATE blogs SET author_name = 'Unknown' WHERE author_name IS NULL")
+    op.alter_column("blogs", "author_name", nullable=False)
+
+    # Activities
+    op.execute("ALTER TABLE activities ADD COLUMN IF NOT EXISTS creator_name VARCHAR(100)")
+    op.execute(
+        """
+        UPDATE activities SET creator_name = users.name
+        FROM users
+        WHERE activities.created_by = users.id AND activities.creator_name IS NULL
+        """
+    )
+    op.execute("UPDATE activities SET creator_name = 'Unknown' WHERE creator_name IS NULL")
+    op.alter_column("activities", "creator_name", nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column("activities", "creator_name")
+    op.drop_column("blogs", "author_name")
@@ -0,0 +1,50 @@
+"""AI generation jobs
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 11:00:00
+
+Adds the ai_jobs table used by the background AI generation worker pool.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("ai_jobs"):
+        return
+
+    op.create_table(
+        "ai_jobs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("kind", sa.String(50), nullable=False),
+        sa.Column("params", sa.JSON(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "RUNNING", "SUCCEEDED", "FAILED", name="aijobstatus"),
+            nullable=False,
+        ),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_ai_jobs_status", "ai_jobs", ["status"])
+    op.create_index("ix_ai_jobs_created_by", "ai_jobs", ["created_by"])
+    op.create_index("idx_ai_job_status_created", "ai_jobs", ["status", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("ai_jobs")
+    op.execute("DROP TYPE IF EXISTS aijobstatus")
@@ -0,0 +1,61 @@
+"""Scheduled job runs
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 18:00:00
+
+Adds job_runs (exactly-once run history) and scheduler_leases (leader lease
+for databases without advisory locks) used by services.cluster_scheduler.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("job_runs"):
+        op.create_table(
+            "job_runs",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("job_name", sa.String(100), nullable=False),
+            sa.Column("scheduled_for", sa.DateTime(timezone=True), nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum("RUNNING", "SUCCEEDED", "FAILED", name="jobrunstatus"),
+                nullable=False,
+            ),
+            sa.Column("owner", sa.String(100), nullable=True),
+            sa.Column("is_catch_up", sa.Boolean(), nullable=False, server_default=sa.false()),
+            sa.Column("result", sa.JSON(), nullable=True),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("started_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("duration_seconds", sa.Float(), nullable=True),
+            sa.UniqueConstraint("job_name", "scheduled_for", name="uq_job_run_name_scheduled"),
+        )
+        op.create_index("ix_job_runs_id", "job_runs", ["id"])
+        op.create_index("idx_job_run_name_started", "job_runs", ["job_name", "started_at"])
+
+    if not inspector.has_table("scheduler_leases"):
+        op.create_table(
+            "scheduler_leases",
+            sa.Column("name", sa.String(100), primary_key=True),
+            sa.Column("owner", sa.String(100), nullable=False),
+            sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduler_leases")
+    op.drop_table("job_runs")
+    op.execute("DROP TYPE IF EXISTS jobrunstatus")
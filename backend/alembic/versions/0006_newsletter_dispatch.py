@@ -0,0 +1,40 @@
+"""Scheduled newsletter dispatch
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 19:00:00
+
+- newsletterstatus gains SENDING (claimed by the dispatcher)
+- (status, scheduled_at) index for the due-newsletter lookup in
+  newsletter_service.claim_due_newsletters / get_next_scheduled_at
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # ADD VALUE cannot run inside a transaction block before PostgreSQL 12
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE newsletterstatus ADD VALUE IF NOT EXISTS 'SENDING'")
+
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_newsletter_status_scheduled
+        ON newsletters (status, scheduled_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    # Enum values cannot be dropped; SENDING stays in the type
+    op.execute("DROP INDEX IF EXISTS idx_newsletter_status_scheduled")
@@ -0,0 +1,47 @@
+"""Full-text search vectors
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 20:00:00
+
+Adds blogs.search_vector / projects.search_vector used by the postgres
+search backend (services.search_service), with GIN indexes. Vectors are
+filled by the application (backfilled at startup), since they hold the
+Hangul-bigram tokens of utils.search_index rather than to_tsvector output.
+On other databases the column is plain TEXT and stays empty.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = {"blogs": "idx_blog_search_vector", "projects": "idx_project_search_vector"}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        for table, index in TABLES.items():
+            op.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector")
+            op.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {table} USING gin (search_vector)")
+        return
+
+    inspector = sa.inspect(bind)
+    for table in TABLES:
+        if "search_vector" not in {column["name"] for column in inspector.get_columns(table)}:
+            op.add_column(table, sa.Column("search_vector", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    for table, index in TABLES.items():
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+        op.drop_column(table, "search_vector")
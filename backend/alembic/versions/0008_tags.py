@@ -0,0 +1,99 @@
+"""Normalised blog tags
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 21:00:00
+
+Adds tags (with published post counts for the tag cloud) and the blog_tags
+association, and backfills both from the comma-separated blogs.tags column,
+which stays as the display copy.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _key(name: str) -> str:
+    # Same as services.tag_service.tag_key
+    return " ".join(name.split()).lower()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table("tags"):
+        op.create_table(
+            "tags",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("name", sa.String(100), nullable=False),
+            sa.Column("key", sa.String(100), nullable=False),
+            sa.Column("post_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        )
+        op.create_index("ix_tags_id", "tags", ["id"])
+        op.create_index("ix_tags_key", "tags", ["key"], unique=True)
+        op.create_index("idx_tag_post_count", "tags", ["post_count"])
+
+    if not inspector.has_table("blog_tags"):
+        op.create_table(
+            "blog_tags",
+            sa.Column("blog_id", sa.Integer(), sa.ForeignKey("blogs.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("tag_id", sa.Integer(), sa.ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+        )
+        op.create_index("idx_blog_tags_tag", "blog_tags", ["tag_id", "blog_id"])
+
+    # Backfill from blogs.tags (first spelling of a tag becomes its display name)
+    tags = sa.table(
+        "tags",
+        sa.column("id", sa.Integer), sa.column("name", sa.String), sa.column("key", sa.String),
+        sa.column("post_count", sa.Integer),
+    )
+    links = sa.table("blog_tags", sa.column("blog_id", sa.Integer), sa.column("tag_id", sa.Integer))
+
+    existing = dict(bind.execute(sa.select(tags.c.key, tags.c.id)).all())
+    linked = set(bind.execute(sa.select(links.c.blog_id, links.c.tag_id)).all())
+    rows = bind.execute(sa.text("SELECT id, tags, status FROM blogs WHERE tags IS NOT NULL AND tags != ''")).all()
+
+    names, pairs, counts = {}, [], {}
+    for blog_id, value, status in rows:
+        seen = set()
+        for name in value.split(","):
+            name = " ".join(name.split())[:100]
+            key = _key(name)
+            if not name or key in seen:
+                continue
+            seen.add(key)
+            names.setdefault(key, name)
+            pairs.append((blog_id, key))
+            if status == "PUBLISHED":
+                counts[key] = counts.get(key, 0) + 1
+
+    new_tags = [{"name": name, "key": key} for key, name in names.items() if key not in existing]
+    if new_tags:
+        op.bulk_insert(tags, new_tags)
+        existing = dict(bind.execute(sa.select(tags.c.key, tags.c.id)).all())
+
+    new_links = [
+        {"blog_id": blog_id, "tag_id": existing[key]}
+        for blog_id, key in pairs
+        if (blog_id, existing[key]) not in linked
+    ]
+    if new_links:
+        op.bulk_insert(links, new_links)
+
+    for key, count in counts.items():
+        bind.execute(tags.update().where(tags.c.key == key).values(post_count=count))
+
+
+def downgrade() -> None:
+    op.drop_table("blog_tags")
+    op.drop_table("tags")
@@ -0,0 +1,65 @@
+"""Project technology index
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 22:00:00
+
+Adds project_technologies (one row per projects.tech_stack entry, indexed by
+technology) for tech-stack filtering and facet counts, an index on
+projects.difficulty, and backfills the technology rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if "idx_project_difficulty" not in {index["name"] for index in inspector.get_indexes("projects")}:
+        op.create_index("idx_project_difficulty", "projects", ["difficulty"])
+
+    if inspector.has_table("project_technologies"):
+        return
+
+    op.create_table(
+        "project_technologies",
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("key", sa.String(100), primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False),
+    )
+    op.create_index("idx_project_technologies_key", "project_technologies", ["key", "project_id"])
+
+    # Backfill (same normalisation as services.project_service.technology_key)
+    projects = sa.table("projects", sa.column("id", sa.Integer), sa.column("tech_stack", sa.JSON))
+    rows = []
+    for project_id, tech_stack in bind.execute(sa.select(projects.c.id, projects.c.tech_stack)).all():
+        seen = set()
+        for name in tech_stack or []:
+            key = " ".join(name.split()).lower()[:100]
+            if key and key not in seen:
+                seen.add(key)
+                rows.append({"project_id": project_id, "key": key, "name": " ".join(name.split())[:100]})
+
+    if rows:
+        op.bulk_insert(
+            sa.table(
+                "project_technologies",
+                sa.column("project_id", sa.Integer), sa.column("key", sa.String), sa.column("name", sa.String),
+            ),
+            rows,
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("project_technologies")
+    op.drop_index("idx_project_difficulty", table_name="projects")
@@ -0,0 +1,38 @@
+"""Related posts
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 23:00:00
+
+Adds related_posts (precomputed top-k neighbours per published blog, filled
+by the `blog.related_rebuild` task of services.related_service).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("related_posts"):
+        return
+
+    op.create_table(
+        "related_posts",
+        sa.Column("blog_id", sa.Integer(), sa.ForeignKey("blogs.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("related_id", sa.Integer(), sa.ForeignKey("blogs.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("score", sa.Float(), nullable=False),
+    )
+    op.create_index("idx_related_post_blog_score", "related_posts", ["blog_id", "score"])
+    op.create_index("idx_related_post_related", "related_posts", ["related_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("related_posts")
@@ -0,0 +1,52 @@
+"""Daily view buckets and trending scores
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-20 09:00:00
+
+Adds view_buckets (views per blog post / project per day) and
+trending_scores (decay-weighted rankings recomputed by
+services.trending_service). Rankings start from views counted after
+this migration; lifetime view_count is unchanged.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("view_buckets"):
+        op.create_table(
+            "view_buckets",
+            sa.Column("kind", sa.String(20), primary_key=True),
+            sa.Column("item_id", sa.Integer(), primary_key=True),
+            sa.Column("day", sa.Date(), primary_key=True),
+            sa.Column("views", sa.Integer(), nullable=False, server_default="0"),
+        )
+        op.create_index("idx_view_bucket_kind_day", "view_buckets", ["kind", "day"])
+
+    if not inspector.has_table("trending_scores"):
+        op.create_table(
+            "trending_scores",
+            sa.Column("kind", sa.String(20), primary_key=True),
+            sa.Column("item_id", sa.Integer(), primary_key=True),
+            sa.Column("score", sa.Float(), nullable=False),
+            sa.Column("recent_views", sa.Integer(), nullable=False),
+            sa.Column("computed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        )
+        op.create_index("idx_trending_kind_score", "trending_scores", ["kind", "score"])
+
+
+def downgrade() -> None:
+    op.drop_table("trending_scores")
+    op.drop_table("view_buckets")
@@ -0,0 +1,40 @@
+"""Pre-generated feeds and sitemap
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-20 11:00:00
+
+Adds feed_documents, the gzip-compressed /feed.xml, /atom.xml and
+/sitemap.xml written by services.feed_service. Documents are generated
+on first request (or by the next content change) after this migration.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("feed_documents"):
+        op.create_table(
+            "feed_documents",
+            sa.Column("name", sa.String(50), primary_key=True),
+            sa.Column("content", sa.LargeBinary(), nullable=False),
+            sa.Column("etag", sa.String(64), nullable=False),
+            sa.Column("size", sa.Integer(), nullable=False),
+            sa.Column("last_modified", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("generated_at", sa.DateTime(timezone=True), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("feed_documents")
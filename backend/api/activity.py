@@ -13,8 +13,11 @@ from schemas.activity import (
     ActivityCreate, ActivityUpdate, ActivityResponse,
     ActivityListItem, ActivityListResponse
 )
+from schemas.content import RenderedContent
 from services import activity_service
+from utils.markdown_renderer import render_markdown
 from utils.dependencies import get_current_active_user
+from utils.serialization import ORJSONResponse, serialize_rows
 
 
 router = APIRouter(prefix="/api/activity", tags=["Activity"])
@@ -39,7 +42,9 @@ async def create_activity(
 
     Requires authentication
     """
-    activity = await activity_service.create_activity(db, activity_data, current_user.id)
+    activity = await activity_service.create_activity(
+        db, activity_data, current_user.id, current_user.name
+    )
     return ActivityResponse.model_validate(activity)
 
 
@@ -67,21 +72,20 @@ async def list_activities(
         activity_type=activity_type
     )
 
-    # Convert to list items
-    items = [ActivityListItem.model_validate(activity) for activity in activities]
-
-    return ActivityListResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=ceil(total / page_size) if total > 0 else 0
-    )
+    # Serialize rows directly (same JSON as ActivityListResponse, without per-item validation)
+    return ORJSONResponse({
+        "items": serialize_rows(activities, ActivityListItem),
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": ceil(total / page_size) if total > 0 else 0,
+    })
 
 
 @router.get("/{activity_id}", response_model=ActivityResponse)
 async def get_activity(
     activity_id: int,
+    render: bool = Query(False, description="Also return the description rendered as sanitised HTML"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -90,6 +94,7 @@ async def get_activity(
     - **activity_id**: Activity ID
 
     Public endpoint (no authentication required)
+    With **render**, `rendered` holds the HTML, table of contents and reading time
     """
     activity = await activity_service.get_activity_by_id(db, activity_id)
 
@@ -99,7 +104,10 @@ async def get_activity(
             detail="Activity not found"
         )
 
-    return ActivityResponse.model_validate(activity)
+    response = ActivityResponse.model_validate(activity)
+    if render:
+        response.rendered = RenderedContent(**render_markdown(response.description))
+    return response
 
 
 @router.put("/{activity_id}", response_model=ActivityResponse)
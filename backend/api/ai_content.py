@@ -1,18 +1,24 @@
 """
 AI Content Generation API Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, AsyncIterator, Dict, Optional
+from datetime import datetime
+import orjson
 
-from core.database import get_db
+from core.config import settings
+from core.database import get_db, AsyncSessionLocal
 from models.user import User
-from models.blog import Blog, BlogStatus
-from models.newsletter import Newsletter, NewsletterStatus
-from utils.dependencies import get_current_admin_user
-from utils.slug import generate_unique_slug
+from models.ai_job import AIJobStatus
+from services import ai_job_service, ai_service
+from services.llm_cache import llm_cache
+from services.llm_client import llm_client
+from services.github_client import github_client
 from utils import content_generator
+from utils.dependencies import get_current_admin_user
 from loguru import logger
 
 
@@ -28,24 +34,43 @@ class GenerateBlogRequest(BaseModel):
     style: str = Field("technical", description="Writing style: technical, casual, tutorial")
     length: str = Field("medium", description="Content length: short, medium, long")
     save_as_draft: bool = Field(True, description="Save as draft instead of publishing")
+    use_cache: bool = Field(True, description="Reuse a cached completion for identical input")
 
 
 class GenerateNewsletterRequest(BaseModel):
     """Request schema for newsletter generation"""
     period_days: int = Field(7, ge=1, le=30, description="Period in days (7=weekly, 30=monthly)")
     save_as_draft: bool = Field(True, description="Save as draft instead of sending")
+    use_cache: bool = Field(True, description="Reuse a cached completion for identical input")
 
 
 class ContentPreviewRequest(BaseModel):
     """Request schema for content preview"""
     topic: str = Field(..., min_length=1, description="Topic for preview")
     style: str = Field("technical", description="Writing style")
+    use_cache: bool = Field(True, description="Reuse a cached completion for identical input")
 
 
 class GenerateProjectInfoRequest(BaseModel):
     """Request schema for project info generation"""
     github_url: Optional[str] = Field(None, description="GitHub repository URL")
     demo_url: Optional[str] = Field(None, description="Demo/live site URL")
+    use_cache: bool = Field(True, description="Reuse a cached completion for identical input")
+
+
+class ProjectInfoBatchItem(BaseModel):
+    """One repository/site in a batch project info request"""
+    github_url: Optional[str] = Field(None, description="GitHub repository URL")
+    demo_url: Optional[str] = Field(None, description="Demo/live site URL")
+
+
+class GenerateProjectInfoBatchRequest(BaseModel):
+    """Request schema for batch project info generation"""
+    items: list[ProjectInfoBatchItem] = Field(..., min_length=1, description="GitHub/Demo URLs to process")
+    save: bool = Field(False, description="Create projects from the results (single transaction)")
+    status: str = Field("active", description="Status for created projects")
+    skip_existing: bool = Field(True, description="Skip GitHub URLs that already have a project")
+    use_cache: bool = Field(True, description="Reuse a cached completion for identical input")
 
 
 # ============ Response Schemas ============
@@ -77,12 +102,44 @@ class GeneratedProjectInfoResponse(BaseModel):
     tech_stack: list[str]
 
 
+class ProjectInfoBatchItemResult(BaseModel):
+    """Per-item result of a batch project info request"""
+    index: int
+    github_url: Optional[str] = None
+    demo_url: Optional[str] = None
+    status: str = Field(..., description="generated, created, exists, duplicate or failed")
+    project_id: Optional[int] = None
+    slug: Optional[str] = None
+    project: Optional[GeneratedProjectInfoResponse] = None
+    error: Optional[str] = None
+
+
+class GeneratedProjectInfoBatchResponse(BaseModel):
+    """Response schema for batch project info generation"""
+    total: int
+    counts: dict[str, int]
+    items: list[ProjectInfoBatchItemResult]
+
+
+class AIJobResponse(BaseModel):
+    """Response schema for a background AI job"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    kind: str
+    status: AIJobStatus
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
 # ============ Endpoints ============
 
 @router.post("/generate-blog", response_model=GeneratedBlogResponse)
 async def generate_blog(
     request: GenerateBlogRequest,
-    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
 ):
     """
@@ -91,68 +148,11 @@ async def generate_blog(
     - If project_id is provided, generate blog about that project
     - Otherwise, use custom topic
     - Optionally save as draft in database
+    - Blocks until generation finishes; prefer POST /api/ai/jobs/generate-blog
     """
     try:
-        # Generate content
-        if request.project_id:
-            # Generate from project
-            blog_content = await content_generator.generate_blog_from_project(
-                db=db,
-                project_id=request.project_id,
-                style=request.style,
-                length=request.length,
-            )
-        elif request.topic:
-            # Generate from topic
-            from services.ai_service import generate_blog_content
-
-            blog_content = await generate_blog_content(
-                topic=request.topic,
-                style=request.style,
-                length=request.length,
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="project_id 또는 topic 중 하나를 제공해야 합니다.",
-            )
-
-        blog_id = None
-        blog_status = "preview"
-
-        # Save as draft if requested
-        if request.save_as_draft:
-            # Generate unique slug
-            slug = await generate_unique_slug(db, Blog, blog_content["title"])
-
-            # Create blog
-            blog = Blog(
-                title=blog_content["title"],
-                slug=slug,
-                content=blog_content["content"],
-                excerpt=blog_content["excerpt"],
-                tags=blog_content["tags"],
-                status=BlogStatus.DRAFT,
-                author_id=current_user.id,
-            )
-
-            db.add(blog)
-            await db.commit()
-            await db.refresh(blog)
-
-            blog_id = blog.id
-            blog_status = blog.status.value
-
-            logger.info(f"Generated blog saved as draft: {blog.title} (ID: {blog.id})")
-
-        return GeneratedBlogResponse(
-            blog_id=blog_id,
-            title=blog_content["title"],
-            excerpt=blog_content["excerpt"],
-            content=blog_content["content"],
-            tags=blog_content["tags"],
-            status=blog_status,
-        )
+        result = await ai_job_service.run_generate_blog(request.model_dump(), current_user.id)
+        return GeneratedBlogResponse(**result)
 
     except ValueError as e:
         raise HTTPException(
@@ -170,7 +170,6 @@ async def generate_blog(
 @router.post("/generate-newsletter", response_model=GeneratedNewsletterResponse)
 async def generate_newsletter(
     request: GenerateNewsletterRequest,
-    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
 ):
     """
@@ -179,42 +178,11 @@ async def generate_newsletter(
     - Automatically collects recent blog posts and project updates
     - Generates newsletter content based on period
     - Optionally save as draft in database
+    - Blocks until generation finishes; prefer POST /api/ai/jobs/generate-newsletter
     """
     try:
-        # Generate newsletter
-        newsletter_content = await content_generator.generate_newsletter_from_recent_content(
-            db=db,
-            period_days=request.period_days,
-        )
-
-        newsletter_id = None
-        newsletter_status = "preview"
-
-        # Save as draft if requested
-        if request.save_as_draft:
-            newsletter = Newsletter(
-                title=newsletter_content["title"],
-                content=newsletter_content["content"],
-                status=NewsletterStatus.DRAFT,
-                created_by=current_user.id,
-                is_auto_generated=True,
-            )
-
-            db.add(newsletter)
-            await db.commit()
-            await db.refresh(newsletter)
-
-            newsletter_id = newsletter.id
-            newsletter_status = newsletter.status.value
-
-            logger.info(f"Generated newsletter saved as draft: {newsletter.title} (ID: {newsletter.id})")
-
-        return GeneratedNewsletterResponse(
-            newsletter_id=newsletter_id,
-            title=newsletter_content["title"],
-            content=newsletter_content["content"],
-            status=newsletter_status,
-        )
+        result = await ai_job_service.run_generate_newsletter(request.model_dump(), current_user.id)
+        return GeneratedNewsletterResponse(**result)
 
     except Exception as e:
         logger.error(f"Failed to generate newsletter: {str(e)}")
@@ -233,20 +201,7 @@ async def preview_content(
     Generate a preview of AI-generated content without saving (Admin only)
     """
     try:
-        from services.ai_service import generate_blog_content
-
-        blog_content = await generate_blog_content(
-            topic=request.topic,
-            style=request.style,
-            length="short",  # Always use short for preview
-        )
-
-        return {
-            "title": blog_content["title"],
-            "excerpt": blog_content["excerpt"],
-            "content_preview": blog_content["content"][:500] + "...",
-            "tags": blog_content["tags"],
-        }
+        return await ai_job_service.run_preview(request.model_dump(), current_user.id)
 
     except Exception as e:
         logger.error(f"Failed to generate preview: {str(e)}")
@@ -269,40 +224,327 @@ async def generate_project_info(
     - Returns structured data to populate project creation form
     """
     try:
-        from services.ai_service import generate_project_info as ai_generate_project_info
+        result = await ai_job_service.run_generate_project_info(request.model_dump(), current_user.id)
+        return GeneratedProjectInfoResponse(**result)
 
-        if not request.github_url and not request.demo_url:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="GitHub URL 또는 Demo URL 중 하나를 제공해야 합니다.",
-            )
-
-        # Generate project info using AI
-        project_info = await ai_generate_project_info(
-            github_url=request.github_url,
-            demo_url=request.demo_url,
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Failed to generate project info: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="프로젝트 정보 생성에 실패했습니다.",
         )
 
-        logger.info(f"Successfully generated project info: {project_info['name']}")
 
-        return GeneratedProjectInfoResponse(
-            name=project_info["name"],
-            description=project_info["description"],
-            content=project_info["content"],
-            category=project_info["category"],
-            tech_stack=project_info["tech_stack"],
-        )
+@router.post("/generate-project-info/batch", response_model=GeneratedProjectInfoBatchResponse)
+async def generate_project_info_batch(
+    request: GenerateProjectInfoBatchRequest,
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Generate project information for many GitHub/Demo URLs at once (Admin only)
+
+    - Repositories are fetched and analysed concurrently (LLM calls stay bounded)
+    - Failures are reported per item instead of failing the whole request
+    - With save=true, all generated projects are created in one transaction
+
+    For large batches prefer POST /api/ai/jobs/generate-project-info-batch.
+    """
+    try:
+        result = await ai_job_service.run_generate_project_info_batch(request.model_dump(), current_user.id)
+        return GeneratedProjectInfoBatchResponse(**result)
 
-    except HTTPException:
-        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except Exception as e:
-        logger.error(f"Failed to generate project info: {str(e)}")
+        logger.error(f"Failed to generate project info batch: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="프로젝트 정보 생성에 실패했습니다.",
+            detail="프로젝트 정보 일괄 생성에 실패했습니다.",
+        )
+
+
+# ============ Streaming (SSE) Endpoints ============
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+}
+
+
+def _sse(event: str, data: Any) -> bytes:
+    """Format one server-sent event"""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _stream_blog_events(
+    params: Dict[str, Any],
+    project_data: Optional[Dict[str, Any]],
+    user_id: int,
+    preview: bool,
+) -> AsyncIterator[bytes]:
+    """
+    Relay ai_service.stream_blog_content events as SSE
+
+    Emits "start" immediately, then title/excerpt/tags/content events as the
+    model produces them, and finally "done" (plus "saved" when a draft is
+    stored). Failures after the response has started are sent as "error".
+    """
+    yield _sse("start", {"preview": preview})
+
+    try:
+        async for event in ai_service.stream_blog_content(
+            topic=f"{project_data['name']} 프로젝트 소개" if project_data else params["topic"],
+            style=params.get("style", "technical"),
+            length="short" if preview else params.get("length", "medium"),
+            project_data=project_data,
+            use_cache=params.get("use_cache", True),
+        ):
+            if event["event"] != "done":
+                yield _sse(event["event"], event["data"])
+                continue
+
+            blog_content = event["data"]
+            if preview:
+                yield _sse("done", {
+                    "title": blog_content["title"],
+                    "excerpt": blog_content["excerpt"],
+                    "content_preview": blog_content["content"][:500] + "...",
+                    "tags": blog_content["tags"],
+                })
+            else:
+                yield _sse("done", blog_content)
+                if params.get("save_as_draft", True):
+                    blog = await ai_job_service.save_blog_draft(blog_content, user_id)
+                    yield _sse("saved", {"blog_id": blog.id, "status": blog.status.value})
+
+    except Exception as e:
+        logger.error(f"Failed to stream blog content: {str(e)}")
+        yield _sse("error", {"detail": "블로그 생성에 실패했습니다."})
+
+
+@router.post("/preview/stream")
+async def preview_content_stream(
+    request: ContentPreviewRequest,
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Stream a content preview as server-sent events (Admin only)
+
+    Events: start, title, excerpt, tags, content (token deltas), done, error
+    """
+    return StreamingResponse(
+        _stream_blog_events(request.model_dump(), None, current_user.id, preview=True),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.post("/generate-blog/stream")
+async def generate_blog_stream(
+    request: GenerateBlogRequest,
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Stream blog generation as server-sent events (Admin only)
+
+    Events: start, title, excerpt, tags, content (token deltas), done,
+    saved (draft blog_id, when save_as_draft), error
+    """
+    project_data = None
+    if request.project_id:
+        try:
+            async with AsyncSessionLocal() as db:
+                project_data = await content_generator.get_project_data(db, request.project_id)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e),
+            )
+        project_data = await content_generator.enrich_project_data(project_data)
+    elif not request.topic:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="project_id 또는 topic 중 하나를 제공해야 합니다.",
+        )
+
+    return StreamingResponse(
+        _stream_blog_events(request.model_dump(), project_data, current_user.id, preview=False),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+# ============ LLM Cache Endpoints ============
+
+@router.get("/cache/stats", response_model=dict)
+async def get_llm_cache_stats(
+    current_user: User = Depends(get_current_admin_user),
+):
+    """LLM completion cache size, hit/miss and single-flight counters (Admin only)"""
+    return {
+        **llm_cache.stats(),
+        "singleflight": {
+            "completions": ai_service.completion_flights.stats(),
+            "github": ai_service.github_flights.stats(),
+        },
+    }
+
+
+@router.delete("/cache", response_model=dict)
+async def clear_llm_cache(
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Remove all cached LLM completions (Admin only)"""
+    removed = llm_cache.clear()
+    logger.info(f"LLM cache cleared ({removed} entries)")
+    return {"removed": removed}
+
+
+# ============ LLM Client Endpoints ============
+
+@router.get("/llm/stats", response_model=dict)
+async def get_llm_client_stats(
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Shared LLM client queue depth, latency, retry and circuit breaker stats (Admin only)"""
+    if not llm_client:
+        return {"configured": False}
+    return {"configured": True, **llm_client.stats()}
+
+
+@router.get("/github/stats", response_model=dict)
+async def get_github_client_stats(
+    current_user: User = Depends(get_current_admin_user),
+):
+    """GitHub API client request, ETag cache and rate limit stats (Admin only)"""
+    return github_client.stats()
+
+
+# ============ Background Job Endpoints ============
+
+async def _submit(db: AsyncSession, kind: str, params: dict, user: User) -> AIJobResponse:
+    """Persist and queue a job, mapping errors to HTTP responses"""
+    try:
+        job = await ai_job_service.submit_job(db, kind, params, user.id)
+        return AIJobResponse.model_validate(job)
+    except Exception as e:
+        logger.error(f"Failed to submit AI job ({kind}): {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="AI 작업 등록에 실패했습니다.",
         )
+
+
+@router.post("/jobs/generate-blog", response_model=AIJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_generate_blog_job(
+    request: GenerateBlogRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Queue blog generation and return the job immediately (Admin only)
+
+    Poll GET /api/ai/jobs/{job_id} for the result.
+    """
+    if not request.project_id and not request.topic:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="project_id 또는 topic 중 하나를 제공해야 합니다.",
+        )
+    return await _submit(db, "generate-blog", request.model_dump(), current_user)
+
+
+@router.post("/jobs/generate-newsletter", response_model=AIJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_generate_newsletter_job(
+    request: GenerateNewsletterRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Queue newsletter generation and return the job immediately (Admin only)"""
+    return await _submit(db, "generate-newsletter", request.model_dump(), current_user)
+
+
+@router.post("/jobs/preview", response_model=AIJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_preview_job(
+    request: ContentPreviewRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Queue a content preview and return the job immediately (Admin only)"""
+    return await _submit(db, "preview", request.model_dump(), current_user)
+
+
+@router.post("/jobs/generate-project-info", response_model=AIJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_generate_project_info_job(
+    request: GenerateProjectInfoRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Queue project info generation and return the job immediately (Admin only)"""
+    if not request.github_url and not request.demo_url:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="GitHub URL 또는 Demo URL 중 하나를 제공해야 합니다.",
+        )
+    return await _submit(db, "generate-project-info", request.model_dump(), current_user)
+
+
+@router.post("/jobs/generate-project-info-batch", response_model=AIJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_generate_project_info_batch_job(
+    request: GenerateProjectInfoBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Queue batch project info generation and return the job immediately (Admin only)
+
+    The job result has the same shape as POST /api/ai/generate-project-info/batch.
+    """
+    if len(request.items) > settings.PROJECT_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.PROJECT_BATCH_MAX_ITEMS}개까지 처리할 수 있습니다.",
+        )
+    return await _submit(db, "generate-project-info-batch", request.model_dump(), current_user)
+
+
+@router.get("/jobs", response_model=list[AIJobResponse])
+async def list_ai_jobs(
+    status_filter: Optional[AIJobStatus] = Query(None, alias="status", description="Filter by status"),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """List recent AI jobs (Admin only)"""
+    return await ai_job_service.list_jobs(db, status=status_filter, limit=limit)
+
+
+@router.get("/jobs/{job_id}", response_model=AIJobResponse)
+async def get_ai_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=60, description="Long-poll up to N seconds for completion"),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Get AI job status and result (Admin only)
+
+    With ?wait=N the request is held (without a DB connection) until the
+    job finishes or N seconds pass.
+    """
+    job = await ai_job_service.wait_for_job(job_id, timeout=wait)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다.",
+        )
+
+    return job
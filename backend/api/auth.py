@@ -15,6 +15,7 @@ from schemas.user import (
 )
 from utils.auth import hash_password, verify_password, create_access_token
 from utils.dependencies import get_current_user, get_current_active_user
+from services import blog_service, activity_service
 
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
@@ -157,9 +158,13 @@ async def update_current_user_profile(
     Requires authentication
     """
     # Update user fields
-    if user_update.name is not None:
+    if user_update.name is not None and user_update.name != current_user.name:
         current_user.name = user_update.name
 
+        # Keep denormalised author/creator names in sync
+        await blog_service.sync_author_name(db, current_user.id, user_update.name)
+        await activity_service.sync_creator_name(db, current_user.id, user_update.name)
+
     if user_update.email is not None:
         # Check if email already exists
         result = await db.execute(
@@ -9,12 +9,16 @@ from math import ceil
 from core.database import get_db
 from models.user import User
 from models.blog import BlogStatus
+from schemas.content import RenderedContent
 from schemas.blog import (
     BlogCreate, BlogUpdate, BlogResponse, BlogListItem,
-    BlogListResponse, BlogPublishRequest
+    BlogListResponse, BlogPublishRequest, TagCloudResponse, RelatedPostsResponse,
+    TrendingBlogsResponse
 )
-from services import blog_service
-from utils.dependencies import get_current_active_user, get_optional_user
+from services import blog_service, related_service, tag_service, trending_service
+from utils.markdown_renderer import render_markdown
+from utils.dependencies import get_current_active_user, get_current_admin_user, get_optional_user
+from utils.serialization import ORJSONResponse, serialize_rows
 
 
 router = APIRouter(prefix="/api/blog", tags=["Blog"])
@@ -37,7 +41,7 @@ async def create_blog(
 
     Requires authentication
     """
-    blog = await blog_service.create_blog(db, blog_data, current_user.id)
+    blog = await blog_service.create_blog(db, blog_data, current_user.id, current_user.name)
     return BlogResponse.model_validate(blog)
 
 
@@ -47,6 +51,7 @@ async def list_blogs(
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     status: Optional[BlogStatus] = Query(None, description="Filter by status"),
     author_id: Optional[int] = Query(None, description="Filter by author ID"),
+    tag: Optional[str] = Query(None, min_length=1, max_length=100, description="Filter by tag"),
     current_user: Optional[User] = Depends(get_optional_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -57,6 +62,7 @@ async def list_blogs(
     - **page_size**: Items per page (default: 10, max: 100)
     - **status**: Filter by status (optional)
     - **author_id**: Filter by author ID (optional)
+    - **tag**: Filter by tag, case-insensitive (optional)
 
     Public endpoint (no authentication required)
     Only shows PUBLISHED posts unless user is authenticated
@@ -71,24 +77,57 @@ async def list_blogs(
         skip=skip,
         limit=page_size,
         status=status,
-        author_id=author_id
+        author_id=author_id,
+        tag=tag
     )
 
-    # Convert to list items
-    items = [BlogListItem.model_validate(blog) for blog in blogs]
+    # Serialize rows directly (same JSON as BlogListResponse, without per-item validation)
+    return ORJSONResponse({
+        "items": serialize_rows(blogs, BlogListItem),
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": ceil(total / page_size) if total > 0 else 0,
+    })
 
-    return BlogListResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=ceil(total / page_size) if total > 0 else 0
-    )
+
+@router.get("/tags", response_model=TagCloudResponse)
+async def get_tag_cloud(
+    limit: int = Query(100, ge=1, le=500, description="Maximum tags"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Tag cloud: tags of published posts with post counts, most used first
+
+    - **limit**: Maximum tags (default: 100, max: 500)
+
+    Public endpoint (no authentication required)
+    """
+    return ORJSONResponse({"items": await tag_service.get_tag_cloud(db, limit)})
+
+
+@router.get("/trending", response_model=TrendingBlogsResponse)
+async def get_trending_blogs(
+    limit: int = Query(10, ge=1, le=50, description="Maximum posts"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Trending published posts, ranked by recent views with older days
+    weighing less
+
+    - **limit**: Maximum posts (default: 10, max: 50)
+
+    Rankings are recomputed periodically and cached.
+
+    Public endpoint (no authentication required)
+    """
+    return ORJSONResponse({"items": await trending_service.get_trending_blogs(db, limit)})
 
 
 @router.get("/{blog_id}", response_model=BlogResponse)
 async def get_blog(
     blog_id: int,
+    render: bool = Query(False, description="Also return the content rendered as sanitised HTML"),
     current_user: Optional[User] = Depends(get_optional_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -99,6 +138,7 @@ async def get_blog(
 
     Public endpoint (no authentication required)
     Only shows PUBLISHED posts unless user is authenticated
+    With **render**, `rendered` holds the HTML, table of contents and reading time
     """
     blog = await blog_service.get_blog_by_id(db, blog_id)
 
@@ -119,12 +159,16 @@ async def get_blog(
     # Increment view count
     await blog_service.increment_view_count(db, blog)
 
-    return BlogResponse.model_validate(blog)
+    response = BlogResponse.model_validate(blog)
+    if render:
+        response.rendered = RenderedContent(**render_markdown(response.content))
+    return response
 
 
 @router.get("/slug/{slug}", response_model=BlogResponse)
 async def get_blog_by_slug(
     slug: str,
+    render: bool = Query(False, description="Also return the content rendered as sanitised HTML"),
     current_user: Optional[User] = Depends(get_optional_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -135,6 +179,7 @@ async def get_blog_by_slug(
 
     Public endpoint (no authentication required)
     Only shows PUBLISHED posts unless user is authenticated
+    With **render**, `rendered` holds the HTML, table of contents and reading time
     """
     blog = await blog_service.get_blog_by_slug(db, slug)
 
@@ -155,7 +200,10 @@ async def get_blog_by_slug(
     # Increment view count
     await blog_service.increment_view_count(db, blog)
 
-    return BlogResponse.model_validate(blog)
+    response = BlogResponse.model_validate(blog)
+    if render:
+        response.rendered = RenderedContent(**render_markdown(response.content))
+    return response
 
 
 @router.put("/{blog_id}", response_model=BlogResponse)
@@ -267,3 +315,58 @@ async def publish_blog(
         updated_blog = await blog_service.unpublish_blog(db, blog)
 
     return BlogResponse.model_validate(updated_blog)
+
+
+@router.get("/{blog_id}/related", response_model=RelatedPostsResponse)
+async def get_related_posts(
+    blog_id: int,
+    limit: int = Query(5, ge=1, le=20, description="Maximum posts"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get published posts related to a blog post
+
+    - **blog_id**: Blog post ID
+    - **limit**: Maximum posts (default: 5)
+
+    Precomputed in the background from title, content and tag similarity;
+    a newly published post gets its list shortly after publishing.
+
+    Public endpoint (no authentication required)
+    """
+    related = await related_service.get_related_posts(db, blog_id, limit)
+
+    if not related and not await blog_service.get_blog_by_id(db, blog_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Blog post not found"
+        )
+
+    return ORJSONResponse({
+        "items": [
+            {
+                "id": blog.id,
+                "title": blog.title,
+                "slug": blog.slug,
+                "excerpt": blog.excerpt,
+                "author": blog.author_name,
+                "tags": blog.tags_list,
+                "published_at": blog.published_at,
+                "score": round(score, 4),
+            }
+            for blog, score in related
+        ]
+    })
+
+
+@router.post("/related/rebuild", status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_related_posts(
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Queue a full related-posts rebuild (also runs nightly)
+
+    Requires admin authentication
+    """
+    await related_service.enqueue_rebuild()
+    return {"queued": True}
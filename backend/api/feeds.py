@@ -0,0 +1,96 @@
+"""
+Feed & Sitemap Routes
+
+Serves the pre-generated documents from services.feed_service: gzip
+bytes as stored when the client accepts gzip, with ETag / Last-Modified
+validators so crawlers re-fetch only after content changed.
+"""
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.database import get_db
+from services import feed_service
+
+
+router = APIRouter(tags=["Feeds"])
+
+MEDIA_TYPES = {
+    "feed.xml": "application/rss+xml; charset=utf-8",
+    "atom.xml": "application/atom+xml; charset=utf-8",
+    "sitemap.xml": "application/xml; charset=utf-8",
+}
+
+
+def _not_modified(request: Request, document: Dict[str, Any]) -> bool:
+    """Conditional GET: If-None-Match wins over If-Modified-Since"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {
+            tag.strip().removeprefix("W/").strip('"').removesuffix("-gzip")
+            for tag in if_none_match.split(",")
+        }
+        return "*" in tags or document["etag"] in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is not None:
+            return document["last_modified"].replace(microsecond=0) <= since
+    return False
+
+
+async def _serve(request: Request, db: AsyncSession, name: str) -> Response:
+    document = await feed_service.get_document(db, name)
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+
+    headers = {
+        # The gzip and identity bodies differ, so their ETags must too
+        "ETag": f'"{document["etag"]}-gzip"' if use_gzip else f'"{document["etag"]}"',
+        "Last-Modified": format_datetime(document["last_modified"], usegmt=True),
+        "Cache-Control": f"public, max-age={settings.FEED_MAX_AGE_SECONDS}",
+        "Vary": "Accept-Encoding",
+    }
+    if _not_modified(request, document):
+        return Response(status_code=304, headers=headers)
+
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(document["gzip"], media_type=MEDIA_TYPES[name], headers=headers)
+    return Response(document["xml"], media_type=MEDIA_TYPES[name], headers=headers)
+
+
+@router.api_route("/feed.xml", methods=["GET", "HEAD"])
+async def rss_feed(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    RSS 2.0 feed of the newest blog posts, projects and activities
+
+    Public endpoint (no authentication required)
+    """
+    return await _serve(request, db, "feed.xml")
+
+
+@router.api_route("/atom.xml", methods=["GET", "HEAD"])
+async def atom_feed(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Atom 1.0 feed of the newest blog posts, projects and activities
+
+    Public endpoint (no authentication required)
+    """
+    return await _serve(request, db, "atom.xml")
+
+
+@router.api_route("/sitemap.xml", methods=["GET", "HEAD"])
+async def sitemap(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Sitemap of list pages, published blog posts and projects
+
+    Public endpoint (no authentication required)
+    """
+    return await _serve(request, db, "sitemap.xml")
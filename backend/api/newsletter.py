@@ -1,10 +1,14 @@
 """
 Newsletter API Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
+from sqlalchemy.orm import load_only
 from typing import List, Optional
+from datetime import datetime
+import io
 
 from core.database import get_db
 from models.user import User
@@ -13,14 +17,18 @@ from schemas.newsletter import (
     SubscriberCreate,
     SubscriberResponse,
     SubscriptionStatus,
+    SubscriberImportResult,
     NewsletterCreate,
     NewsletterResponse,
     NewsletterListItem,
+    NewsletterScheduleRequest,
     NewsletterRequestCreate,
     NewsletterRequestResponse,
 )
 from utils.dependencies import get_current_admin_user, get_optional_user
-from services import newsletter_service
+from services import newsletter_service, task_queue
+from services.task_worker import task_worker
+from services.newsletter_dispatcher import newsletter_dispatcher
 from loguru import logger
 
 
@@ -159,6 +167,53 @@ async def get_subscribers(
     }
 
 
+@router.post("/subscribers/import", response_model=SubscriberImportResult)
+async def import_subscribers(
+    file: UploadFile = File(..., description="CSV file with an `email` column (or emails in the first column)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Bulk import subscribers from a CSV upload (Admin only)
+
+    Invalid and duplicate addresses are skipped; existing subscribers are left unchanged.
+    """
+    # file.file blocks (it spills to disk); import_subscribers reads it on a worker thread
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", errors="replace", newline="")
+    try:
+        stats = await newsletter_service.import_subscribers(
+            db, newsletter_service.iter_csv_emails(stream)
+        )
+        return SubscriberImportResult(**stats)
+    except Exception as e:
+        logger.error(f"Failed to import subscribers: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="구독자 가져오기에 실패했습니다.",
+        )
+    finally:
+        stream.detach()
+
+
+@router.get("/subscribers/export")
+async def export_subscribers(
+    format: str = Query("csv", pattern="^(csv|jsonl)$", description="Export format: csv or jsonl"),
+    status: Optional[str] = Query(None, description="Filter by status: active or unsubscribed"),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Export subscribers as a streamed CSV or JSON Lines file (Admin only)
+    """
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    filename = f"subscribers-{datetime.now().strftime('%Y%m%d')}.{format}"
+
+    return StreamingResponse(
+        newsletter_service.stream_subscribers(status=status, fmt=format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("", response_model=dict)
 async def get_newsletter_list(
     page: int = 1,
@@ -169,8 +224,18 @@ async def get_newsletter_list(
     """
     Get newsletter list with pagination
     """
-    # Build query
-    stmt = select(Newsletter)
+    # Build query (list items only need summary columns, not the HTML content)
+    stmt = select(Newsletter).options(
+        load_only(
+            Newsletter.id,
+            Newsletter.title,
+            Newsletter.status,
+            Newsletter.sent_at,
+            Newsletter.recipient_count,
+            Newsletter.created_at,
+            raiseload=True,
+        )
+    )
 
     # Filter by status
     if status:
@@ -242,6 +307,7 @@ async def get_newsletter(
         "title": newsletter.title,
         "content": newsletter.content,
         "status": newsletter.status.value,
+        "scheduled_at": newsletter.scheduled_at,
         "sent_at": newsletter.sent_at,
         "sent_count": newsletter.recipient_count,
         "created_at": newsletter.created_at,
@@ -284,17 +350,103 @@ async def create_newsletter(
         )
 
 
+@router.post("/{newsletter_id}/schedule", response_model=dict)
+async def schedule_newsletter(
+    newsletter_id: int,
+    schedule_data: NewsletterScheduleRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Schedule a newsletter send (Admin only)
+
+    At scheduled_at the dispatcher hands the newsletter to the background
+    task queue. A past time sends as soon as possible. Rescheduling a
+    SCHEDULED newsletter replaces its time.
+    """
+    newsletter = await newsletter_service.get_newsletter_by_id(db, newsletter_id)
+    if not newsletter:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="뉴스레터를 찾을 수 없습니다.",
+        )
+
+    try:
+        newsletter = await newsletter_service.schedule_newsletter(db, newsletter, schedule_data.scheduled_at)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="발송 중이거나 이미 발송된 뉴스레터는 예약할 수 없습니다.",
+        )
+
+    newsletter_dispatcher.notify()
+    return {
+        "message": "뉴스레터 발송이 예약되었습니다.",
+        "id": newsletter.id,
+        "status": newsletter.status.value,
+        "scheduled_at": newsletter.scheduled_at,
+    }
+
+
+@router.delete("/{newsletter_id}/schedule", response_model=dict)
+async def unschedule_newsletter(
+    newsletter_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Cancel a scheduled send; the newsletter goes back to DRAFT (Admin only)"""
+    if not await newsletter_service.unschedule_newsletter(db, newsletter_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="예약된 뉴스레터가 아니거나 이미 발송이 시작되었습니다.",
+        )
+
+    newsletter_dispatcher.notify()
+    return {"message": "뉴스레터 발송 예약이 취소되었습니다."}
+
+
 @router.post("/{newsletter_id}/send", status_code=status.HTTP_200_OK)
 async def send_newsletter(
     newsletter_id: int,
+    background: bool = Query(False, description="Send from the background task queue"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
 ):
     """
     Send newsletter to all subscribers (Admin only)
+
+    With ?background=true the send is queued as a `newsletter.send` task and
+    the response returns immediately with the task ID.
+
+    Returns 409 if the newsletter is already being sent or was sent.
     """
+    newsletter = await newsletter_service.get_newsletter_by_id(db, newsletter_id)
+    if not newsletter:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Newsletter not found",
+        )
+
+    # Claim DRAFT/SCHEDULED/FAILED -> SENDING (committed with the task in background mode)
+    if not await newsletter_service.claim_newsletter_send(db, newsletter_id, commit=not background):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="발송 중이거나 이미 발송된 뉴스레터입니다.",
+        )
+
+    if background:
+        # Sending is not idempotent: never retried automatically
+        task = await task_queue.enqueue_task(
+            db, "newsletter.send", {"newsletter_id": newsletter_id}, priority=10, max_attempts=1,
+        )
+        task_worker.notify()
+        return {
+            "message": "뉴스레터 발송이 예약되었습니다.",
+            "task_id": task.id,
+        }
+
     try:
-        sent_count = await newsletter_service.send_newsletter_to_all(db, newsletter_id)
+        sent_count = await newsletter_service.send_newsletter_to_all(db, newsletter_id, claimed=True)
         return {
             "message": f"{sent_count}명의 구독자에게 뉴스레터를 발송했습니다.",
             "sent_count": sent_count,
@@ -310,5 +462,9 @@ async def send_newsletter(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="뉴스레터 발송에 실패했습니다.",
         )
+    finally:
+        # Not SENT after the claim: mark FAILED so it can be sent again
+        await db.rollback()
+        await newsletter_service.fail_unfinished_send(db, newsletter_id)
 
 
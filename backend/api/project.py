@@ -3,7 +3,7 @@ Project API Routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import List, Optional
 from math import ceil
 
 from core.database import get_db
@@ -11,10 +11,13 @@ from models.user import User, UserRole
 from models.project import ProjectStatus
 from schemas.project import (
     ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListItem,
-    ProjectListResponse
+    ProjectListResponse, ProjectFacetsResponse, PopularProjectsResponse
 )
-from services import project_service
+from schemas.content import RenderedContent
+from services import project_service, trending_service
+from utils.markdown_renderer import render_markdown
 from utils.dependencies import get_current_active_user
+from utils.serialization import ORJSONResponse, serialize_rows
 
 
 router = APIRouter(prefix="/api/projects", tags=["Projects"])
@@ -65,6 +68,8 @@ async def list_projects(
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     status: Optional[ProjectStatus] = Query(None, description="Filter by status"),
     category: Optional[str] = Query(None, description="Filter by category"),
+    difficulty: Optional[str] = Query(None, description="Filter by difficulty"),
+    tech: Optional[List[str]] = Query(None, description="Filter by technology (repeatable, all must match)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -74,6 +79,8 @@ async def list_projects(
     - **page_size**: Items per page (default: 10, max: 100)
     - **status**: Filter by status (optional)
     - **category**: Filter by category (optional)
+    - **difficulty**: Filter by difficulty (optional)
+    - **tech**: Filter by technology, case-insensitive; repeat for several (optional)
 
     Public endpoint (no authentication required)
     """
@@ -83,24 +90,69 @@ async def list_projects(
         skip=skip,
         limit=page_size,
         status=status,
-        category=category
+        category=category,
+        difficulty=difficulty,
+        tech=tech
     )
 
-    # Convert to list items
-    items = [ProjectListItem.model_validate(project) for project in projects]
+    # Serialize rows directly (same JSON as ProjectListResponse, without per-item validation)
+    return ORJSONResponse({
+        "items": serialize_rows(projects, ProjectListItem),
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": ceil(total / page_size) if total > 0 else 0,
+    })
 
-    return ProjectListResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=ceil(total / page_size) if total > 0 else 0
+
+@router.get("/facets", response_model=ProjectFacetsResponse)
+async def get_project_facets(
+    status: Optional[ProjectStatus] = Query(None, description="Filter by status"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    difficulty: Optional[str] = Query(None, description="Filter by difficulty"),
+    tech: Optional[List[str]] = Query(None, description="Filter by technology (repeatable, all must match)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Project counts per tech stack, category, difficulty and status value
+    for the given filters (e.g. "Python (12), FastAPI (8)")
+
+    Takes the same filters as the project list. Cached; refreshed on
+    project changes.
+
+    Public endpoint (no authentication required)
+    """
+    facets = await project_service.get_project_facets(
+        db,
+        status=status,
+        category=category,
+        difficulty=difficulty,
+        tech=tech
     )
+    return ORJSONResponse(facets)
+
+
+@router.get("/popular", response_model=PopularProjectsResponse)
+async def get_popular_projects(
+    limit: int = Query(10, ge=1, le=50, description="Maximum projects"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Popular projects, ranked by recent views with older days weighing less
+
+    - **limit**: Maximum projects (default: 10, max: 50)
+
+    Rankings are recomputed periodically and cached.
+
+    Public endpoint (no authentication required)
+    """
+    return ORJSONResponse({"items": await trending_service.get_popular_projects(db, limit)})
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: int,
+    render: bool = Query(False, description="Also return the content rendered as sanitised HTML"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -110,6 +162,7 @@ async def get_project(
 
     Public endpoint (no authentication required)
     Increments view count
+    With **render**, `rendered` holds the HTML, table of contents and reading time
     """
     project = await project_service.get_project_by_id(db, project_id)
 
@@ -122,12 +175,16 @@ async def get_project(
     # Increment view count
     await project_service.increment_view_count(db, project)
 
-    return ProjectResponse.model_validate(project)
+    response = ProjectResponse.model_validate(project)
+    if render:
+        response.rendered = RenderedContent(**render_markdown(response.content))
+    return response
 
 
 @router.get("/slug/{slug}", response_model=ProjectResponse)
 async def get_project_by_slug(
     slug: str,
+    render: bool = Query(False, description="Also return the content rendered as sanitised HTML"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -137,6 +194,7 @@ async def get_project_by_slug(
 
     Public endpoint (no authentication required)
     Increments view count
+    With **render**, `rendered` holds the HTML, table of contents and reading time
     """
     project = await project_service.get_project_by_slug(db, slug)
 
@@ -149,7 +207,10 @@ async def get_project_by_slug(
     # Increment view count
     await project_service.increment_view_count(db, project)
 
-    return ProjectResponse.model_validate(project)
+    response = ProjectResponse.model_validate(project)
+    if render:
+        response.rendered = RenderedContent(**render_markdown(response.content))
+    return response
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
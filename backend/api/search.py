@@ -0,0 +1,66 @@
+"""
+Search API Endpoints
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Literal
+
+from core.database import get_db
+from models.user import User
+from schemas.search import SearchResponse
+from services import search_service
+from utils.dependencies import get_current_admin_user
+
+
+router = APIRouter(prefix="/api/search", tags=["search"])
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text (Korean and English)"),
+    type: Literal["all", "blog", "project"] = Query("all", description="Restrict to blogs or projects"),
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Search published blogs and projects
+
+    - **q**: Search text; Korean is matched by syllable bigrams, so partial
+      words and words with particles match
+    - **type**: all, blog or project
+    - **limit**: Maximum results (default: 20, max: 50)
+
+    Results are ranked (title > tags > excerpt/description > content) and
+    carry HTML-escaped `title_highlight` / `snippet` fields with matches
+    wrapped in `<mark>`.
+
+    Public endpoint (no authentication required)
+    """
+    kinds = search_service.KINDS if type == "all" else (type,)
+    return await search_service.search(db, q.strip(), kinds=kinds, limit=limit)
+
+
+@router.get("/stats", response_model=dict)
+async def get_search_stats(
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Search backend and index size (Admin only)"""
+    return search_service.get_search_stats()
+
+
+@router.post("/rebuild", response_model=dict)
+async def rebuild_search_index(
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Rebuild the search index (Admin only)
+
+    memory backend: rebuilds the in-process index (drops tombstones).
+    postgres backend: fills missing tsvectors.
+    """
+    if search_service.backend_name() == "postgres":
+        indexed = await search_service.backfill_search_vectors()
+        return {"backend": "postgres", "indexed": indexed}
+
+    index = await search_service.memory_search.rebuild()
+    return {"backend": "memory", "documents": len(index)}
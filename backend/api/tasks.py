@@ -0,0 +1,142 @@
+"""
+Background Task API Endpoints
+"""
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from core.database import get_db
+from models.user import User
+from models.task import TaskStatus
+from schemas.task import TaskCreate, TaskResponse
+from services import task_queue
+from services.cluster_scheduler import list_job_runs
+from services.task_worker import task_worker
+from utils.dependencies import get_current_admin_user
+from loguru import logger
+
+
+router = APIRouter(prefix="/api/tasks", tags=["tasks"])
+
+
+@router.get("/stats", response_model=dict)
+async def get_task_stats(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Task queue depth and throughput (Admin only)
+
+    - **queue**: counts by status, ready/delayed depth, oldest ready task age,
+      completions per minute (all workers, from the tasks table)
+    - **worker**: the worker embedded in this API process
+    - **handlers**: registered task names
+    """
+    try:
+        queue_stats = await task_queue.get_queue_stats(db)
+    except Exception as e:
+        logger.error(f"Failed to get task queue stats: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="작업 큐 통계 조회에 실패했습니다.",
+        )
+
+    return {
+        "queue": queue_stats,
+        "worker": task_worker.stats(),
+        "handlers": sorted(task_queue.TASK_HANDLERS),
+    }
+
+
+@router.get("", response_model=list[TaskResponse])
+async def list_tasks(
+    status_filter: Optional[TaskStatus] = Query(None, alias="status", description="Filter by status"),
+    name: Optional[str] = Query(None, description="Filter by task name"),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """List recent tasks (Admin only)"""
+    return await task_queue.list_tasks(db, status=status_filter, name=name, limit=limit)
+
+
+@router.post("", response_model=TaskResponse, status_code=status.HTTP_202_ACCEPTED)
+async def enqueue_task(
+    task_data: TaskCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Enqueue a task for a registered handler (Admin only)"""
+    if task_data.name not in task_queue.TASK_HANDLERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 작업입니다: {task_data.name}",
+        )
+
+    task = await task_queue.enqueue_task(
+        db,
+        task_data.name,
+        task_data.payload,
+        priority=task_data.priority,
+        delay_seconds=task_data.delay_seconds,
+        max_attempts=task_data.max_attempts,
+    )
+    task_worker.notify()
+    return task
+
+
+@router.get("/scheduler/runs", response_model=list[dict])
+async def get_scheduler_runs(
+    job_name: Optional[str] = Query(None, description="Filter by job (daily_blog, weekly_newsletter)"),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Scheduled job run history (Admin only)
+
+    One row per cron firing, with the instance that ran it, catch-up flag
+    and duration.
+    """
+    runs = await list_job_runs(db, job_name=job_name, limit=limit)
+    return [run.to_dict() for run in runs]
+
+
+@router.get("/{task_id}", response_model=TaskResponse)
+async def get_task(
+    task_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Get a task (Admin only)"""
+    task = await task_queue.get_task(db, task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다.",
+        )
+    return task
+
+
+@router.post("/{task_id}/retry", response_model=TaskResponse)
+async def retry_task(
+    task_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Re-queue a failed task (Admin only)"""
+    task = await task_queue.get_task(db, task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다.",
+        )
+    if task.status != TaskStatus.FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="실패한 작업만 다시 실행할 수 있습니다.",
+        )
+
+    task = await task_queue.retry_task(db, task)
+    task_worker.notify()
+    return task
@@ -30,6 +30,111 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: Optional[str] = None
     OPENAI_API_KEY: Optional[str] = None
 
+    # LLM client (shared by all AI features)
+    LLM_BACKEND: str = "openai"  # "openai" or "fake" (deterministic local stand-in)
+    LLM_MAX_CONCURRENCY: int = 4  # Concurrent LLM calls per process
+    LLM_MAX_CONNECTIONS: int = 20  # HTTP connection pool size
+    LLM_TIMEOUT_SECONDS: float = 120.0  # Per attempt
+    LLM_MAX_RETRIES: int = 3
+    LLM_BACKOFF_BASE_SECONDS: float = 1.0
+    LLM_BACKOFF_MAX_SECONDS: float = 30.0
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5  # Consecutive failures before failing fast
+    LLM_CIRCUIT_RESET_SECONDS: float = 60.0
+
+    # Fake LLM backend (LLM_BACKEND=fake)
+    FAKE_LLM_LATENCY_SECONDS: float = 0.5  # Time to first token
+    FAKE_LLM_TOKENS_PER_SECOND: float = 50.0  # 0 = instant
+    FAKE_LLM_OUTPUT_TOKENS: int = 400
+
+    # Prompt budgets (tokens)
+    PROMPT_README_MAX_TOKENS: int = 1200  # README after compaction (headings kept)
+    PROMPT_EXCERPT_MAX_TOKENS: int = 80  # Per blog/project summary line
+    PROMPT_ITEMS_MAX_TOKENS: int = 1200  # All summary lines of one prompt section
+
+    # AI Jobs (background generation)
+    AI_JOB_RUNNER: str = "local"  # "local" (in-process pool) or "queue" (task queue workers)
+    AI_JOB_WORKERS: int = 2  # Concurrent generation jobs per process (local runner)
+    AI_JOB_TIMEOUT_SECONDS: int = 300
+    AI_JOB_STALE_SECONDS: int = 900  # RUNNING jobs older than this are retried
+    AI_JOB_SWEEP_SECONDS: int = 60  # Interval for picking up orphaned jobs
+
+    # Batch project info generation
+    PROJECT_BATCH_MAX_ITEMS: int = 100
+    PROJECT_BATCH_CONCURRENCY: int = 8  # Items in flight (GitHub fetch + LLM) per batch
+    PROJECT_BATCH_TIMEOUT_SECONDS: int = 600  # Job timeout for a whole batch
+
+    # Background task queue (tasks table, SKIP LOCKED workers)
+    TASK_WORKER_EMBEDDED: bool = True  # Run a worker inside the API process
+    TASK_WORKER_CONCURRENCY: int = 4  # Tasks running at once per worker process
+    TASK_POLL_INTERVAL_SECONDS: float = 1.0  # Poll interval while the queue is empty
+    TASK_VISIBILITY_TIMEOUT_SECONDS: int = 60  # Lease length, renewed while a task runs
+    TASK_TIMEOUT_SECONDS: int = 900  # Maximum run time of one attempt
+    TASK_MAX_ATTEMPTS: int = 3
+    TASK_RETRY_BACKOFF_SECONDS: float = 10.0  # Doubles per attempt
+    TASK_RETENTION_DAYS: int = 7  # Finished tasks are purged after this
+    TASK_MAINTENANCE_INTERVAL_SECONDS: int = 300
+    TASK_SHUTDOWN_GRACE_SECONDS: float = 20.0
+
+    # Cluster Scheduler (scheduled jobs run exactly once across replicas)
+    SCHEDULER_TICK_SECONDS: float = 30.0  # How often the leader evaluates schedules
+    SCHEDULER_LEASE_SECONDS: int = 90  # Leader lease (non-PostgreSQL only; PostgreSQL uses advisory locks)
+    SCHEDULER_CATCH_UP_HOURS: float = 24.0  # Missed runs within this window run once after downtime (0 = off)
+    SCHEDULER_RUN_TIMEOUT_SECONDS: int = 7200  # RUNNING runs older than this are marked failed
+
+    # Newsletter automation (scheduled_at dispatch, content collection)
+    NEWSLETTER_DISPATCHER_ENABLED: bool = True
+    NEWSLETTER_DISPATCH_MAX_WAIT_SECONDS: float = 30.0  # Longest sleep between due-time checks
+    NEWSLETTER_DISPATCH_BATCH_SIZE: int = 10  # Newsletters claimed per transaction
+    NEWSLETTER_COLLECT_TIMEOUT_SECONDS: float = 20.0  # Wall-time cap for newsletter content collection
+
+    # Search (GET /api/search)
+    SEARCH_BACKEND: str = "auto"  # "auto" (postgres on PostgreSQL, else memory), "postgres" (tsvector + GIN) or "memory" (in-process BM25)
+    SEARCH_CONTENT_MAX_CHARS: int = 5000  # Plain-text content indexed per document
+    SEARCH_SNIPPET_CHARS: int = 160  # Highlighted snippet length
+
+    # Project facets (GET /api/projects/facets)
+    PROJECT_FACETS_CACHE_TTL_SECONDS: int = 300  # Bounds staleness from writes on other replicas
+    PROJECT_FACETS_CACHE_MAX_ENTRIES: int = 256  # Cached filter combinations
+
+    # Related posts (GET /api/blog/{id}/related)
+    RELATED_POSTS_TOP_K: int = 5  # Neighbours stored per post
+    RELATED_POSTS_MIN_SCORE: float = 0.05  # Weaker matches are not stored
+    RELATED_POSTS_MODEL_MAX_AGE_SECONDS: int = 6 * 3600  # Incremental updates rebuild fully past this age
+    RELATED_POSTS_REBUILD_SCHEDULE: str = "30 4 * * *"  # Nightly full rebuild (KST, cluster scheduler)
+
+    # Trending / popular rankings (GET /api/blog/trending, /api/projects/popular)
+    TRENDING_REFRESH_ENABLED: bool = True  # Recompute rankings in this process
+    TRENDING_REFRESH_SECONDS: int = 600  # Ranking recompute interval
+    TRENDING_WINDOW_DAYS: int = 30  # Daily view buckets considered
+    TRENDING_BLOG_HALF_LIFE_DAYS: float = 3.0  # A view loses half its weight after this many days
+    TRENDING_PROJECT_HALF_LIFE_DAYS: float = 14.0
+    TRENDING_CACHE_SECONDS: int = 60  # Ranking responses cached in-process
+    VIEW_BUCKET_RETENTION_DAYS: int = 90  # Older daily buckets are deleted on refresh
+
+    # Server-side Markdown rendering (?render=true on blog/project/activity detail)
+    MARKDOWN_CACHE_MAX_ENTRIES: int = 512  # Rendered documents kept in-process, keyed by source hash
+
+    # Feeds and sitemap (/feed.xml, /atom.xml, /sitemap.xml)
+    SITE_URL: str = "https://aion.io.kr"  # Public frontend origin used for links
+    SITE_NAME: str = "AI ON"
+    SITE_DESCRIPTION: str = "AI 기술 스터디와 바이브코딩 프로젝트, 최신 AI 개발 소식과 기술 인사이트"
+    FEED_MAX_ITEMS: int = 50  # Entries in the RSS/Atom feeds
+    FEED_REGENERATE_DELAY_SECONDS: float = 10.0  # Writes within this window share one regeneration
+    FEED_CACHE_SECONDS: int = 60  # Documents cached in-process between database checks
+    FEED_MAX_AGE_SECONDS: int = 300  # Cache-Control max-age for crawlers and the edge
+
+    # LLM completion cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_DIR: str = ".cache/llm"
+    LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    LLM_CACHE_MAX_ENTRIES: int = 1000
+
+    # GitHub API
+    GITHUB_API_URL: str = "https://api.github.com"  # Point at a local stub for tests
+    GITHUB_TOKEN: Optional[str] = None  # Optional; raises the rate limit from 60/h to 5000/h
+    GITHUB_CACHE_DIR: str = ".cache/github"  # ETag cache
+    GITHUB_TIMEOUT_SECONDS: float = 10.0
+
     # Email
     RESEND_API_KEY: Optional[str] = None
     FROM_EMAIL: str = "noreply@aion.io.kr"
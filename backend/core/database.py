@@ -57,6 +57,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def dialect_insert(session: AsyncSession, table):
+    """
+    Build an INSERT that supports ON CONFLICT for the session's dialect
+
+    Usage:
+        stmt = dialect_insert(db, Subscriber).on_conflict_do_nothing(index_elements=["email"])
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert(table)
+
+
 async def create_all_tables():
     """
     Create all database tables
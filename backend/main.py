@@ -1,6 +1,7 @@
 """
 AI ON Backend - FastAPI Main Application
 """
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
@@ -8,13 +9,21 @@ from loguru import logger
 
 from core.config import settings
 from core.database import create_all_tables
+from utils.serialization import ORJSONResponse
 
 # Import models to register with Base.metadata
 from models.user import User
 from models.blog import Blog
+from models.tag import Tag
+from models.related_post import RelatedPost
+from models.view_stat import ViewBucket, TrendingScore
+from models.feed import FeedDocument
 from models.project import Project
 from models.newsletter import Subscriber, Newsletter, NewsletterRequest
 from models.activity import Activity
+from models.ai_job import AIJob
+from models.task import Task
+from models.job_run import JobRun, SchedulerLease
 
 # Import routers
 from api.auth import router as auth_router
@@ -24,6 +33,16 @@ from api.newsletter import router as newsletter_router
 from api.ai_content import router as ai_router
 from api.activity import router as activity_router
 from api.logs import router as logs_router
+from api.tasks import router as tasks_router
+from api.search import router as search_router
+from api.feeds import router as feeds_router
+from services.ai_job_service import job_pool
+from services.llm_client import llm_client
+from services.github_client import github_client
+from services.task_worker import task_worker
+from services.newsletter_dispatcher import newsletter_dispatcher
+from services.trending_service import trending_refresher
+from services import related_service, search_service
 
 
 @asynccontextmanager
@@ -36,10 +55,40 @@ async def lifespan(app: FastAPI):
     # Create database tables
     await create_all_tables()
 
+    # Start AI job workers (also resumes jobs left over from a restart)
+    if settings.AI_JOB_RUNNER == "local":
+        job_pool.start()
+
+    # Background task worker (disable to run workers as separate processes)
+    if settings.TASK_WORKER_EMBEDDED:
+        task_worker.start()
+
+    # Scheduled newsletter sends (claims are atomic, safe on every replica)
+    if settings.NEWSLETTER_DISPATCHER_ENABLED:
+        newsletter_dispatcher.start()
+
+    # Trending / popular rankings (recompute is idempotent, safe on every replica)
+    if settings.TRENDING_REFRESH_ENABLED:
+        trending_refresher.start()
+
+    # Search index: build the in-process index / backfill tsvectors in the background
+    search_warm_up = asyncio.create_task(search_service.warm_up())
+
+    # Related posts: queue a first full build if none has run yet
+    await related_service.warm_up()
+
     yield
 
     # Shutdown
     logger.info("👋 Shutting down AI ON Backend...")
+    search_warm_up.cancel()
+    await trending_refresher.stop()
+    await newsletter_dispatcher.stop()
+    await task_worker.stop()
+    await job_pool.stop()
+    if llm_client:
+        await llm_client.aclose()
+    await github_client.aclose()
 
 
 # Initialize FastAPI app
@@ -50,6 +99,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Middleware
@@ -92,6 +142,9 @@ app.include_router(newsletter_router)
 app.include_router(ai_router)
 app.include_router(activity_router)
 app.include_router(logs_router)
+app.include_router(tasks_router)
+app.include_router(search_router)
+app.include_router(feeds_router)
 
 
 if __name__ == "__main__":
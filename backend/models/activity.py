@@ -1,13 +1,14 @@
 """
 Activity Model
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, Index, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, Index, ForeignKey, JSON, event, select
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
 
 from core.database import Base
+from models.user import User
 
 
 class ActivityType(str, enum.Enum):
@@ -40,6 +41,7 @@ class Activity(Base):
 
     # Metadata
     created_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    creator_name = Column(String(100), nullable=False)  # Denormalised User.name (synced on rename)
 
     # Relationships
     creator = relationship("User", back_populates="activities")
@@ -54,11 +56,6 @@ class Activity(Base):
         Index('idx_activity_date', 'activity_date'),
     )
 
-    @property
-    def creator_name(self) -> str:
-        """Get creator name from relationship"""
-        return self.creator.name if self.creator else "Unknown"
-
     def __repr__(self):
         return f"<Activity(id={self.id}, title='{self.title}', type='{self.type}')>"
 
@@ -87,3 +84,12 @@ class Activity(Base):
             }
 
         return data
+
+
+@event.listens_for(Activity, "before_insert")
+def _fill_creator_name(mapper, connection, target: Activity):
+    """Populate the denormalised creator name when the caller did not set it"""
+    if not target.creator_name:
+        target.creator_name = connection.scalar(
+            select(User.name).where(User.id == target.created_by)
+        ) or "Unknown"
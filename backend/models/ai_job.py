@@ -0,0 +1,63 @@
+"""
+AI Job Model
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, ForeignKey, JSON, Index
+from sqlalchemy.sql import func
+import enum
+import uuid
+
+from core.database import Base
+
+
+class AIJobStatus(str, enum.Enum):
+    """AI generation job status"""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class AIJob(Base):
+    """Background AI generation job (blog, newsletter, preview, project info)"""
+    __tablename__ = "ai_jobs"
+
+    # Primary Key
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+
+    # Job Definition
+    kind = Column(String(50), nullable=False)  # "generate-blog", "preview", ...
+    params = Column(JSON, nullable=False, default=dict)  # Request payload
+
+    # Status
+    status = Column(SQLEnum(AIJobStatus), nullable=False, default=AIJobStatus.PENDING, index=True)
+    result = Column(JSON, nullable=True)  # Handler result (persisted for polling)
+    error = Column(Text, nullable=True)
+
+    # Metadata
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Indexes for performance
+    __table_args__ = (
+        Index('idx_ai_job_status_created', 'status', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f"<AIJob(id={self.id}, kind='{self.kind}', status='{self.status}')>"
+
+    def to_dict(self):
+        """Convert model to dictionary"""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status.value,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
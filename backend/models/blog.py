@@ -1,13 +1,15 @@
 """
 Blog Model
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, Index, ForeignKey
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, Index, ForeignKey, event, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.sql import func, text
 from datetime import datetime
 import enum
 
 from core.database import Base
+from models.user import User
 
 
 class BlogStatus(str, enum.Enum):
@@ -32,6 +34,7 @@ class Blog(Base):
 
     # Metadata
     author_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    author_name = Column(String(100), nullable=False)  # Denormalised User.name (synced on rename)
     status = Column(SQLEnum(BlogStatus), nullable=False, default=BlogStatus.DRAFT, index=True)
     tags = Column(String(500), nullable=True)  # Comma-separated tags
 
@@ -46,17 +49,24 @@ class Blog(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     published_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Full-text search (PostgreSQL search backend; filled by services.search_service, never loaded by default)
+    search_vector = deferred(Column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True))
+
     # Indexes for performance
     __table_args__ = (
         Index('idx_blog_status_created', 'status', 'created_at'),
         Index('idx_blog_published_at', 'published_at'),
+        # Public listing: status = PUBLISHED ORDER BY published_at DESC NULLS LAST, created_at DESC
+        # (PostgreSQL only - SQLite does not accept NULLS LAST in index definitions)
+        Index(
+            'idx_blog_published_listing',
+            published_at.desc().nulls_last(),
+            created_at.desc(),
+            postgresql_where=text("status = 'PUBLISHED'"),
+        ).ddl_if(dialect='postgresql'),
+        Index('idx_blog_search_vector', 'search_vector', postgresql_using='gin').ddl_if(dialect='postgresql'),
     )
 
-    @property
-    def author_name(self) -> str:
-        """Get author name from relationship"""
-        return self.author.name if self.author else "Unknown"
-
     @property
     def tags_list(self) -> list[str]:
         """Convert comma-separated tags to list"""
@@ -91,3 +101,12 @@ class Blog(Base):
             }
 
         return data
+
+
+@event.listens_for(Blog, "before_insert")
+def _fill_author_name(mapper, connection, target: Blog):
+    """Populate the denormalised author name when the caller did not set it"""
+    if not target.author_name:
+        target.author_name = connection.scalar(
+            select(User.name).where(User.id == target.author_id)
+        ) or "Unknown"
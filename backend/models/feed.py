@@ -0,0 +1,26 @@
+"""
+Feed Document Model
+"""
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary
+
+from core.database import Base
+
+
+class FeedDocument(Base):
+    """
+    Pre-generated, gzip-compressed feed or sitemap (/feed.xml, /atom.xml, /sitemap.xml)
+
+    Rewritten by services.feed_service only when the generated XML changes,
+    so etag and last_modified stay stable across no-op regenerations.
+    """
+    __tablename__ = "feed_documents"
+
+    name = Column(String(50), primary_key=True)  # "feed.xml" | "atom.xml" | "sitemap.xml"
+    content = Column(LargeBinary, nullable=False)  # gzip-compressed XML
+    etag = Column(String(64), nullable=False)  # SHA-256 of the uncompressed XML
+    size = Column(Integer, nullable=False)  # Uncompressed bytes
+    last_modified = Column(DateTime(timezone=True), nullable=False)  # When the XML last changed
+    generated_at = Column(DateTime(timezone=True), nullable=False)  # Last regeneration (changed or not)
+
+    def __repr__(self):
+        return f"<FeedDocument(name='{self.name}', etag='{self.etag[:12]}', size={self.size})>"
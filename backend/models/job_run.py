@@ -0,0 +1,85 @@
+"""
+Scheduled Job Run Models
+"""
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Float, Enum as SQLEnum, JSON, Index, UniqueConstraint
+from sqlalchemy.sql import func
+import enum
+
+from core.database import Base
+
+
+class JobRunStatus(str, enum.Enum):
+    """Scheduled job run status"""
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobRun(Base):
+    """
+    One firing of a scheduled job
+
+    The unique (job_name, scheduled_for) pair is the exactly-once guard:
+    the replica whose INSERT wins runs the job, everyone else skips it.
+    """
+    __tablename__ = "job_runs"
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # Run Identity
+    job_name = Column(String(100), nullable=False)  # "daily_blog", "weekly_newsletter"
+    scheduled_for = Column(DateTime(timezone=True), nullable=False)  # Cron fire time (UTC)
+
+    # Status
+    status = Column(SQLEnum(JobRunStatus), nullable=False, default=JobRunStatus.RUNNING)
+    owner = Column(String(100), nullable=True)  # Scheduler instance that ran it
+    is_catch_up = Column(Boolean, nullable=False, default=False)  # Fired late, after downtime
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+
+    # Timestamps
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+
+    # Indexes for performance
+    __table_args__ = (
+        UniqueConstraint('job_name', 'scheduled_for', name='uq_job_run_name_scheduled'),
+        Index('idx_job_run_name_started', 'job_name', 'started_at'),
+    )
+
+    def __repr__(self):
+        return f"<JobRun(job='{self.job_name}', scheduled_for={self.scheduled_for}, status='{self.status}')>"
+
+    def to_dict(self):
+        """Convert model to dictionary"""
+        return {
+            "id": self.id,
+            "job_name": self.job_name,
+            "scheduled_for": self.scheduled_for.isoformat() if self.scheduled_for else None,
+            "status": self.status.value,
+            "owner": self.owner,
+            "is_catch_up": self.is_catch_up,
+            "result": self.result,
+            "error": self.error,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": self.duration_seconds,
+        }
+
+
+class SchedulerLease(Base):
+    """
+    Leader lease for databases without advisory locks (e.g. SQLite)
+
+    PostgreSQL deployments use pg_try_advisory_lock instead.
+    """
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(100), primary_key=True)
+    owner = Column(String(100), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<SchedulerLease(name='{self.name}', owner='{self.owner}')>"
@@ -1,9 +1,9 @@
 """
 Newsletter Models
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum as SQLEnum, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum as SQLEnum, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from datetime import datetime
 import enum
 import uuid
@@ -15,6 +15,7 @@ class NewsletterStatus(str, enum.Enum):
     """Newsletter status"""
     DRAFT = "draft"
     SCHEDULED = "scheduled"
+    SENDING = "sending"  # Claimed by the dispatcher, delivery in progress
     SENT = "sent"
     FAILED = "failed"
 
@@ -53,6 +54,18 @@ class Subscriber(Base):
     # Relationships
     user = relationship("User", back_populates="newsletter_subscription")
 
+    # Indexes for performance
+    __table_args__ = (
+        # Active subscribers: sending (email only) and admin list ORDER BY subscribed_at DESC
+        Index(
+            'idx_subscriber_active_subscribed',
+            subscribed_at.desc(),
+            postgresql_include=['email'],
+            postgresql_where=text("is_active = true"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Subscriber(id={self.id}, email='{self.email}', is_active={self.is_active})>"
 
@@ -106,6 +119,12 @@ class Newsletter(Base):
     # Relationships
     creator = relationship("User", foreign_keys=[created_by])
 
+    # Indexes for performance
+    __table_args__ = (
+        # Due-time dispatch: status = SCHEDULED AND scheduled_at <= now
+        Index('idx_newsletter_status_scheduled', 'status', 'scheduled_at'),
+    )
+
     def __repr__(self):
         return f"<Newsletter(id={self.id}, title='{self.title}', status='{self.status}')>"
 
@@ -161,6 +180,18 @@ class NewsletterRequest(Base):
     user = relationship("User", back_populates="newsletter_requests")
     newsletter = relationship("Newsletter")
 
+    # Indexes for performance
+    __table_args__ = (
+        # Pending queue: status = PENDING ORDER BY priority DESC, votes DESC
+        Index(
+            'idx_newsletter_request_pending_rank',
+            priority.desc(),
+            votes.desc(),
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+    )
+
     def __repr__(self):
         return f"<NewsletterRequest(id={self.id}, topic='{self.topic}', status='{self.status}')>"
 
@@ -1,7 +1,9 @@
 """
 Project Model
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, JSON, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, JSON, Index, ForeignKey, Table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
@@ -71,10 +73,15 @@ class Project(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    # Full-text search (PostgreSQL search backend; filled by services.search_service, never loaded by default)
+    search_vector = deferred(Column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True))
+
     # Indexes for performance
     __table_args__ = (
         Index('idx_project_status_created', 'status', 'created_at'),
         Index('idx_project_category', 'category'),
+        Index('idx_project_difficulty', 'difficulty'),
+        Index('idx_project_search_vector', 'search_vector', postgresql_using='gin').ddl_if(dialect='postgresql'),
     )
 
     def __repr__(self):
@@ -101,3 +108,14 @@ class Project(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+# Project <-> technology index (one row per Project.tech_stack entry, maintained by services.project_service)
+project_technologies = Table(
+    "project_technologies",
+    Base.metadata,
+    Column("project_id", Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+    Column("key", String(100), primary_key=True),  # Lowercased technology name
+    Column("name", String(100), nullable=False),  # Spelling used in tech_stack
+    Index("idx_project_technologies_key", "key", "project_id"),
+)
@@ -0,0 +1,27 @@
+"""
+Related Post Model
+"""
+from sqlalchemy import Column, Integer, Float, ForeignKey, Index
+
+from core.database import Base
+
+
+class RelatedPost(Base):
+    """
+    Precomputed neighbour of a published blog post
+
+    Top-k rows per post (services.related_service), read ordered by score.
+    """
+    __tablename__ = "related_posts"
+
+    blog_id = Column(Integer, ForeignKey("blogs.id", ondelete="CASCADE"), primary_key=True)
+    related_id = Column(Integer, ForeignKey("blogs.id", ondelete="CASCADE"), primary_key=True)
+    score = Column(Float, nullable=False)  # Cosine similarity (0-1)
+
+    __table_args__ = (
+        Index('idx_related_post_blog_score', 'blog_id', 'score'),
+        Index('idx_related_post_related', 'related_id'),
+    )
+
+    def __repr__(self):
+        return f"<RelatedPost(blog_id={self.blog_id}, related_id={self.related_id}, score={self.score})>"
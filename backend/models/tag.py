@@ -0,0 +1,47 @@
+"""
+Tag Models
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Table
+from sqlalchemy.sql import func
+
+from core.database import Base
+
+
+# Blog <-> Tag association (PK serves blog -> tags, idx_blog_tags_tag serves tag -> blogs)
+blog_tags = Table(
+    "blog_tags",
+    Base.metadata,
+    Column("blog_id", Integer, ForeignKey("blogs.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Index("idx_blog_tags_tag", "tag_id", "blog_id"),
+)
+
+
+class Tag(Base):
+    """
+    Blog tag
+
+    Blog.tags keeps the comma-separated display copy; this table and
+    blog_tags are the normalised index used for filtering and the tag cloud.
+    """
+    __tablename__ = "tags"
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # Tag Identity
+    name = Column(String(100), nullable=False)  # Display name (first spelling seen)
+    key = Column(String(100), unique=True, nullable=False, index=True)  # Lowercased, whitespace-collapsed name
+
+    # Tag Cloud
+    post_count = Column(Integer, default=0, nullable=False)  # PUBLISHED posts (maintained by services.tag_service)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index('idx_tag_post_count', 'post_count'),
+    )
+
+    def __repr__(self):
+        return f"<Tag(id={self.id}, name='{self.name}', post_count={self.post_count})>"
@@ -0,0 +1,75 @@
+"""
+Background Task Model
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, JSON, Index
+from sqlalchemy.sql import func
+import enum
+
+from core.database import Base
+
+
+class TaskStatus(str, enum.Enum):
+    """Background task status"""
+    QUEUED = "queued"  # Waiting (run_at may be in the future: delayed/retry backoff)
+    RUNNING = "running"  # Leased by a worker until locked_until
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"  # Out of attempts
+
+
+class Task(Base):
+    """Durable background task, dequeued by workers with FOR UPDATE SKIP LOCKED"""
+    __tablename__ = "tasks"
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # Task Definition
+    name = Column(String(100), nullable=False, index=True)  # Handler name, e.g. "newsletter.send"
+    payload = Column(JSON, nullable=False, default=dict)
+    priority = Column(Integer, nullable=False, default=0)  # Higher runs first
+
+    # Status
+    status = Column(SQLEnum(TaskStatus), nullable=False, default=TaskStatus.QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # Not before
+    locked_until = Column(DateTime(timezone=True), nullable=True)  # Visibility timeout
+    locked_by = Column(String(100), nullable=True)  # Worker ID holding the lease
+    result = Column(JSON, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Indexes for performance
+    __table_args__ = (
+        # Dequeue: ready tasks by priority, then age
+        Index('idx_task_status_priority_run_at', 'status', 'priority', 'run_at'),
+        # Throughput stats and retention purge
+        Index('idx_task_status_finished', 'status', 'finished_at'),
+    )
+
+    def __repr__(self):
+        return f"<Task(id={self.id}, name='{self.name}', status='{self.status}')>"
+
+    def to_dict(self):
+        """Convert model to dictionary"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "payload": self.payload,
+            "priority": self.priority,
+            "status": self.status.value,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "run_at": self.run_at.isoformat() if self.run_at else None,
+            "locked_until": self.locked_until.isoformat() if self.locked_until else None,
+            "locked_by": self.locked_by,
+            "result": self.result,
+            "last_error": self.last_error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
@@ -0,0 +1,50 @@
+"""
+View Statistics Models
+"""
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Index
+from sqlalchemy.sql import func
+
+from core.database import Base
+
+
+class ViewBucket(Base):
+    """
+    Views of one blog post / project on one day (UTC)
+
+    Upserted (+1) on every counted view next to the lifetime view_count.
+    """
+    __tablename__ = "view_buckets"
+
+    kind = Column(String(20), primary_key=True)  # "blog" | "project"
+    item_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    views = Column(Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        Index('idx_view_bucket_kind_day', 'kind', 'day'),
+    )
+
+    def __repr__(self):
+        return f"<ViewBucket(kind='{self.kind}', item_id={self.item_id}, day={self.day}, views={self.views})>"
+
+
+class TrendingScore(Base):
+    """
+    Precomputed decay-weighted popularity of a blog post / project
+
+    Replaced wholesale by services.trending_service on every refresh.
+    """
+    __tablename__ = "trending_scores"
+
+    kind = Column(String(20), primary_key=True)  # "blog" | "project"
+    item_id = Column(Integer, primary_key=True)
+    score = Column(Float, nullable=False)  # Sum of daily views weighted by 0.5 ** (age / half-life)
+    recent_views = Column(Integer, nullable=False)  # Raw views inside the window
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index('idx_trending_kind_score', 'kind', 'score'),
+    )
+
+    def __repr__(self):
+        return f"<TrendingScore(kind='{self.kind}', item_id={self.item_id}, score={self.score})>"
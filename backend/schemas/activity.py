@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from models.activity import ActivityType
+from schemas.content import RenderedContent
 
 
 class ActivityBase(BaseModel):
@@ -48,6 +49,7 @@ class ActivityResponse(BaseModel):
     creator_name: str = Field(alias="creator_name")
     created_at: datetime
     updated_at: datetime
+    rendered: Optional[RenderedContent] = None  # description as HTML, only with ?render=true
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
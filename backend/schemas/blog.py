@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field, ConfigDict, field_serializer
 from typing import Optional, List
 from datetime import datetime
 from models.blog import BlogStatus
+from schemas.content import RenderedContent
 
 
 class BlogBase(BaseModel):
@@ -45,6 +46,7 @@ class BlogResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     published_at: Optional[datetime] = None
+    rendered: Optional[RenderedContent] = None  # content as HTML, only with ?render=true
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
@@ -77,3 +79,43 @@ class BlogListResponse(BaseModel):
 class BlogPublishRequest(BaseModel):
     """Schema for publishing a blog post"""
     publish: bool = Field(..., description="True to publish, False to unpublish")
+
+
+class TagCloudItem(BaseModel):
+    """Schema for a tag with its published post count"""
+    name: str
+    key: str = Field(..., description="Case-insensitive lookup key (use as ?tag=)")
+    count: int
+
+
+class TagCloudResponse(BaseModel):
+    """Schema for tag cloud response"""
+    items: List[TagCloudItem]
+
+
+class RelatedPostItem(BaseModel):
+    """Schema for a related blog post"""
+    id: int
+    title: str
+    slug: str
+    excerpt: Optional[str]
+    author: str
+    tags: List[str]
+    published_at: Optional[datetime] = None
+    score: float = Field(..., description="Similarity (0-1)")
+
+
+class RelatedPostsResponse(BaseModel):
+    """Schema for related posts response"""
+    items: List[RelatedPostItem]
+
+
+class TrendingBlogItem(BlogListItem):
+    """Schema for a trending blog post"""
+    trending_score: float = Field(..., description="Decay-weighted recent views")
+    recent_views: int = Field(..., description="Views in the trending window")
+
+
+class TrendingBlogsResponse(BaseModel):
+    """Schema for trending blog posts response"""
+    items: List[TrendingBlogItem]
@@ -0,0 +1,21 @@
+"""
+Rendered Content Schemas
+"""
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class TocEntry(BaseModel):
+    """Heading in a rendered document's table of contents"""
+    id: str = Field(..., description="Heading anchor (link with #id)")
+    title: str
+    level: int
+    children: List["TocEntry"] = []
+
+
+class RenderedContent(BaseModel):
+    """Markdown rendered to sanitised HTML on the server (?render=true)"""
+    html: str
+    toc: List[TocEntry] = []
+    reading_time_minutes: int
+    content_hash: str = Field(..., description="SHA-256 of the source; changes whenever the HTML does")
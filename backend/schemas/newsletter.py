@@ -25,6 +25,15 @@ class SubscriberResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class SubscriberImportResult(BaseModel):
+    """Schema for bulk subscriber import result"""
+    total_rows: int
+    invalid: int
+    duplicates: int
+    inserted: int
+    already_subscribed: int
+
+
 class SubscriptionStatus(BaseModel):
     """Schema for subscription status check"""
     subscribed: bool
@@ -87,6 +96,11 @@ class NewsletterGenerateRequest(BaseModel):
     period_days: int = Field(1, ge=1, le=30, description="Period in days (1=daily, 7=weekly)")
 
 
+class NewsletterScheduleRequest(BaseModel):
+    """Schema for scheduling a newsletter send"""
+    scheduled_at: datetime = Field(..., description="Send time (ISO 8601; without an offset it is taken as UTC)")
+
+
 class NewsletterSendRequest(BaseModel):
     """Schema for sending newsletter"""
     test_email: Optional[EmailStr] = Field(None, description="Send test email instead of all subscribers")
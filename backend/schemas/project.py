@@ -4,6 +4,7 @@ Project Schemas for API request/response
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
+from schemas.content import RenderedContent
 
 
 class ProjectCreate(BaseModel):
@@ -66,6 +67,8 @@ class ProjectResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    rendered: Optional[RenderedContent] = None  # content as HTML, only with ?render=true
+
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -104,3 +107,29 @@ class ProjectListResponse(BaseModel):
     total_pages: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class FacetValue(BaseModel):
+    """Schema for one facet value with its project count"""
+    value: str
+    count: int
+
+
+class ProjectFacetsResponse(BaseModel):
+    """Schema for project facet counts under the current filters"""
+    total: int
+    tech_stack: List[FacetValue]
+    category: List[FacetValue]
+    difficulty: List[FacetValue]
+    status: List[FacetValue]
+
+
+class PopularProjectItem(ProjectListItem):
+    """Schema for a popular project"""
+    trending_score: float = Field(..., description="Decay-weighted recent views")
+    recent_views: int = Field(..., description="Views in the ranking window")
+
+
+class PopularProjectsResponse(BaseModel):
+    """Schema for popular projects response"""
+    items: List[PopularProjectItem]
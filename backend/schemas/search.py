@@ -0,0 +1,25 @@
+"""
+Search Schemas
+"""
+from pydantic import BaseModel
+from typing import List, Literal
+
+
+class SearchHit(BaseModel):
+    """One search result"""
+    type: Literal["blog", "project"]
+    id: int
+    slug: str
+    title: str
+    title_highlight: str  # HTML-escaped title, matches wrapped in <mark>
+    snippet: str  # HTML-escaped excerpt around the first match, matches wrapped in <mark>
+    score: float
+
+
+class SearchResponse(BaseModel):
+    """Schema for search response"""
+    query: str
+    backend: str  # "postgres" or "memory"
+    total: int
+    took_ms: float
+    items: List[SearchHit]
@@ -0,0 +1,37 @@
+"""
+Background Task Schemas
+"""
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, Any, Dict
+from datetime import datetime
+from models.task import TaskStatus
+
+
+class TaskCreate(BaseModel):
+    """Schema for enqueueing a task"""
+    name: str = Field(..., min_length=1, max_length=100, description="Registered task name, e.g. 'github.sync_stars'")
+    payload: Dict[str, Any] = Field(default_factory=dict, description="Handler input")
+    priority: int = Field(0, ge=-100, le=100, description="Higher runs first")
+    delay_seconds: float = Field(0, ge=0, le=7 * 24 * 3600, description="Do not run before now + delay")
+    max_attempts: Optional[int] = Field(None, ge=1, le=20, description="Attempts before FAILED (default from settings)")
+
+
+class TaskResponse(BaseModel):
+    """Schema for task response"""
+    id: int
+    name: str
+    payload: Dict[str, Any]
+    priority: int
+    status: TaskStatus
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    locked_until: Optional[datetime] = None
+    locked_by: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    last_error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
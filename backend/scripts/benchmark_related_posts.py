@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Related Posts Benchmark
+
+Times a full related-posts rebuild (utils.related_posts) over synthetic
+Korean/English blog posts: term extraction, TF-IDF vectorisation and top-k
+neighbours for every post, plus one incremental update.
+
+Usage:
+    python scripts/benchmark_related_posts.py
+    python scripts/benchmark_related_posts.py --posts 10000 --content-words 300
+"""
+import argparse
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.related_posts import RelatedModel, post_terms
+
+
+TOPICS = [
+    "데이터 파이프라인 스트리밍 카프카 적재 배치",
+    "비동기 처리 이벤트 루프 코루틴 동시성 성능",
+    "검색 색인 형태소 랭킹 쿼리 하이라이트",
+    "추천 시스템 협업 필터링 임베딩 유사도 벡터",
+    "배포 자동화 컨테이너 쿠버네티스 모니터링 로그",
+    "머신러닝 모델 학습 추론 서빙 평가 데이터셋",
+    "프론트엔드 컴포넌트 상태 관리 렌더링 접근성",
+    "데이터베이스 인덱스 트랜잭션 복제 파티셔닝 튜닝",
+]
+COMMON_WORDS = "오늘은 이번 글에서 정리해 보겠습니다 방법 사용 구현 예제 결과 문제 해결 과정".split()
+PARTICLES = ("", "", "은", "는", "이", "가", "을", "를", "에서", "으로", "의")
+TAGS = "Python FastAPI PostgreSQL Redis Docker Kubernetes React TypeScript AI 데이터 검색 추천 DevOps".split()
+
+
+def make_post(rng: random.Random, content_words: int):
+    """Title, tags and content around one or two topics"""
+    topics = [rng.choice(TOPICS).split() for _ in range(rng.choice((1, 1, 2)))]
+    words = [word for topic in topics for word in topic]
+
+    def sentence(count):
+        return " ".join(
+            (rng.choice(words) if rng.random() < 0.5 else rng.choice(COMMON_WORDS)) + rng.choice(PARTICLES)
+            for _ in range(count)
+        )
+
+    return sentence(6), ",".join(rng.sample(TAGS, 3)), sentence(content_words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Related posts rebuild benchmark")
+    parser.add_argument("--posts", type=int, default=10_000, help="Published posts (default: 10000)")
+    parser.add_argument("--content-words", type=int, default=300, help="Content words per post (default: 300)")
+    parser.add_argument("--k", type=int, default=5, help="Neighbours per post (default: 5)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"🔨 Generating {args.posts:,} posts...")
+    posts = [make_post(rng, args.content_words) for _ in range(args.posts)]
+
+    started = time.perf_counter()
+    terms = [(blog_id, post_terms(*post)) for blog_id, post in enumerate(posts, 1)]
+    extracted = time.perf_counter()
+    model = RelatedModel(terms)
+    vectorised = time.perf_counter()
+    neighbours = model.neighbours(k=args.k)
+    finished = time.perf_counter()
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"✅ Full rebuild: {finished - started:.2f}s (max RSS {max_rss:.0f} MB)")
+    print(f"  term extraction: {extracted - started:.2f}s")
+    print(f"  vectorisation:   {vectorised - extracted:.2f}s "
+          f"({len(model.vocabulary):,} terms, {model.matrix.nnz:,} non-zeros)")
+    print(f"  top-{args.k} search:    {finished - vectorised:.2f}s")
+
+    started = time.perf_counter()
+    model.upsert(1, post_terms(*make_post(rng, args.content_words)))
+    model.neighbours([1], k=args.k)
+    model.similarities(1)
+    print(f"✅ Incremental update of one post: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    print("\nSample:")
+    for blog_id in (1, 2, 3):
+        title = posts[blog_id - 1][0]
+        print(f"  #{blog_id} {title}")
+        for related_id, score in neighbours[blog_id][:3]:
+            print(f"      {score:.3f}  #{related_id} {posts[related_id - 1][0]}")
+
+
+if __name__ == "__main__":
+    main()
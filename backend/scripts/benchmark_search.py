@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Search Benchmark
+
+Builds the in-process BM25 index (utils.search_index) over synthetic
+Korean/English blog posts and measures query latency percentiles for a mix
+of rare, common, multi-word and no-match queries.
+
+Usage:
+    python scripts/benchmark_search.py
+    python scripts/benchmark_search.py --docs 100000 --queries 2000
+"""
+import argparse
+import random
+import sys
+import resource
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.search_index import SearchIndex
+
+
+KOREAN_WORDS = (
+    "데이터 공작소 개발 프로젝트 성능 최적화 비동기 처리 캐싱 배포 자동화 모니터링 검색 색인 "
+    "파이프라인 스트리밍 추천 시스템 대시보드 인공지능 머신러닝 모델 학습 추론 서버 클라이언트 "
+    "데이터베이스 쿼리 인덱스 트랜잭션 스케줄러 뉴스레터 블로그 구독자 작업 큐 워커 로그 분석"
+).split()
+PARTICLES = ("", "", "은", "는", "이", "가", "을", "를", "에서", "으로", "의")
+ENGLISH_WORDS = (
+    "FastAPI PostgreSQL Redis Docker Kubernetes React Next.js Python TypeScript asyncio "
+    "SQLAlchemy pgvector OpenAI GPT LangChain Celery Nginx GitHub Actions Terraform"
+).split()
+
+QUERIES = (
+    "fastapi", "데이터", "성능 최적화", "비동기 처리", "공작소", "뉴스레터 자동화",
+    "postgresql 인덱스", "스케줄러", "추천 시스템", "kubernetes 배포", "머신러닝 모델 학습",
+    "존재하지않는단어", "langchain", "검색",
+)
+
+
+def make_text(rng: random.Random, words: int) -> str:
+    """Korean sentence soup with particles and some English terms"""
+    parts = []
+    for _ in range(words):
+        if rng.random() < 0.2:
+            parts.append(rng.choice(ENGLISH_WORDS))
+        else:
+            parts.append(rng.choice(KOREAN_WORDS) + rng.choice(PARTICLES))
+    return " ".join(parts)
+
+
+def build(docs: int, content_words: int, seed: int) -> SearchIndex:
+    """Index `docs` synthetic posts"""
+    rng = random.Random(seed)
+    index = SearchIndex()
+    for doc_id in range(1, docs + 1):
+        index.add("blog" if doc_id % 5 else "project", doc_id, {
+            "title": make_text(rng, 6),
+            "tags": " ".join(rng.sample(ENGLISH_WORDS, 3)),
+            "summary": make_text(rng, 20),
+            "content": make_text(rng, content_words),
+        })
+    return index
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process search index benchmark")
+    parser.add_argument("--docs", type=int, default=100_000, help="Documents to index (default: 100000)")
+    parser.add_argument("--content-words", type=int, default=60, help="Content words per document (default: 60)")
+    parser.add_argument("--queries", type=int, default=1000, help="Timed queries (default: 1000)")
+    parser.add_argument("--limit", type=int, default=20, help="Results per query (default: 20)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"🔨 Indexing {args.docs:,} documents...")
+    started = time.perf_counter()
+    index = build(args.docs, args.content_words, args.seed)
+    index.prepare()
+    build_seconds = time.perf_counter() - started
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"✅ Built in {build_seconds:.1f}s (max RSS {max_rss:.0f} MB)")
+
+    rng = random.Random(args.seed)
+    latencies = {query: [] for query in QUERIES}
+    for _ in range(args.queries):
+        query = rng.choice(QUERIES)
+        started = time.perf_counter()
+        index.search(query, limit=args.limit)
+        latencies[query].append((time.perf_counter() - started) * 1000)
+
+    everything = [ms for values in latencies.values() for ms in values]
+    print(f"\n{args.queries} queries over {len(index):,} documents (limit {args.limit})")
+    print(f"  p50: {percentile(everything, 0.50):.2f} ms")
+    print(f"  p95: {percentile(everything, 0.95):.2f} ms")
+    print(f"  p99: {percentile(everything, 0.99):.2f} ms")
+    print(f"  max: {max(everything):.2f} ms")
+
+    print("\nPer query (p99 ms, hits):")
+    for query, values in latencies.items():
+        if values:
+            print(f"  {query:<20} {percentile(values, 0.99):7.2f}  {len(index.search(query, limit=args.limit))}")
+
+
+if __name__ == "__main__":
+    main()
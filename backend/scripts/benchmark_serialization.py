@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark
+
+Compares serializing a 100-item blog list page through
+  1) the default path: BlogListItem.model_validate per row + response_model
+     dump + FastAPI's JSONResponse (json.dumps)
+  2) the fast path: serialize_rows() + ORJSONResponse
+and checks that both produce byte-identical JSON.
+
+Usage:
+    python scripts/benchmark_serialization.py
+    python scripts/benchmark_serialization.py --items 100 --rounds 2000
+"""
+import argparse
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from math import ceil
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.responses import JSONResponse
+
+from models.blog import Blog, BlogStatus
+from schemas.blog import BlogListItem, BlogListResponse
+from utils.serialization import ORJSONResponse, serialize_rows
+
+
+def make_blogs(count: int) -> list[Blog]:
+    """Build transient Blog rows resembling a real list page"""
+    now = datetime.now(timezone.utc)
+    return [
+        Blog(
+            id=i,
+            title=f"FastAPI 성능 최적화 가이드 #{i}",
+            slug=f"fastapi-performance-{i}",
+            excerpt="비동기 처리, 커넥션 풀, 캐싱으로 API 응답 시간을 줄이는 방법을 정리했습니다." * 2,
+            author_id=1,
+            author_name="데이터공작소 TFT",
+            status=BlogStatus.PUBLISHED,
+            tags="AI,Python,FastAPI,Backend",
+            view_count=i * 7,
+            created_at=now - timedelta(days=i, microseconds=i * 1000),
+            published_at=now - timedelta(days=i),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def default_path(blogs: list[Blog], page_size: int) -> bytes:
+    """model_validate per row, then FastAPI's response_model serialization"""
+    response = BlogListResponse(
+        items=[BlogListItem.model_validate(blog) for blog in blogs],
+        total=len(blogs),
+        page=1,
+        page_size=page_size,
+        total_pages=ceil(len(blogs) / page_size),
+    )
+    content = BlogListResponse.model_validate(response).model_dump(mode="json", by_alias=True)
+    return JSONResponse(content).body
+
+
+def fast_path(blogs: list[Blog], page_size: int) -> bytes:
+    """serialize_rows + orjson"""
+    return ORJSONResponse({
+        "items": serialize_rows(blogs, BlogListItem),
+        "total": len(blogs),
+        "page": 1,
+        "page_size": page_size,
+        "total_pages": ceil(len(blogs) / page_size),
+    }).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blog list serialization benchmark")
+    parser.add_argument("--items", type=int, default=100, help="Items per page (default: 100)")
+    parser.add_argument("--rounds", type=int, default=1000, help="Timed rounds (default: 1000)")
+    args = parser.parse_args()
+
+    blogs = make_blogs(args.items)
+
+    default_body = default_path(blogs, args.items)
+    fast_body = fast_path(blogs, args.items)
+    if default_body != fast_body:
+        print("❌ Outputs differ")
+        print(f"default: {default_body[:300]!r}")
+        print(f"fast:    {fast_body[:300]!r}")
+        sys.exit(1)
+    print(f"✅ Byte-identical output ({len(fast_body):,} bytes)")
+
+    default_time = timeit.timeit(lambda: default_path(blogs, args.items), number=args.rounds)
+    fast_time = timeit.timeit(lambda: fast_path(blogs, args.items), number=args.rounds)
+
+    print(f"\n{args.items}-item blog page, {args.rounds} rounds")
+    print(f"  default (pydantic + json): {default_time / args.rounds * 1000:.3f} ms/page")
+    print(f"  fast (rows + orjson):      {fast_time / args.rounds * 1000:.3f} ms/page")
+    print(f"  speedup:                   {default_time / fast_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+GitHub Client Cache Check
+
+Drives services.github_client.GitHubClient against an httpx.MockTransport
+(no network, no token) and checks the ETag cache and rate limit handling:
+
+  1) 200 with an ETag        -> body returned and written to the disk cache
+  2) 304 Not Modified        -> If-None-Match was sent, cached body served
+  3) rate limit exhausted    -> no request is made; cached paths are served,
+                                uncached paths return None
+  4) 403 with remaining = 0  -> stale cached body served instead of nothing
+
+Usage:
+    python scripts/check_github_cache.py
+
+Exit code is 1 if any check fails.
+"""
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from services.github_client import GitHubClient
+
+
+REPO_PATH = "/repos/aion/demo"
+REPO_BODY = {"full_name": "aion/demo", "stargazers_count": 42}
+ETAG = '"demo-v1"'
+
+
+class FakeGitHub:
+    """Scripted GitHub API: each call pops the next (status, headers) for a path"""
+
+    def __init__(self):
+        self.script = {}
+        self.seen = []  # (path, If-None-Match) per request
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.seen.append((path, request.headers.get("if-none-match")))
+        status, headers = self.script[path].pop(0)
+        body = json.dumps(REPO_BODY) if status == 200 else ""
+        return httpx.Response(status, headers=headers, text=body)
+
+
+def rate_headers(remaining: int) -> dict:
+    return {
+        "x-ratelimit-limit": "60",
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-reset": str(int(time.time()) + 600),
+    }
+
+
+async def run_checks(cache_dir: str) -> bool:
+    fake = FakeGitHub()
+    client = GitHubClient(
+        base_url="https://api.github.test",
+        token=None,
+        cache_dir=cache_dir,
+        transport=httpx.MockTransport(fake.handler),
+    )
+    results = []
+
+    def check(name: str, passed: bool, detail: str = "") -> None:
+        results.append(passed)
+        print(f"{'✅' if passed else '❌'} {name}" + (f" ({detail})" if detail and not passed else ""))
+
+    try:
+        # 1) 200 -> cache write
+        fake.script[REPO_PATH] = [(200, {"etag": ETAG, **rate_headers(59)})]
+        first = await client.get_repo("aion", "demo")
+        cache_files = list(Path(cache_dir).glob("*.json"))
+        check("200 returns the body", first == REPO_BODY, repr(first))
+        check("200 writes one cache entry", len(cache_files) == 1, f"{len(cache_files)} files")
+        check("no temp files left behind", not list(Path(cache_dir).glob("*.tmp")))
+
+        # 2) 304 -> cache served
+        fake.script[REPO_PATH] = [(304, {"etag": ETAG, **rate_headers(59)})]
+        second = await client.get_repo("aion", "demo")
+        check("conditional request sends If-None-Match", fake.seen[-1] == (REPO_PATH, ETAG), repr(fake.seen[-1]))
+        check("304 serves the cached body", second == REPO_BODY, repr(second))
+        check("304 is counted as not modified", client.not_modified == 1, f"not_modified={client.not_modified}")
+
+        # 3) Rate limit exhausted -> no requests, cache or None
+        fake.script[REPO_PATH] = [(304, {"etag": ETAG, **rate_headers(0)})]
+        await client.get_repo("aion", "demo")
+        check("remaining=0 marks the client rate limited", client.is_rate_limited)
+
+        requests_before = len(fake.seen)
+        limited_cached = await client.get_repo("aion", "demo")
+        limited_uncached = await client.get_repo("aion", "other")
+        check("rate limited requests are not sent", len(fake.seen) == requests_before,
+              f"{len(fake.seen) - requests_before} sent")
+        check("rate limited cached path is served from cache", limited_cached == REPO_BODY, repr(limited_cached))
+        check("rate limited uncached path returns None", limited_uncached is None, repr(limited_uncached))
+
+        # 4) 403 with the limit exhausted -> stale cache
+        client.rate_remaining = None  # Reset has passed
+        fake.script[REPO_PATH] = [(403, rate_headers(0))]
+        stale = await client.get_repo("aion", "demo")
+        check("403 at the limit serves the stale cached body", stale == REPO_BODY, repr(stale))
+        check("403 at the limit is counted as rate limited", client.rate_limited == 3,
+              f"rate_limited={client.rate_limited}")
+    finally:
+        await client.aclose()
+
+    print(f"\n{sum(results)}/{len(results)} checks passed")
+    print(json.dumps(client.stats(), indent=2))
+    return all(results)
+
+
+def main() -> bool:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        return asyncio.run(run_checks(cache_dir))
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
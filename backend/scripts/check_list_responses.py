@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+List Response Regression Check
+
+The blog, project, activity and newsletter list endpoints do not load
+heavy text columns (defer / load_only with raiseload=True). This check
+renders each list endpoint twice against a throwaway SQLite database:
+
+  1) with the deferrals in place (the shipped code)
+  2) with every deferral swapped for a plain load (the previous behaviour)
+
+and asserts that both responses are byte-identical, that the shipped
+queries never load the deferred column, and that no raiseload fires while
+the list is serialized (the request would raise here).
+
+Usage:
+    python scripts/check_list_responses.py
+
+Exit code is 1 if any endpoint differs, errors or loads a deferred column.
+"""
+import asyncio
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import undefer
+from sqlalchemy.pool import NullPool
+
+import main
+from core.database import Base, get_db
+from models.activity import Activity, ActivityType
+from models.blog import Blog, BlogStatus
+from models.newsletter import Newsletter, NewsletterStatus
+from models.project import Project, ProjectStatus
+from models.user import User, UserRole
+from services import project_service, tag_service
+
+
+# (endpoint, deferred column that must not be selected)
+LIST_ENDPOINTS = [
+    ("/api/blog?page_size=100", "blogs.content"),
+    ("/api/blog?tag=python&page_size=100", "blogs.content"),
+    ("/api/projects?page_size=100", "projects.content"),
+    ("/api/projects?tech=python&page_size=100", "projects.content"),
+    ("/api/activity?page_size=100", "activities.description"),
+    ("/api/newsletter?page_size=100", "newsletters.content"),
+]
+
+
+async def seed(session_factory: async_sessionmaker) -> None:
+    """A few rows of every listed model, including drafts / archived rows"""
+    now = datetime.now(timezone.utc)
+    async with session_factory() as db:
+        user = User(email="admin@example.com", name="관리자", password_hash="x", role=UserRole.ADMIN)
+        db.add(user)
+        await db.flush()
+
+        for i in range(1, 31):
+            db.add(Blog(
+                title=f"FastAPI 성능 최적화 #{i}", slug=f"post-{i}", content="# 본문\n" * 200,
+                excerpt=f"요약 {i}", author_id=user.id, author_name=user.name,
+                status=BlogStatus.PUBLISHED if i % 5 else BlogStatus.DRAFT,
+                tags="Python,FastAPI" if i % 2 else "AI", view_count=i,
+                published_at=now - timedelta(days=i),
+            ))
+            db.add(Project(
+                name=f"Project {i}", slug=f"project-{i}", description=f"설명 {i}", content="## 상세\n" * 200,
+                tech_stack=["Python", "FastAPI"] if i % 2 else ["React"], category="web",
+                difficulty="Beginner", status=ProjectStatus.ARCHIVED if i % 7 == 0 else ProjectStatus.ACTIVE,
+            ))
+            db.add(Activity(
+                title=f"스터디 {i}", description="내용\n" * 200, activity_date=now - timedelta(days=i),
+                type=ActivityType.STUDY, participants=i, location="Seoul", images=[],
+                created_by=user.id, creator_name=user.name,
+            ))
+            db.add(Newsletter(
+                title=f"뉴스레터 {i}", summary=f"요약 {i}", content="<p>본문</p>" * 200,
+                status=NewsletterStatus.SENT if i % 3 else NewsletterStatus.DRAFT,
+                recipient_count=i, created_by=user.id,
+            ))
+        await db.commit()
+
+        await tag_service.rebuild_tag_index(db)
+        await project_service.rebuild_technology_index(db)
+
+
+@contextmanager
+def without_deferrals():
+    """Swap defer / load_only in the list code for options that load every column"""
+    loaders = {
+        "defer": lambda column, raiseload=False: undefer(column),
+        "load_only": lambda *columns, raiseload=False: undefer(columns[0]),
+    }
+    with mock.patch.multiple(sys.modules["services.blog_service"], defer=loaders["defer"]), \
+            mock.patch.multiple(sys.modules["services.project_service"], defer=loaders["defer"]), \
+            mock.patch.multiple(sys.modules["services.activity_service"], defer=loaders["defer"]), \
+            mock.patch.multiple(sys.modules["api.newsletter"], load_only=loaders["load_only"]):
+        yield
+
+
+def main_check() -> bool:
+    """Render every list endpoint with and without deferrals. Returns True if all match"""
+    directory = tempfile.TemporaryDirectory()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{directory.name}/lists.db", poolclass=NullPool)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await seed(session_factory)
+
+    asyncio.run(setup())
+
+    statements = []
+    event.listen(
+        engine.sync_engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    async def override_db():
+        async with session_factory() as session:
+            yield session
+            await session.commit()
+
+    main.app.dependency_overrides[get_db] = override_db
+    client = TestClient(main.app)  # No lifespan: workers and warm-ups stay off
+
+    ok = True
+    for endpoint, deferred_column in LIST_ENDPOINTS:
+        statements.clear()
+        try:
+            deferred = client.get(endpoint)
+        except Exception as e:  # raiseload fired while serializing
+            print(f"❌ {endpoint}: {type(e).__name__}: {e}")
+            ok = False
+            continue
+        # Row-loading SELECTs only: the pagination count wraps the query in a
+        # subquery whose column list is never read
+        loaded_columns = [
+            statement for statement in statements
+            if statement.lstrip().upper().startswith("SELECT")
+            and not statement.lstrip().upper().startswith("SELECT COUNT(")
+            and deferred_column in statement
+        ]
+
+        with without_deferrals():
+            full = client.get(endpoint)
+
+        if deferred.status_code != 200 or full.status_code != 200:
+            print(f"❌ {endpoint}: HTTP {deferred.status_code} (deferred) / {full.status_code} (full)")
+            ok = False
+        elif deferred.content != full.content:
+            print(f"❌ {endpoint}: responses differ")
+            print(f"   deferred: {deferred.content[:200]!r}")
+            print(f"   full:     {full.content[:200]!r}")
+            ok = False
+        elif loaded_columns:
+            print(f"❌ {endpoint}: {deferred_column} is still selected")
+            ok = False
+        else:
+            items = len(deferred.json()["items"])
+            print(f"✅ {endpoint}: identical ({items} items, {len(deferred.content):,} bytes, "
+                  f"{deferred_column} not loaded)")
+
+    main.app.dependency_overrides.pop(get_db, None)
+    asyncio.run(engine.dispose())
+    directory.cleanup()
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main_check() else 1)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Query Plan Regression Check
+
+Runs EXPLAIN on the hot status-filter queries and asserts that each one is
+served by its dedicated partial index (see alembic/versions/0001_*).
+
+Sequential scans are disabled for the check so the result does not depend
+on table size: the planner must be *able* to use the index for the exact
+predicate and sort order the services issue.
+
+Usage:
+    python scripts/check_query_plans.py
+
+Exit code is 1 if any query does not use the expected index.
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from core.database import engine
+from models.blog import Blog, BlogStatus
+from models.newsletter import Subscriber, NewsletterRequest, RequestStatus
+
+
+# (name, statement, expected index) - statements mirror the service queries
+HOT_QUERIES = [
+    (
+        "blog_service.list_blogs (published)",
+        select(Blog)
+        .where(Blog.status == BlogStatus.PUBLISHED)
+        .order_by(Blog.published_at.desc().nulls_last(), Blog.created_at.desc())
+        .limit(10),
+        "idx_blog_published_listing",
+    ),
+    (
+        "newsletter_service.get_active_subscriber_emails",
+        select(Subscriber.email).where(Subscriber.is_active == True),
+        "idx_subscriber_active_subscribed",
+    ),
+    (
+        "api.newsletter.get_subscribers (active)",
+        select(Subscriber)
+        .where(Subscriber.is_active == True)
+        .order_by(Subscriber.subscribed_at.desc())
+        .limit(100),
+        "idx_subscriber_active_subscribed",
+    ),
+    (
+        "newsletter_service.get_pending_requests",
+        select(NewsletterRequest)
+        .where(NewsletterRequest.status == RequestStatus.PENDING)
+        .order_by(NewsletterRequest.priority.desc(), NewsletterRequest.votes.desc())
+        .limit(100),
+        "idx_newsletter_request_pending_rank",
+    ),
+]
+
+
+def _index_names(plan: dict) -> set[str]:
+    """Collect index names used anywhere in a JSON plan tree"""
+    names = set()
+    if "Index Name" in plan:
+        names.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+async def check_plans() -> bool:
+    """Run EXPLAIN for every hot query. Returns True if all use their index"""
+    if engine.dialect.name != "postgresql":
+        print(f"❌ Query plan check requires PostgreSQL (got {engine.dialect.name})")
+        return False
+
+    all_ok = True
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+
+        for name, stmt, expected_index in HOT_QUERIES:
+            sql = str(stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            ))
+            result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+            used = _index_names(plan[0]["Plan"])
+            if expected_index in used:
+                print(f"✅ {name}: {expected_index}")
+            else:
+                all_ok = False
+                print(f"❌ {name}: expected {expected_index}, plan used {sorted(used) or 'no index'}")
+
+    await engine.dispose()
+    return all_ok
+
+
+def main():
+    ok = asyncio.run(check_plans())
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
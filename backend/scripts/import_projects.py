@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Batch Project Import Script
+
+Generates project information for a list of GitHub/demo URLs with AI and
+creates the projects in one transaction (same pipeline as
+POST /api/ai/generate-project-info/batch).
+
+Input file: one project per line, "<github_url>" or "<github_url> <demo_url>"
+or just a demo URL. Blank lines and lines starting with # are ignored.
+
+Usage:
+    python scripts/import_projects.py projects.txt            # dry run, prints results
+    python scripts/import_projects.py projects.txt --save     # create projects
+    python scripts/import_projects.py projects.txt --save --status in_progress
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.database import create_all_tables, engine
+from services import ai_job_service
+
+
+STATUS_ICONS = {
+    "generated": "📝",
+    "created": "✅",
+    "exists": "⏭️ ",
+    "duplicate": "🔁",
+    "failed": "❌",
+}
+
+
+def read_items(path: Path) -> list:
+    """Parse the URL list file into batch items"""
+    items = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        github_url = None
+        demo_url = None
+        for url in line.split():
+            if "github.com/" in url.lower() and github_url is None:
+                github_url = url
+            else:
+                demo_url = url
+        items.append({"github_url": github_url, "demo_url": demo_url})
+    return items
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Generate and import projects from GitHub/demo URLs")
+    parser.add_argument("file", type=Path, help="Text file with one project URL (pair) per line")
+    parser.add_argument("--save", action="store_true", help="Create the projects (default: dry run)")
+    parser.add_argument("--status", default="active", help="Status for created projects (default: active)")
+    parser.add_argument("--include-existing", action="store_true", help="Regenerate repos that already have a project")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the LLM completion cache")
+    args = parser.parse_args()
+
+    items = read_items(args.file)
+    if not items:
+        print("❌ No URLs found")
+        sys.exit(1)
+
+    await create_all_tables()
+
+    print(f"🚀 Processing {len(items)} projects ({'save' if args.save else 'dry run'})...")
+    result = await ai_job_service.run_generate_project_info_batch(
+        {
+            "items": items,
+            "save": args.save,
+            "status": args.status,
+            "skip_existing": not args.include_existing,
+            "use_cache": not args.no_cache,
+        },
+        None,
+    )
+
+    for outcome in result["items"]:
+        icon = STATUS_ICONS.get(outcome["status"], "•")
+        source = outcome["github_url"] or outcome["demo_url"]
+        detail = ""
+        if outcome["project"]:
+            detail = f" → {outcome['project']['name']}"
+        if outcome["slug"]:
+            detail += f" (/{outcome['slug']})"
+        if outcome["error"]:
+            detail += f" — {outcome['error']}"
+        print(f"  {icon} [{outcome['index'] + 1}] {source}{detail}")
+
+    print(f"\n📊 {result['counts']}")
+    await engine.dispose()
+
+    if result["counts"].get("failed"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+LLM Pipeline Load Test
+
+Drives the AI generation pipelines against the deterministic fake LLM
+backend (services/fake_llm.py), so throughput and latency can be measured
+offline without API spend. Requests go through the real shared LLM client,
+including its concurrency limit, retries, circuit breaker and single-flight.
+
+Pipelines:
+    preview         ai_service.generate_blog_content (short)
+    blog            ai_service.generate_blog_content (medium)
+    stream          ai_service.stream_blog_content (also reports time to first token)
+    newsletter      ai_service.generate_newsletter_content
+    project-info    ai_service.generate_project_info (demo URL only, no GitHub calls)
+    blog-generator  BlogGenerator.generate_blog_post (JSON format)
+    jobs            ai_job_service: submit + worker pool + persisted result
+                    (needs a PostgreSQL DATABASE_URL)
+    circuit         cancels the half-open circuit breaker's trial call, then
+                    checks that the next call is let through and closes it
+
+Usage:
+    python scripts/llm_load_test.py --pipeline preview --requests 200 --concurrency 50
+    python scripts/llm_load_test.py --pipeline stream --latency 0.2 --tps 100 --llm-concurrency 8
+    python scripts/llm_load_test.py --pipeline blog --same-prompt   # single-flight effect
+    python scripts/llm_load_test.py --pipeline circuit --requests 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline load test for AI generation pipelines")
+    parser.add_argument("--pipeline", default="preview",
+                        choices=["preview", "blog", "stream", "newsletter", "project-info", "blog-generator", "jobs", "circuit"])
+    parser.add_argument("--requests", type=int, default=100, help="Total requests (default: 100)")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent callers (default: 20)")
+    parser.add_argument("--latency", type=float, default=0.5, help="Fake time to first token, s (default: 0.5)")
+    parser.add_argument("--tps", type=float, default=200.0, help="Fake tokens/second, 0 = instant (default: 200)")
+    parser.add_argument("--output-tokens", type=int, default=400, help="Fake response length (default: 400)")
+    parser.add_argument("--llm-concurrency", type=int, default=None, help="Override LLM_MAX_CONCURRENCY")
+    parser.add_argument("--same-prompt", action="store_true", help="Send identical prompts (exercises single-flight)")
+    parser.add_argument("--cache", action="store_true", help="Enable the LLM completion cache")
+    return parser.parse_args()
+
+
+args = parse_args()
+
+# Configure the fake backend before any settings are loaded
+os.environ["LLM_BACKEND"] = "fake"
+os.environ["FAKE_LLM_LATENCY_SECONDS"] = str(args.latency)
+os.environ["FAKE_LLM_TOKENS_PER_SECOND"] = str(args.tps)
+os.environ["FAKE_LLM_OUTPUT_TOKENS"] = str(args.output_tokens)
+os.environ["LLM_CACHE_ENABLED"] = "true" if args.cache else "false"
+if args.llm_concurrency:
+    os.environ["LLM_MAX_CONCURRENCY"] = str(args.llm_concurrency)
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from services import ai_service
+from services.blog_generator import BlogGenerator
+from services.llm_client import llm_client
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+
+SAMPLE_BLOGS = [
+    {"title": f"샘플 블로그 {i}", "excerpt": "성능 최적화 사례를 정리했습니다.", "slug": f"sample-{i}"}
+    for i in range(5)
+]
+SAMPLE_PROJECTS = [
+    {"name": f"샘플 프로젝트 {i}", "description": "AI 기반 자동화 도구", "slug": f"project-{i}"}
+    for i in range(5)
+]
+
+
+def make_request(pipeline: str, index: int):
+    """Return a zero-argument coroutine factory for one request"""
+    topic = "부하 테스트" if args.same_prompt else f"부하 테스트 {index}"
+
+    if pipeline == "preview":
+        return lambda: ai_service.generate_blog_content(topic=topic, length="short")
+    if pipeline == "blog":
+        return lambda: ai_service.generate_blog_content(topic=topic, length="medium")
+    if pipeline == "newsletter":
+        period = 7 if args.same_prompt else 7 + index % 23
+        return lambda: ai_service.generate_newsletter_content(
+            period_days=period, blog_posts=SAMPLE_BLOGS, projects=SAMPLE_PROJECTS,
+        )
+    if pipeline == "project-info":
+        return lambda: ai_service.generate_project_info(demo_url=f"https://example.com/{topic}")
+    if pipeline == "blog-generator":
+        return lambda: BlogGenerator(db=None).generate_blog_post(topic=topic)
+    raise ValueError(pipeline)
+
+
+async def run_stream(topic: str) -> float:
+    """Consume one stream; returns time to first content event"""
+    started = time.monotonic()
+    first_token = None
+    async for event in ai_service.stream_blog_content(topic=topic, length="short"):
+        if first_token is None and event["event"] in ("title", "content"):
+            first_token = time.monotonic() - started
+    return first_token or 0.0
+
+
+async def run_jobs(latencies: list, errors: list) -> None:
+    """Submit jobs through ai_job_service and wait for persisted results"""
+    from core.database import AsyncSessionLocal, create_all_tables, engine
+    from models.ai_job import AIJobStatus
+    from services import ai_job_service
+
+    await create_all_tables()
+    ai_job_service.job_pool.start()
+
+    async def one(index: int):
+        topic = "부하 테스트" if args.same_prompt else f"부하 테스트 {index}"
+        started = time.monotonic()
+        async with AsyncSessionLocal() as db:
+            job = await ai_job_service.submit_job(db, "preview", {"topic": topic})
+        while True:
+            job = await ai_job_service.wait_for_job(job.id, timeout=30)
+            if job.status in (AIJobStatus.SUCCEEDED, AIJobStatus.FAILED):
+                break
+        if job.status == AIJobStatus.FAILED:
+            errors.append(job.error)
+        else:
+            latencies.append(time.monotonic() - started)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def limited(index: int):
+        async with semaphore:
+            await one(index)
+
+    await asyncio.gather(*(limited(i) for i in range(args.requests)))
+    await ai_job_service.job_pool.stop()
+    await engine.dispose()
+
+
+async def run_circuit_check(latencies: list, errors: list) -> None:
+    """Cancel a half-open trial call (job timeout, SSE disconnect) and check the breaker recovers"""
+    breaker = llm_client.breaker
+    messages = [{"role": "user", "content": "circuit breaker check"}]
+
+    # Half-open: the reset period has just passed
+    breaker.failures = breaker.failure_threshold
+    breaker.opened_at = time.monotonic() - breaker.reset_seconds
+
+    trial = asyncio.create_task(llm_client.chat(model="gpt-4o-mini", messages=messages))
+    await asyncio.sleep(args.latency / 2)  # Trial is waiting on the backend
+    trial.cancel()
+    await asyncio.gather(trial, return_exceptions=True)
+    print(f"   cancelled half-open trial, circuit={breaker.state}")
+
+    # One call must be let through as the new trial and close the circuit;
+    # the rest then run normally
+    for index in range(args.requests):
+        started = time.monotonic()
+        try:
+            await llm_client.chat(model="gpt-4o-mini", messages=messages)
+            latencies.append(time.monotonic() - started)
+        except Exception as e:
+            errors.append(f"call {index + 1} after the cancelled trial: {e.__class__.__name__}: {e}")
+
+    if breaker.state != "closed":
+        errors.append(f"circuit is still {breaker.state} after the cancelled trial")
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))] if values else 0.0
+
+
+async def main():
+    latencies: list = []
+    first_tokens: list = []
+    errors: list = []
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(index: int):
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                if args.pipeline == "stream":
+                    topic = "부하 테스트" if args.same_prompt else f"부하 테스트 {index}"
+                    first_tokens.append(await run_stream(topic))
+                else:
+                    await make_request(args.pipeline, index)()
+                latencies.append(time.monotonic() - started)
+            except Exception as e:
+                errors.append(f"{e.__class__.__name__}: {e}")
+
+    print(f"🚀 {args.requests} x {args.pipeline} | callers={args.concurrency} "
+          f"llm_concurrency={llm_client.max_concurrency} | fake latency={args.latency}s tps={args.tps}")
+
+    started = time.monotonic()
+    if args.pipeline == "jobs":
+        await run_jobs(latencies, errors)
+    elif args.pipeline == "circuit":
+        await run_circuit_check(latencies, errors)
+    else:
+        await asyncio.gather(*(one(i) for i in range(args.requests)))
+    elapsed = time.monotonic() - started
+
+    print(f"\n⏱  wall time:   {elapsed:.2f}s")
+    print(f"📈 throughput:  {len(latencies) / elapsed:.1f} req/s")
+    print(f"   latency:     p50={percentile(latencies, 0.5):.3f}s "
+          f"p95={percentile(latencies, 0.95):.3f}s max={max(latencies, default=0):.3f}s")
+    if first_tokens:
+        print(f"   first token: p50={percentile(first_tokens, 0.5):.3f}s p95={percentile(first_tokens, 0.95):.3f}s")
+    print(f"   backend calls: {llm_client.backend.requests} "
+          f"(single-flight shared {ai_service.completion_flights.shared})")
+
+    stats = llm_client.stats()
+    print(f"   llm client:  calls={stats['calls']} retries={stats['retries']} "
+          f"failures={stats['failures']} circuit={stats['circuit_state']}")
+
+    if errors:
+        print(f"\n❌ {len(errors)} errors, e.g. {errors[0]}")
+        sys.exit(1)
+    print("\n✅ All requests succeeded")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.database import AsyncSessionLocal, create_all_tables
 from models.project import Project, ProjectStatus
+from services import project_service
 from loguru import logger
 
 
@@ -450,6 +451,7 @@ async def migrate_projects():
                 logger.info(f"  [{idx}/{len(PROJECTS_DATA)}] Added: {project.name}")
 
             await db.commit()
+            await project_service.rebuild_technology_index(db)
             logger.success(f"✅ Successfully migrated {len(PROJECTS_DATA)} projects!")
 
         except Exception as e:
@@ -24,6 +24,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from services.blog_scheduler import create_blog_scheduler
 from services.newsletter_scheduler import create_newsletter_scheduler
+from services.cluster_scheduler import cluster_scheduler
+from services import related_service
 from loguru import logger
 
 
@@ -131,6 +133,9 @@ async def main_async():
             minute=0
         )
 
+        # Nightly related-posts rebuild (runs on the task queue workers)
+        related_service.register_rebuild_job(cluster_scheduler)
+
         print("✅ Schedulers started successfully!\n")
         print("Press Ctrl+C to stop\n")
 
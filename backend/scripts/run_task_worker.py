@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Task Worker Runner
+
+Runs a background task worker (services.task_worker) as its own process.
+Start as many as needed — workers share the tasks table and claim rows with
+FOR UPDATE SKIP LOCKED, so throughput scales with the number of processes.
+Set TASK_WORKER_EMBEDDED=false on the API when all work should run here.
+
+Usage:
+    # One worker with the default concurrency (TASK_WORKER_CONCURRENCY)
+    python scripts/run_task_worker.py
+
+    # More tasks per process
+    python scripts/run_task_worker.py --concurrency 8
+
+    # Enqueue a task and exit
+    python scripts/run_task_worker.py --enqueue github.sync_stars
+"""
+import argparse
+import asyncio
+import json
+import signal
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.database import AsyncSessionLocal, create_all_tables, engine
+from services import task_queue
+from services.task_worker import create_task_worker
+from loguru import logger
+
+
+async def enqueue(name: str, payload: str, priority: int) -> None:
+    """Enqueue one task"""
+    import services.task_handlers  # noqa: F401  (registers TASK_HANDLERS)
+
+    if name not in task_queue.TASK_HANDLERS:
+        print(f"❌ Unknown task: {name} (known: {', '.join(sorted(task_queue.TASK_HANDLERS))})")
+        sys.exit(1)
+
+    async with AsyncSessionLocal() as db:
+        task = await task_queue.enqueue_task(db, name, json.loads(payload), priority=priority)
+    print(f"✅ Enqueued {name} (ID: {task.id})")
+
+
+async def run(concurrency: int) -> None:
+    """Run the worker until SIGINT/SIGTERM, then drain"""
+    worker = create_task_worker(concurrency)
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    worker.start()
+    print(f"✨ Task worker {worker.worker_id} running (concurrency={worker.concurrency}). Press Ctrl+C to stop.")
+
+    await stop.wait()
+    print("\n👋 Stopping, waiting for running tasks...")
+    await worker.stop()
+
+    stats = worker.stats()
+    print(f"📊 succeeded={stats['succeeded']} retried={stats['retried']} failed={stats['failed']}")
+
+
+async def main_async():
+    """Parse arguments and run"""
+    parser = argparse.ArgumentParser(description="AI ON background task worker")
+    parser.add_argument("--concurrency", type=int, default=None, help="Tasks running at once (default: TASK_WORKER_CONCURRENCY)")
+    parser.add_argument("--enqueue", metavar="NAME", help="Enqueue a task instead of running a worker")
+    parser.add_argument("--payload", default="{}", help="JSON payload for --enqueue (default: {})")
+    parser.add_argument("--priority", type=int, default=0, help="Priority for --enqueue (default: 0)")
+    args = parser.parse_args()
+
+    await create_all_tables()
+
+    try:
+        if args.enqueue:
+            await enqueue(args.enqueue, args.payload, args.priority)
+        else:
+            await run(args.concurrency)
+    except Exception as e:
+        logger.error(f"Task worker failed: {e}", exc_info=True)
+        print(f"\n❌ Error: {e}\n")
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+
+def main():
+    """Entry point"""
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
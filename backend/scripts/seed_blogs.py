@@ -13,6 +13,7 @@ from core.database import AsyncSessionLocal
 from models import blog, user, project, newsletter  # Import all models to register relationships
 from models.blog import Blog
 from models.user import User
+from services import tag_service
 
 
 async def seed_blogs():
@@ -229,6 +230,7 @@ TypeScript의 타입 가드를 활용한 안전한 에러 처리를 구현합니
                 print(f"  ✅ '{blog.title}' 생성")
 
             await db.commit()
+            await tag_service.rebuild_tag_index(db)
             print(f"\n🎉 총 {len(blogs)}개의 블로그 포스트가 생성되었습니다!")
 
         except Exception as e:
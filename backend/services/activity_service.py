@@ -2,20 +2,22 @@
 Activity Service
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, update
+from sqlalchemy.orm import defer
 from typing import List, Optional
 from datetime import datetime
 from loguru import logger
 
 from models.activity import Activity, ActivityType
 from schemas.activity import ActivityCreate, ActivityUpdate
+from services import feed_service
 
 
 async def create_activity(
     db: AsyncSession,
     activity_data: ActivityCreate,
-    creator_id: int
+    creator_id: int,
+    creator_name: Optional[str] = None
 ) -> Activity:
     """
     Create a new activity
@@ -24,6 +26,7 @@ async def create_activity(
         db: Database session
         activity_data: Activity creation data
         creator_id: Creator user ID
+        creator_name: Creator display name (looked up on insert if omitted)
 
     Returns:
         Created activity
@@ -37,21 +40,17 @@ async def create_activity(
         participants=activity_data.participants,
         location=activity_data.location,
         images=activity_data.images or [],
-        created_by=creator_id
+        created_by=creator_id,
+        creator_name=creator_name
     )
 
     db.add(new_activity)
+    await feed_service.enqueue_regenerate(db)
     await db.commit()
     await db.refresh(new_activity)
 
-    # Eagerly load creator relationship
-    result = await db.execute(
-        select(Activity).options(selectinload(Activity.creator)).where(Activity.id == new_activity.id)
-    )
-    activity_with_creator = result.scalar_one()
-
-    logger.info(f"Activity created: {activity_with_creator.title} (ID: {activity_with_creator.id})")
-    return activity_with_creator
+    logger.info(f"Activity created: {new_activity.title} (ID: {new_activity.id})")
+    return new_activity
 
 
 async def get_activity_by_id(db: AsyncSession, activity_id: int) -> Optional[Activity]:
@@ -66,7 +65,7 @@ async def get_activity_by_id(db: AsyncSession, activity_id: int) -> Optional[Act
         Activity if found, None otherwise
     """
     result = await db.execute(
-        select(Activity).options(selectinload(Activity.creator)).where(Activity.id == activity_id)
+        select(Activity).where(Activity.id == activity_id)
     )
     return result.scalar_one_or_none()
 
@@ -89,8 +88,9 @@ async def list_activities(
     Returns:
         Tuple of (activity list, total count)
     """
-    # Build query with eager loading
-    query = select(Activity).options(selectinload(Activity.creator))
+    # Build query
+    # List items show neither the description nor the creator, so neither is loaded
+    query = select(Activity).options(defer(Activity.description, raiseload=True))
 
     if activity_type:
         query = query.where(Activity.type == activity_type)
@@ -149,6 +149,7 @@ async def update_activity(
     if activity_data.images is not None:
         activity.images = activity_data.images
 
+    await feed_service.enqueue_regenerate(db)
     await db.commit()
     await db.refresh(activity)
 
@@ -168,6 +169,26 @@ async def delete_activity(db: AsyncSession, activity: Activity) -> None:
     activity_title = activity.title
 
     await db.delete(activity)
+    await feed_service.enqueue_regenerate(db)
     await db.commit()
 
     logger.info(f"Activity deleted: {activity_title} (ID: {activity_id})")
+
+
+async def sync_creator_name(db: AsyncSession, creator_id: int, creator_name: str) -> None:
+    """
+    Update the denormalised creator name on all activities of a user
+
+    The caller commits (together with the user rename).
+
+    Args:
+        db: Database session
+        creator_id: Creator user ID
+        creator_name: New display name
+    """
+    await db.execute(
+        update(Activity)
+        .where(Activity.created_by == creator_id)
+        # Keep updated_at: a rename is not an edit of the activity
+        .values(creator_name=creator_name, updated_at=Activity.updated_at)
+    )
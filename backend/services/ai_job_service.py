@@ -0,0 +1,745 @@
+"""
+AI Job Service
+
+Runs AI content generation in a bounded background worker pool so HTTP
+requests return a job id immediately instead of waiting on the LLM.
+Jobs and their results are persisted in the ai_jobs table; pending and
+stale running jobs are picked up again after a restart.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from loguru import logger
+
+from core.config import settings
+from core.database import AsyncSessionLocal
+from models.ai_job import AIJob, AIJobStatus
+from models.blog import Blog, BlogStatus
+from models.newsletter import Newsletter, NewsletterStatus
+from schemas.blog import BlogCreate
+from schemas.project import ProjectCreate
+from services import ai_service, blog_service, project_service, task_queue
+from services.task_worker import task_worker
+from utils import content_generator
+
+
+JobHandler = Callable[[Dict[str, Any], Optional[int]], Awaitable[Dict[str, Any]]]
+
+
+async def save_blog_draft(blog_content: Dict[str, Any], user_id: Optional[int]) -> Blog:
+    """
+    Save generated blog content as a DRAFT post
+
+    Args:
+        blog_content: Parsed generation result (title, excerpt, content, tags)
+        user_id: Author user ID
+
+    Returns:
+        Created blog post
+    """
+    async with AsyncSessionLocal() as db:
+        blog = await blog_service.create_blog(
+            db,
+            BlogCreate(
+                title=blog_content["title"][:200],
+                content=blog_content["content"],
+                excerpt=blog_content["excerpt"][:500] or None,
+                tags=blog_content["tags"] or None,
+                status=BlogStatus.DRAFT,
+            ),
+            author_id=user_id,
+        )
+
+    logger.info(f"Generated blog saved as draft: {blog.title} (ID: {blog.id})")
+    return blog
+
+
+# ============ Job Handlers ============
+#
+# Handlers open short-lived sessions around their DB reads/writes only, so no
+# pooled connection is held while the LLM call is in flight. The synchronous
+# /api/ai endpoints call the same handlers directly.
+
+async def run_generate_blog(params: Dict[str, Any], user_id: Optional[int]) -> Dict[str, Any]:
+    """
+    Generate blog content (optionally saved as a draft)
+
+    Args:
+        params: GenerateBlogRequest payload
+        user_id: Requesting admin user ID (draft author)
+
+    Returns:
+        Dict shaped like GeneratedBlogResponse
+    """
+    style = params.get("style", "technical")
+    length = params.get("length", "medium")
+    use_cache = params.get("use_cache", True)
+
+    # created_by is SET NULL when the requesting user is deleted; fail before the LLM call
+    if params.get("save_as_draft", True) and user_id is None:
+        raise ValueError("요청한 사용자가 삭제되어 초안을 저장할 수 없습니다. save_as_draft=false로 다시 요청하세요.")
+
+    if params.get("project_id"):
+        async with AsyncSessionLocal() as db:
+            project_data = await content_generator.get_project_data(db, params["project_id"])
+        blog_content = await content_generator.generate_blog_from_project_data(
+            project_data, style=style, length=length, use_cache=use_cache,
+        )
+    elif params.get("topic"):
+        blog_content = await ai_service.generate_blog_content(
+            topic=params["topic"], style=style, length=length, use_cache=use_cache,
+        )
+    else:
+        raise ValueError("project_id 또는 topic 중 하나를 제공해야 합니다.")
+
+    blog_id = None
+    blog_status = "preview"
+
+    if params.get("save_as_draft", True):
+        blog = await save_blog_draft(blog_content, user_id)
+        blog_id = blog.id
+        blog_status = blog.status.value
+
+    return {
+        "blog_id": blog_id,
+        "title": blog_content["title"],
+        "excerpt": blog_content["excerpt"],
+        "content": blog_content["content"],
+        "tags": blog_content["tags"],
+        "status": blog_status,
+    }
+
+
+async def run_generate_newsletter(params: Dict[str, Any], user_id: Optional[int]) -> Dict[str, Any]:
+    """
+    Generate newsletter content from recent posts/projects
+
+    Args:
+        params: GenerateNewsletterRequest payload
+        user_id: Requesting admin user ID
+
+    Returns:
+        Dict shaped like GeneratedNewsletterResponse
+    """
+    period_days = params.get("period_days", 7)
+
+    collected = await content_generator.collect_recent_content(period_days=period_days)
+    newsletter_content = await content_generator.generate_newsletter_from_collected_content(
+        collected, period_days=period_days, use_cache=params.get("use_cache", True),
+    )
+
+    newsletter_id = None
+    newsletter_status = "preview"
+
+    if params.get("save_as_draft", True):
+        async with AsyncSessionLocal() as db:
+            newsletter = Newsletter(
+                title=newsletter_content["title"],
+                content=newsletter_content["content"],
+                status=NewsletterStatus.DRAFT,
+                created_by=user_id,
+                is_auto_generated=True,
+            )
+            db.add(newsletter)
+            await db.commit()
+            await db.refresh(newsletter)
+
+            newsletter_id = newsletter.id
+            newsletter_status = newsletter.status.value
+
+        logger.info(f"Generated newsletter saved as draft: {newsletter_content['title']} (ID: {newsletter_id})")
+
+    return {
+        "newsletter_id": newsletter_id,
+        "title": newsletter_content["title"],
+        "content": newsletter_content["content"],
+        "status": newsletter_status,
+    }
+
+
+async def run_preview(params: Dict[str, Any], user_id: Optional[int]) -> Dict[str, Any]:
+    """
+    Generate a short blog preview (never saved)
+
+    Args:
+        params: ContentPreviewRequest payload
+        user_id: Requesting admin user ID (unused)
+
+    Returns:
+        Dict with title, excerpt, content_preview, tags
+    """
+    blog_content = await ai_service.generate_blog_content(
+        topic=params["topic"],
+        style=params.get("style", "technical"),
+        length="short",  # Always use short for preview
+        use_cache=params.get("use_cache", True),
+    )
+
+    return {
+        "title": blog_content["title"],
+        "excerpt": blog_content["excerpt"],
+        "content_preview": blog_content["content"][:500] + "...",
+        "tags": blog_content["tags"],
+    }
+
+
+async def run_generate_project_info(params: Dict[str, Any], user_id: Optional[int]) -> Dict[str, Any]:
+    """
+    Generate project information from GitHub/Demo URL
+
+    Args:
+        params: GenerateProjectInfoRequest payload
+        user_id: Requesting admin user ID (unused)
+
+    Returns:
+        Dict shaped like GeneratedProjectInfoResponse
+    """
+    if not params.get("github_url") and not params.get("demo_url"):
+        raise ValueError("GitHub URL 또는 Demo URL 중 하나를 제공해야 합니다.")
+
+    project_info = await ai_service.generate_project_info(
+        github_url=params.get("github_url"),
+        demo_url=params.get("demo_url"),
+        use_cache=params.get("use_cache", True),
+    )
+
+    logger.info(f"Successfully generated project info: {project_info['name']}")
+
+    return {
+        "name": project_info["name"],
+        "description": project_info["description"],
+        "content": project_info["content"],
+        "category": project_info["category"],
+        "tech_stack": project_info["tech_stack"],
+    }
+
+
+def _batch_outcome(index: int, item: Dict[str, Any], status: str, **fields: Any) -> Dict[str, Any]:
+    """Per-item result of a project info batch"""
+    outcome = {
+        "index": index,
+        "github_url": item.get("github_url"),
+        "demo_url": item.get("demo_url"),
+        "status": status,
+        "project_id": None,
+        "slug": None,
+        "project": None,
+        "error": None,
+    }
+    outcome.update(fields)
+    return outcome
+
+
+async def _generate_batch_item(
+    index: int,
+    item: Dict[str, Any],
+    use_cache: bool,
+    semaphore: asyncio.Semaphore,
+) -> Dict[str, Any]:
+    """Generate project info for one batch item, capturing errors as item status"""
+    github_url = item.get("github_url")
+    demo_url = item.get("demo_url")
+    outcome = _batch_outcome(index, item, "failed")
+
+    if not github_url and not demo_url:
+        outcome["error"] = "GitHub URL 또는 Demo URL 중 하나를 제공해야 합니다."
+        return outcome
+
+    async with semaphore:
+        try:
+            project_info = await ai_service.generate_project_info(
+                github_url=github_url,
+                demo_url=demo_url,
+                use_cache=use_cache,
+            )
+        except Exception as e:
+            logger.warning(f"Batch item {index} failed ({github_url or demo_url}): {e}")
+            outcome["error"] = str(e) or e.__class__.__name__
+            return outcome
+
+    outcome["status"] = "generated"
+    outcome["project"] = {
+        "name": project_info["name"],
+        "description": project_info["description"],
+        "content": project_info["content"],
+        "category": project_info["category"],
+        "tech_stack": project_info["tech_stack"],
+    }
+    return outcome
+
+
+async def run_generate_project_info_batch(params: Dict[str, Any], user_id: Optional[int]) -> Dict[str, Any]:
+    """
+    Generate project information for many GitHub/Demo URLs
+
+    Items are processed concurrently (at most PROJECT_BATCH_CONCURRENCY at a
+    time; LLM calls are further bounded by the shared LLM client). GitHub
+    URLs already registered as projects, and repeats within the batch, are
+    skipped. With save=True every generated project is inserted in one
+    transaction.
+
+    Args:
+        params: GenerateProjectInfoBatchRequest payload
+        user_id: Requesting admin user ID (unused)
+
+    Returns:
+        Dict with per-item results and status counts
+    """
+    items = params.get("items") or []
+    if not items:
+        raise ValueError("items가 비어 있습니다.")
+    if len(items) > settings.PROJECT_BATCH_MAX_ITEMS:
+        raise ValueError(f"한 번에 최대 {settings.PROJECT_BATCH_MAX_ITEMS}개까지 처리할 수 있습니다.")
+
+    use_cache = params.get("use_cache", True)
+    skip_existing = params.get("skip_existing", True)
+
+    # Repeats within the batch and repositories that are already projects
+    github_urls = [item["github_url"] for item in items if item.get("github_url")]
+    existing = {}
+    if skip_existing and github_urls:
+        async with AsyncSessionLocal() as db:
+            existing = await project_service.get_projects_by_github_urls(db, github_urls)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    pending = []
+    seen = set()
+    for index, item in enumerate(items):
+        key = project_service.normalize_github_url(item["github_url"]) if item.get("github_url") else None
+        if key and key in existing:
+            project = existing[key]
+            results[index] = _batch_outcome(index, item, "exists", project_id=project.id, slug=project.slug)
+        elif key and key in seen:
+            results[index] = _batch_outcome(index, item, "duplicate")
+        else:
+            if key:
+                seen.add(key)
+            pending.append((index, item))
+
+    semaphore = asyncio.Semaphore(settings.PROJECT_BATCH_CONCURRENCY)
+    generated = await asyncio.gather(*(
+        _generate_batch_item(index, item, use_cache, semaphore)
+        for index, item in pending
+    ))
+    for outcome in generated:
+        results[outcome["index"]] = outcome
+
+    # Insert everything that was generated, all-or-nothing
+    if params.get("save"):
+        to_save = []
+        projects_data = []
+        for outcome in generated:
+            if outcome["status"] != "generated":
+                continue
+            try:
+                projects_data.append(ProjectCreate(
+                    name=outcome["project"]["name"][:200],
+                    description=outcome["project"]["description"][:500] or None,
+                    content=outcome["project"]["content"],
+                    github_url=outcome["github_url"],
+                    demo_url=outcome["demo_url"],
+                    tech_stack=outcome["project"]["tech_stack"],
+                    status=params.get("status") or "active",
+                    category=outcome["project"]["category"][:100] or None,
+                ))
+            except ValidationError as e:
+                outcome["status"] = "failed"
+                outcome["error"] = f"생성된 프로젝트 정보가 올바르지 않습니다: {e.errors()[0]['msg']}"
+                continue
+            to_save.append(outcome)
+
+        if to_save:
+            try:
+                async with AsyncSessionLocal() as db:
+                    projects = await project_service.create_projects_bulk(db, projects_data)
+            except Exception as e:
+                logger.error(f"Batch project insert failed, nothing was saved: {e}")
+                for outcome in to_save:
+                    outcome["status"] = "failed"
+                    outcome["error"] = f"저장 실패: {e}"
+            else:
+                for outcome, project in zip(to_save, projects):
+                    outcome["status"] = "created"
+                    outcome["project_id"] = project.id
+                    outcome["slug"] = project.slug
+
+    counts: Dict[str, int] = {}
+    for outcome in results:
+        counts[outcome["status"]] = counts.get(outcome["status"], 0) + 1
+
+    logger.info(f"Project info batch finished: {len(items)} items, {counts}")
+
+    return {
+        "total": len(items),
+        "counts": counts,
+        "items": results,
+    }
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    "generate-blog": run_generate_blog,
+    "generate-newsletter": run_generate_newsletter,
+    "preview": run_preview,
+    "generate-project-info": run_generate_project_info,
+    "generate-project-info-batch": run_generate_project_info_batch,
+}
+
+# Per-kind overrides of AI_JOB_TIMEOUT_SECONDS (keep below AI_JOB_STALE_SECONDS)
+JOB_TIMEOUTS: Dict[str, int] = {
+    "generate-project-info-batch": settings.PROJECT_BATCH_TIMEOUT_SECONDS,
+}
+
+
+# ============ Job Persistence ============
+
+async def submit_job(
+    db: AsyncSession,
+    kind: str,
+    params: Dict[str, Any],
+    user_id: Optional[int] = None,
+) -> AIJob:
+    """
+    Persist a new job and hand it to the worker pool (or, with
+    AI_JOB_RUNNER=queue, to the durable task queue)
+
+    Args:
+        db: Database session
+        kind: Job kind (key of JOB_HANDLERS)
+        params: JSON-serialisable request payload
+        user_id: Requesting user ID
+
+    Returns:
+        Created job (PENDING)
+    """
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown AI job kind: {kind}")
+
+    job = AIJob(kind=kind, params=params, status=AIJobStatus.PENDING, created_by=user_id)
+    db.add(job)
+
+    if settings.AI_JOB_RUNNER == "queue":
+        # Job row and its task are committed together
+        await db.flush()
+        await task_queue.enqueue_task(db, "ai.job", {"job_id": job.id}, commit=False)
+        await db.commit()
+        await db.refresh(job)
+        task_worker.notify()
+    else:
+        await db.commit()
+        await db.refresh(job)
+        job_pool.enqueue(job.id)
+
+    logger.info(f"AI job submitted: {job.kind} (ID: {job.id})")
+    return job
+
+
+async def get_job(db: AsyncSession, job_id: str) -> Optional[AIJob]:
+    """
+    Get job by ID
+
+    Args:
+        db: Database session
+        job_id: Job ID
+
+    Returns:
+        Job or None if not found
+    """
+    result = await db.execute(select(AIJob).where(AIJob.id == job_id))
+    return result.scalar_one_or_none()
+
+
+async def list_jobs(
+    db: AsyncSession,
+    status: Optional[AIJobStatus] = None,
+    limit: int = 50,
+) -> List[AIJob]:
+    """
+    List recent jobs
+
+    Args:
+        db: Database session
+        status: Optional status filter
+        limit: Maximum number of jobs
+
+    Returns:
+        Jobs, newest first
+    """
+    stmt = select(AIJob)
+    if status:
+        stmt = stmt.where(AIJob.status == status)
+    stmt = stmt.order_by(AIJob.created_at.desc()).limit(limit)
+
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def wait_for_job(job_id: str, timeout: float = 0) -> Optional[AIJob]:
+    """
+    Long-poll a job until it finishes or `timeout` seconds pass
+
+    Completion in this process wakes the waiter immediately; jobs run by
+    another process are noticed by re-reading the row every few seconds.
+    No DB connection is held while waiting.
+
+    Args:
+        job_id: Job ID
+        timeout: Maximum seconds to wait (0 = read once)
+
+    Returns:
+        Latest job state, or None if not found
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            job = await get_job(db, job_id)
+
+        remaining = deadline - loop.time()
+        if job is None or job.status in (AIJobStatus.SUCCEEDED, AIJobStatus.FAILED) or remaining <= 0:
+            return job
+
+        await job_pool.wait_done(job_id, min(remaining, 3.0))
+
+
+async def _claim_job(job_id: str) -> Optional[AIJob]:
+    """Atomically move a PENDING job to RUNNING. Returns None if already taken"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(AIJob)
+            .where(AIJob.id == job_id, AIJob.status == AIJobStatus.PENDING)
+            .values(status=AIJobStatus.RUNNING, started_at=datetime.now(timezone.utc))
+        )
+        await db.commit()
+
+        if result.rowcount != 1:
+            return None
+
+        return await get_job(db, job_id)
+
+
+async def reset_interrupted_job(job_id: str) -> bool:
+    """
+    Make a RUNNING job PENDING again so it can be re-claimed
+
+    Only safe when the caller knows no other worker is running the job
+    (e.g. it holds the job's task queue lease).
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        True if the job was reset
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(AIJob)
+            .where(AIJob.id == job_id, AIJob.status == AIJobStatus.RUNNING)
+            .values(status=AIJobStatus.PENDING, started_at=None)
+        )
+        await db.commit()
+
+    if result.rowcount:
+        logger.warning(f"Re-claiming interrupted AI job {job_id}")
+    return result.rowcount == 1
+
+
+async def _finish_job(
+    job_id: str,
+    result: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None,
+) -> None:
+    """Persist a job's outcome"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(AIJob)
+            .where(AIJob.id == job_id)
+            .values(
+                status=AIJobStatus.FAILED if error else AIJobStatus.SUCCEEDED,
+                result=result,
+                error=error,
+                finished_at=datetime.now(timezone.utc),
+            )
+        )
+        await db.commit()
+
+
+async def execute_job(job_id: str) -> None:
+    """
+    Claim and run a single job, persisting its result or error
+
+    Args:
+        job_id: Job ID
+    """
+    job = await _claim_job(job_id)
+    if job is None:
+        return
+
+    handler = JOB_HANDLERS.get(job.kind)
+    timeout = JOB_TIMEOUTS.get(job.kind, settings.AI_JOB_TIMEOUT_SECONDS)
+    logger.info(f"AI job started: {job.kind} (ID: {job.id})")
+
+    try:
+        if handler is None:
+            raise ValueError(f"Unknown AI job kind: {job.kind}")
+
+        result = await asyncio.wait_for(
+            handler(job.params or {}, job.created_by),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        logger.error(f"AI job timed out: {job.kind} (ID: {job.id})")
+        await _finish_job(job.id, error=f"Timed out after {timeout}s")
+    except Exception as e:
+        logger.error(f"AI job failed: {job.kind} (ID: {job.id}): {e}")
+        await _finish_job(job.id, error=str(e) or e.__class__.__name__)
+    else:
+        await _finish_job(job.id, result=result)
+        logger.info(f"AI job succeeded: {job.kind} (ID: {job.id})")
+
+
+async def recover_jobs() -> List[str]:
+    """
+    Reset stale RUNNING jobs and return the IDs of all PENDING jobs
+
+    RUNNING jobs whose started_at is older than AI_JOB_STALE_SECONDS are
+    assumed to belong to a worker that died and are made PENDING again.
+
+    Returns:
+        Pending job IDs, oldest first
+    """
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.AI_JOB_STALE_SECONDS)
+
+    async with AsyncSessionLocal() as db:
+        reset = await db.execute(
+            update(AIJob)
+            .where(AIJob.status == AIJobStatus.RUNNING, AIJob.started_at < stale_before)
+            .values(status=AIJobStatus.PENDING, started_at=None)
+        )
+        if reset.rowcount:
+            logger.warning(f"Re-queued {reset.rowcount} stale AI job(s)")
+
+        result = await db.execute(
+            select(AIJob.id)
+            .where(AIJob.status == AIJobStatus.PENDING)
+            .order_by(AIJob.created_at)
+        )
+        job_ids = list(result.scalars().all())
+        await db.commit()
+
+    return job_ids
+
+
+# ============ Worker Pool ============
+
+class AIJobWorkerPool:
+    """Bounded in-process pool of AI job workers"""
+
+    def __init__(self, workers: int):
+        """
+        Initialize pool
+
+        Args:
+            workers: Number of concurrent jobs
+        """
+        self.workers = workers
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._queued: set[str] = set()
+        self._active: set[str] = set()
+        self._done_events: Dict[str, asyncio.Event] = {}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def enqueue(self, job_id: str) -> None:
+        """Queue a job for execution (no-op if the pool is not running)"""
+        if self._queue is not None and job_id not in self._queued and job_id not in self._active:
+            self._queued.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def wait_done(self, job_id: str, timeout: float) -> None:
+        """Wait until this process finishes `job_id` or `timeout` passes"""
+        event = self._done_events.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            # Only a local worker pops the event, so drop it here for jobs run
+            # by another process (or the task queue); otherwise it would leak
+            if job_id not in self._queued and job_id not in self._active \
+                    and self._done_events.get(job_id) is event:
+                del self._done_events[job_id]
+
+    async def _worker(self, index: int) -> None:
+        """Run queued jobs one at a time"""
+        while True:
+            job_id = await self._queue.get()
+            self._queued.discard(job_id)
+            self._active.add(job_id)
+            try:
+                await execute_job(job_id)
+            except Exception as e:
+                logger.error(f"AI job worker {index} error on {job_id}: {e}")
+            finally:
+                self._active.discard(job_id)
+                event = self._done_events.pop(job_id, None)
+                if event:
+                    event.set()
+                self._queue.task_done()
+
+    async def _sweep(self) -> None:
+        """Periodically pick up pending/stale jobs (e.g. after another process died)"""
+        while True:
+            try:
+                for job_id in await recover_jobs():
+                    self.enqueue(job_id)
+            except Exception as e:
+                logger.error(f"AI job sweep failed: {e}")
+            await asyncio.sleep(settings.AI_JOB_SWEEP_SECONDS)
+
+    def start(self) -> None:
+        """Start workers and the recovery sweep (also recovers jobs left over from a restart)"""
+        if self.running:
+            return
+
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"ai-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._sweep(), name="ai-job-sweep"))
+        logger.info(f"✅ AI job worker pool started ({self.workers} workers)")
+
+    async def stop(self) -> None:
+        """Cancel workers and hand interrupted jobs back as PENDING"""
+        interrupted = list(self._active)
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._queued.clear()
+        self._active.clear()
+
+        if interrupted:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(AIJob)
+                    .where(AIJob.id.in_(interrupted), AIJob.status == AIJobStatus.RUNNING)
+                    .values(status=AIJobStatus.PENDING, started_at=None)
+                )
+                await db.commit()
+            logger.info(f"Returned {len(interrupted)} interrupted AI job(s) to the queue")
+
+        logger.info("AI job worker pool stopped")
+
+
+job_pool = AIJobWorkerPool(workers=settings.AI_JOB_WORKERS)
@@ -1,27 +1,81 @@
 """
 AI Service using OpenAI API
 """
-from typing import Optional, List, Dict, Any
-from openai import AsyncOpenAI
+from typing import Optional, List, Dict, Any, AsyncIterator
 from core.config import settings
+from services.llm_cache import llm_cache, make_cache_key
+from services.llm_client import llm_client, ensure_configured
+from services.github_client import github_client, parse_github_url
+from utils.prompt_budget import compact_readme, fit_lines, truncate_to_tokens
+from utils.singleflight import SingleFlight
 from loguru import logger
-import httpx
-import re
 
 
-# Initialize OpenAI client
-if settings.OPENAI_API_KEY:
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-else:
-    client = None
+# Shared LLM client (services.llm_client)
+if not llm_client:
     logger.warning("OPENAI_API_KEY is not configured. AI features will be disabled.")
 
+# Concurrent identical requests share one in-flight call
+completion_flights = SingleFlight()
+github_flights = SingleFlight()
+
+
+async def _chat_completion(
+    messages: List[Dict[str, str]],
+    max_tokens: int,
+    temperature: float = 0.7,
+    model: str = "gpt-4o",
+    use_cache: bool = True,
+) -> str:
+    """
+    Run a chat completion through the LLM cache
+
+    Args:
+        messages: Chat messages
+        max_tokens: Completion token limit
+        temperature: Sampling temperature
+        model: Model name
+        use_cache: If False, skip the cache lookup (the result is still stored)
+
+    Returns:
+        Completion text
+    """
+    params = {"max_tokens": max_tokens, "temperature": temperature}
+    key = make_cache_key(model, params, messages)
+
+    async def run() -> str:
+        if use_cache:
+            cached = await llm_cache.get(key)
+            if cached is not None:
+                logger.info(f"LLM cache hit ({key[:12]})")
+                return cached
+
+        response = await llm_client.chat(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=messages,
+        )
+        content = response.choices[0].message.content
+
+        await llm_cache.set(key, content, model)
+        return content
+
+    # Prompts differing only in whitespace (e.g. "  topic ") share a flight
+    normalized = [
+        {"role": m["role"], "content": " ".join(m["content"].split())}
+        for m in messages
+    ]
+    flight_key = (make_cache_key(model, params, normalized), use_cache)
+    return await completion_flights.do(flight_key, run)
+
 
 async def generate_blog_content(
     topic: str,
     style: str = "technical",
     length: str = "medium",
     project_data: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
 ) -> Dict[str, str]:
     """
     Generate blog content using OpenAI API
@@ -31,12 +85,12 @@ async def generate_blog_content(
         style: Writing style (technical, casual, tutorial, etc.)
         length: Content length (short, medium, long)
         project_data: Optional project data to include
+        use_cache: If False, bypass the LLM cache and regenerate
 
     Returns:
         Dict with title, excerpt, content, and tags
     """
-    if not client:
-        raise ValueError("OPENAI_API_KEY is not configured")
+    ensure_configured()
 
     # Build prompt based on parameters
     prompt = _build_blog_prompt(topic, style, length, project_data)
@@ -44,24 +98,7 @@ async def generate_blog_content(
     try:
         logger.info(f"Generating blog content for topic: {topic}")
 
-        response = await client.chat.completions.create(
-            model="gpt-4o",
-            max_tokens=4000,
-            temperature=0.7,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 데이터공작소 개발 TFT의 전문 기술 블로그 작성자입니다. 한국어로 고품질의 기술 블로그를 작성합니다."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-
-        # Extract content from response
-        content = response.choices[0].message.content
+        content = await _chat_completion(_blog_messages(prompt), max_tokens=4000, use_cache=use_cache)
 
         # Parse structured response
         parsed = _parse_blog_response(content)
@@ -74,10 +111,82 @@ async def generate_blog_content(
         raise
 
 
+async def stream_blog_content(
+    topic: str,
+    style: str = "technical",
+    length: str = "medium",
+    project_data: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Generate blog content with the OpenAI streaming API
+
+    Sections are reported as soon as they are recognised; CONTENT is
+    forwarded token by token. The final "done" event carries the same
+    structure generate_blog_content() returns.
+
+    Args:
+        topic: Blog topic or title
+        style: Writing style (technical, casual, tutorial, etc.)
+        length: Content length (short, medium, long)
+        project_data: Optional project data to include
+        use_cache: If False, bypass the LLM cache (a cached completion is
+            replayed through the parser in one chunk)
+
+    Yields:
+        {"event": "title" | "excerpt" | "tags" | "content" | "done", "data": ...}
+    """
+    ensure_configured()
+
+    prompt = _build_blog_prompt(topic, style, length, project_data)
+    messages = _blog_messages(prompt)
+    parser = BlogStreamParser()
+    cache_key = make_cache_key("gpt-4o", {"max_tokens": 4000, "temperature": 0.7}, messages)
+
+    try:
+        cached = await llm_cache.get(cache_key) if use_cache else None
+
+        if cached is not None:
+            logger.info(f"LLM cache hit ({cache_key[:12]}), replaying stream")
+            for event in parser.feed(cached):
+                yield event
+        else:
+            logger.info(f"Streaming blog content for topic: {topic}")
+
+            # The stream is closed on exit, also when the client disconnects
+            async with llm_client.stream_chat(
+                model="gpt-4o",
+                max_tokens=4000,
+                temperature=0.7,
+                messages=messages,
+            ) as stream:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        for event in parser.feed(delta):
+                            yield event
+
+            await llm_cache.set(cache_key, parser.text, "gpt-4o")
+
+        for event in parser.close():
+            yield event
+
+        parsed = parser.result()
+        logger.info(f"Successfully streamed blog content: {parsed['title']}")
+        yield {"event": "done", "data": parsed}
+
+    except Exception as e:
+        logger.error(f"Failed to stream blog content: {str(e)}")
+        raise
+
+
 async def generate_newsletter_content(
     period_days: int = 7,
     blog_posts: Optional[List[Dict[str, Any]]] = None,
     projects: Optional[List[Dict[str, Any]]] = None,
+    use_cache: bool = True,
 ) -> Dict[str, str]:
     """
     Generate newsletter content using OpenAI API
@@ -86,12 +195,12 @@ async def generate_newsletter_content(
         period_days: Period in days (7 for weekly, 30 for monthly)
         blog_posts: Recent blog posts
         projects: Recent project updates
+        use_cache: If False, bypass the LLM cache and regenerate
 
     Returns:
         Dict with title and content (HTML)
     """
-    if not client:
-        raise ValueError("OPENAI_API_KEY is not configured")
+    ensure_configured()
 
     # Build prompt with context
     prompt = _build_newsletter_prompt(period_days, blog_posts, projects)
@@ -99,11 +208,8 @@ async def generate_newsletter_content(
     try:
         logger.info(f"Generating newsletter content (period: {period_days} days)")
 
-        response = await client.chat.completions.create(
-            model="gpt-4o",
-            max_tokens=3000,
-            temperature=0.7,
-            messages=[
+        content = await _chat_completion(
+            [
                 {
                     "role": "system",
                     "content": "당신은 데이터공작소 개발 TFT의 뉴스레터 작성자입니다. 한국어로 친근하고 매력적인 뉴스레터를 작성합니다."
@@ -112,12 +218,11 @@ async def generate_newsletter_content(
                     "role": "user",
                     "content": prompt
                 }
-            ]
+            ],
+            max_tokens=3000,
+            use_cache=use_cache,
         )
 
-        # Extract content from response
-        content = response.choices[0].message.content
-
         # Parse structured response
         parsed = _parse_newsletter_response(content)
 
@@ -129,6 +234,20 @@ async def generate_newsletter_content(
         raise
 
 
+def _blog_messages(prompt: str) -> List[Dict[str, str]]:
+    """Chat messages for blog generation"""
+    return [
+        {
+            "role": "system",
+            "content": "당신은 데이터공작소 개발 TFT의 전문 기술 블로그 작성자입니다. 한국어로 고품질의 기술 블로그를 작성합니다."
+        },
+        {
+            "role": "user",
+            "content": prompt
+        }
+    ]
+
+
 def _build_blog_prompt(
     topic: str,
     style: str,
@@ -196,6 +315,11 @@ CONTENT:
     return prompt
 
 
+def _summary(text: Optional[str]) -> str:
+    """Single-line excerpt capped at PROMPT_EXCERPT_MAX_TOKENS"""
+    return truncate_to_tokens(" ".join((text or "").split()), settings.PROMPT_EXCERPT_MAX_TOKENS)
+
+
 def _build_newsletter_prompt(
     period_days: int,
     blog_posts: Optional[List[Dict[str, Any]]],
@@ -219,13 +343,19 @@ def _build_newsletter_prompt(
 
     if blog_posts:
         prompt += "\n**최근 블로그 포스트**:\n"
-        for post in blog_posts[:5]:
-            prompt += f"- {post.get('title')}: {post.get('excerpt', '')}\n"
+        lines = [
+            f"- {post.get('title')}: {_summary(post.get('excerpt'))}"
+            for post in blog_posts[:5]
+        ]
+        prompt += "".join(f"{line}\n" for line in fit_lines(lines, settings.PROMPT_ITEMS_MAX_TOKENS))
 
     if projects:
         prompt += "\n**프로젝트 업데이트**:\n"
-        for project in projects[:5]:
-            prompt += f"- {project.get('name')}: {project.get('description', '')}\n"
+        lines = [
+            f"- {project.get('name')}: {_summary(project.get('description'))}"
+            for project in projects[:5]
+        ]
+        prompt += "".join(f"{line}\n" for line in fit_lines(lines, settings.PROMPT_ITEMS_MAX_TOKENS))
 
     prompt += """
 **요구사항**:
@@ -305,6 +435,80 @@ def _parse_blog_response(content: str) -> Dict[str, str]:
     }
 
 
+class BlogStreamParser:
+    """
+    Incremental parser for the TITLE/EXCERPT/TAGS/CONTENT blog format
+
+    Header sections are emitted once their line is complete. Everything after
+    the CONTENT: marker is passed through as raw "content" deltas; the
+    cleaned-up final text comes from result(), which applies
+    _parse_blog_response to the full response.
+    """
+
+    def __init__(self):
+        self.section: Optional[str] = None
+        self._line = ""  # Incomplete header line
+        self._chunks: List[str] = []
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Consume a streamed delta and return any events it completes"""
+        self._chunks.append(text)
+
+        if self.section == "content":
+            return [{"event": "content", "data": text}]
+
+        events = []
+        self._line += text
+        while "\n" in self._line:
+            line, self._line = self._line.split("\n", 1)
+            events.extend(self._parse_header(line))
+
+            if self.section == "content":
+                if self._line:
+                    events.append({"event": "content", "data": self._line})
+                self._line = ""
+                break
+
+        return events
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Flush a trailing header line without a newline"""
+        events = []
+        if self._line and self.section != "content":
+            events = self._parse_header(self._line)
+        self._line = ""
+        return events
+
+    @property
+    def text(self) -> str:
+        """Raw response received so far"""
+        return "".join(self._chunks)
+
+    def result(self) -> Dict[str, Any]:
+        """Parse the complete response (same output as generate_blog_content)"""
+        return _parse_blog_response(self.text)
+
+    def _parse_header(self, line: str) -> List[Dict[str, Any]]:
+        line = line.strip()
+
+        if line.startswith("TITLE:"):
+            self.section = "title"
+            return [{"event": "title", "data": line.replace("TITLE:", "").strip()}]
+        if line.startswith("EXCERPT:"):
+            self.section = "excerpt"
+            return [{"event": "excerpt", "data": line.replace("EXCERPT:", "").strip()}]
+        if line.startswith("TAGS:"):
+            self.section = "tags"
+            tags_str = line.replace("TAGS:", "").strip()
+            return [{"event": "tags", "data": [tag.strip() for tag in tags_str.split(',')]}]
+        if line.startswith("CONTENT:"):
+            self.section = "content"
+            rest = line.replace("CONTENT:", "").strip()
+            return [{"event": "content", "data": rest + "\n"}] if rest else []
+
+        return []
+
+
 def _parse_newsletter_response(content: str) -> Dict[str, str]:
     """Parse Claude's newsletter response into structured data"""
 
@@ -348,62 +552,42 @@ async def fetch_github_repo_info(github_url: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with repo info or None
     """
-    # Extract owner and repo from URL
-    # Example: https://github.com/owner/repo
-    match = re.match(r'https?://github\.com/([^/]+)/([^/]+)', github_url)
-    if not match:
+    parsed = parse_github_url(github_url)
+    if not parsed:
         logger.warning(f"Invalid GitHub URL: {github_url}")
         return None
 
-    owner, repo = match.groups()
-    repo = repo.replace('.git', '')  # Remove .git if present
+    owner, repo = parsed
 
-    try:
-        async with httpx.AsyncClient() as client:
-            # Get repo info
-            repo_response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}",
-                headers={"Accept": "application/vnd.github.v3+json"},
-                timeout=10.0
-            )
-
-            if repo_response.status_code != 200:
-                logger.warning(f"GitHub API error: {repo_response.status_code}")
-                return None
-
-            repo_data = repo_response.json()
-
-            # Try to get README
-            readme_content = None
-            try:
-                readme_response = await client.get(
-                    f"https://api.github.com/repos/{owner}/{repo}/readme",
-                    headers={"Accept": "application/vnd.github.v3.raw"},
-                    timeout=10.0
-                )
-                if readme_response.status_code == 200:
-                    readme_content = readme_response.text[:3000]  # Limit to 3000 chars
-            except Exception as e:
-                logger.warning(f"Failed to fetch README: {e}")
-
-            return {
-                "name": repo_data.get("name"),
-                "description": repo_data.get("description"),
-                "language": repo_data.get("language"),
-                "topics": repo_data.get("topics", []),
-                "stars": repo_data.get("stargazers_count"),
-                "homepage": repo_data.get("homepage"),
-                "readme": readme_content,
-            }
+    # GitHub owner/repo names are case-insensitive
+    return await github_flights.do(
+        (owner.lower(), repo.lower()),
+        lambda: _fetch_github_repo_info(owner, repo),
+    )
 
-    except Exception as e:
-        logger.error(f"Failed to fetch GitHub repo info: {e}")
+
+async def _fetch_github_repo_info(owner: str, repo: str) -> Optional[Dict[str, Any]]:
+    """Fetch repo metadata and README (concurrently, through the shared GitHub client)"""
+    repo_data, readme_content = await github_client.get_repo_with_readme(owner, repo)
+
+    if not repo_data:
         return None
 
+    return {
+        "name": repo_data.get("name"),
+        "description": repo_data.get("description"),
+        "language": repo_data.get("language"),
+        "topics": repo_data.get("topics", []),
+        "stars": repo_data.get("stargazers_count"),
+        "homepage": repo_data.get("homepage"),
+        "readme": readme_content,  # Compacted to PROMPT_README_MAX_TOKENS when prompting
+    }
+
 
 async def generate_project_info(
     github_url: Optional[str] = None,
     demo_url: Optional[str] = None,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
     Generate project information using AI
@@ -411,12 +595,12 @@ async def generate_project_info(
     Args:
         github_url: GitHub repository URL
         demo_url: Demo/live site URL
+        use_cache: If False, bypass the LLM cache and regenerate
 
     Returns:
         Dict with name, description, content, category, tech_stack
     """
-    if not client:
-        raise ValueError("OPENAI_API_KEY is not configured")
+    ensure_configured()
 
     # Fetch GitHub repo info if URL provided
     github_info = None
@@ -429,11 +613,8 @@ async def generate_project_info(
     try:
         logger.info(f"Generating project info from GitHub: {github_url}")
 
-        response = await client.chat.completions.create(
-            model="gpt-4o",
-            max_tokens=3000,
-            temperature=0.7,
-            messages=[
+        content = await _chat_completion(
+            [
                 {
                     "role": "system",
                     "content": "당신은 GitHub 리포지토리를 분석하고 프로젝트 정보를 작성하는 전문가입니다. 한국어로 명확하고 간결하게 작성합니다."
@@ -442,10 +623,10 @@ async def generate_project_info(
                     "role": "user",
                     "content": prompt
                 }
-            ]
+            ],
+            max_tokens=3000,
+            use_cache=use_cache,
         )
-
-        content = response.choices[0].message.content
         parsed = _parse_project_info_response(content)
 
         logger.info(f"Successfully generated project info: {parsed.get('name')}")
@@ -486,8 +667,9 @@ def _build_project_info_prompt(
         if github_info.get("homepage"):
             prompt += f"- 홈페이지: {github_info['homepage']}\n"
 
-        if github_info.get("readme"):
-            prompt += f"\n**README 내용 (일부)**:\n```\n{github_info['readme']}\n```\n"
+        readme = compact_readme(github_info.get("readme"), settings.PROMPT_README_MAX_TOKENS)
+        if readme:
+            prompt += f"\n**README 내용 (요약)**:\n```\n{readme}\n```\n"
 
     prompt += """
 **요구사항**:
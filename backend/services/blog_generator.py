@@ -10,9 +10,9 @@ from sqlalchemy import select
 
 from models.blog import Blog, BlogStatus
 from models.user import User
-from core.config import settings
+from services import feed_service, related_service, search_service, tag_service
+from services.llm_client import ensure_configured
 from loguru import logger
-import openai
 import json
 import re
 
@@ -39,10 +39,7 @@ class BlogGenerator:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        # Set OpenAI API key
-        if not settings.OPENAI_API_KEY:
-            raise ValueError("OPENAI_API_KEY is not configured")
-        openai.api_key = settings.OPENAI_API_KEY
+        self.llm = ensure_configured()
 
     async def generate_blog_post(
         self,
@@ -142,11 +139,7 @@ JSON 형식으로 출력하세요:
         # Call OpenAI GPT-4
         logger.info("Generating blog post with GPT-4...")
 
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
-        response = await client.chat.completions.create(
+        response = await self.llm.chat(
             model="gpt-4-turbo-preview",
             messages=[{
                 "role": "system",
@@ -163,11 +156,11 @@ JSON 형식으로 출력하세요:
         # Parse response
         ai_response = response.choices[0].message.content
 
-        # Extract JSON from markdown code blocks if present
-        if "```json" in ai_response:
-            ai_response = ai_response.split("```json")[1].split("```")[0].strip()
-        elif "```" in ai_response:
-            ai_response = ai_response.split("```")[1].split("```")[0].strip()
+        # Extract JSON if the whole response is wrapped in a markdown code block
+        # (code blocks inside the JSON string values must be left alone)
+        ai_response = ai_response.strip()
+        if ai_response.startswith("```"):
+            ai_response = ai_response.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
 
         result = json.loads(ai_response)
 
@@ -223,12 +216,14 @@ JSON 형식으로 출력하세요:
             slug=content.slug,
             content=content.content,
             excerpt=content.excerpt,
-            tags=",".join(content.tags),
+            tags=",".join(tag_service.normalize_tags(content.tags)) or None,
             author_id=author_id,
             status=BlogStatus.DRAFT,
         )
 
         self.db.add(blog)
+        await self.db.flush()
+        await tag_service.sync_blog_tags(self.db, blog.id, tag_service.tag_state(None), tag_service.tag_state(blog))
         await self.db.commit()
         await self.db.refresh(blog)
 
@@ -267,10 +262,15 @@ async def generate_daily_blog(
 
     # Auto-publish if enabled
     if auto_publish:
+        before = tag_service.tag_state(blog)
         blog.status = BlogStatus.PUBLISHED
         blog.published_at = datetime.now(timezone.utc)
+        await tag_service.sync_blog_tags(db, blog.id, before, tag_service.tag_state(blog))
+        await related_service.enqueue_update(db, blog.id)
+        await feed_service.enqueue_regenerate(db)
         await db.commit()
         await db.refresh(blog)
         logger.info(f"Blog auto-published: ID={blog.id}")
 
+    await search_service.index_blog(db, blog)
     return blog
@@ -2,14 +2,18 @@
 Blog Scheduler
 
 Automated daily blog generation
+
+Runs on the shared cluster scheduler, so the daily post is generated exactly
+once even when several replicas run this scheduler.
 """
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
+from typing import Any, Dict
 from loguru import logger
 
 from core.database import AsyncSessionLocal
 from services.blog_generator import generate_daily_blog
+from services.cluster_scheduler import cluster_scheduler
 
 
 class BlogScheduler:
@@ -24,13 +28,13 @@ class BlogScheduler:
             auto_publish: If True, automatically publish after generation
                          If False, save as DRAFT for manual review
         """
-        self.scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
+        self.scheduler = cluster_scheduler
         self.author_id = author_id
         self.auto_publish = auto_publish
         logger.info(f"BlogScheduler initialized (author_id={author_id}, auto_publish={auto_publish})")
 
-    async def run_blog_generation(self):
-        """Generate blog (scheduled job)"""
+    async def run_blog_generation(self) -> Dict[str, Any]:
+        """Generate blog (scheduled job; raises so the run is recorded as failed)"""
         logger.info("=" * 70)
         logger.info("Starting scheduled blog generation")
         logger.info(f"Time: {datetime.now()}")
@@ -58,8 +62,11 @@ class BlogScheduler:
 
         except Exception as e:
             logger.error(f"❌ Blog generation failed: {e}", exc_info=True)
+            raise
+        finally:
+            logger.info("=" * 70)
 
-        logger.info("=" * 70)
+        return {"blog_id": blog.id, "slug": blog.slug, "published": self.auto_publish}
 
     def start(
         self,
@@ -80,30 +87,27 @@ class BlogScheduler:
             timezone="Asia/Seoul"
         )
 
-        self.scheduler.add_job(
-            self.run_blog_generation,
-            trigger=trigger,
-            id="daily_blog",
-            name="Daily Blog Generation",
-            replace_existing=True,
-        )
+        self.scheduler.add_job("daily_blog", trigger, self.run_blog_generation)
 
         logger.info(
             f"Scheduler started - will run daily at {hour:02d}:{minute:02d} KST"
         )
 
         # Print next run time
-        job = self.scheduler.get_job("daily_blog")
-        if job and job.next_run_time:
-            logger.info(f"Next run: {job.next_run_time}")
+        next_run_time = self.scheduler.next_run_time("daily_blog")
+        if next_run_time:
+            logger.info(f"Next run: {next_run_time}")
 
-        # Start scheduler
+        # Start the shared scheduler (no-op if already running)
         self.scheduler.start()
 
     async def run_now(self):
         """Run blog generation immediately (for testing)"""
         logger.info("Running blog generation immediately (manual trigger)")
-        await self.run_blog_generation()
+        try:
+            await self.run_blog_generation()
+        except Exception:
+            pass  # Already logged
 
 
 def create_blog_scheduler(author_id: int, auto_publish: bool = False) -> BlogScheduler:
@@ -2,21 +2,24 @@
 Blog Service
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, update
+from sqlalchemy.orm import defer
 from typing import List, Optional
 from datetime import datetime
 from loguru import logger
 
 from models.blog import Blog, BlogStatus
+from models.tag import Tag, blog_tags
 from schemas.blog import BlogCreate, BlogUpdate
+from services import feed_service, related_service, search_service, tag_service, trending_service
 from utils.slug import generate_unique_slug
 
 
 async def create_blog(
     db: AsyncSession,
     blog_data: BlogCreate,
-    author_id: int
+    author_id: int,
+    author_name: Optional[str] = None
 ) -> Blog:
     """
     Create a new blog post
@@ -25,6 +28,7 @@ async def create_blog(
         db: Database session
         blog_data: Blog creation data
         author_id: Author user ID
+        author_name: Author display name (looked up on insert if omitted)
 
     Returns:
         Created blog post
@@ -45,14 +49,16 @@ async def create_blog(
         counter += 1
 
     # Create blog
+    tags = tag_service.normalize_tags(blog_data.tags)
     new_blog = Blog(
         title=blog_data.title,
         slug=slug,
         content=blog_data.content,
         excerpt=blog_data.excerpt,
         author_id=author_id,
+        author_name=author_name,
         status=blog_data.status,
-        tags=",".join(blog_data.tags) if blog_data.tags else None
+        tags=",".join(tags) if tags else None
     )
 
     # Set published_at if status is PUBLISHED
@@ -60,17 +66,17 @@ async def create_blog(
         new_blog.published_at = datetime.utcnow()
 
     db.add(new_blog)
+    await db.flush()
+    await tag_service.sync_blog_tags(db, new_blog.id, tag_service.tag_state(None), tag_service.tag_state(new_blog))
+    if new_blog.status == BlogStatus.PUBLISHED:
+        await related_service.enqueue_update(db, new_blog.id)
+        await feed_service.enqueue_regenerate(db)
     await db.commit()
     await db.refresh(new_blog)
+    await search_service.index_blog(db, new_blog)
 
-    # Eagerly load author relationship
-    result = await db.execute(
-        select(Blog).options(selectinload(Blog.author)).where(Blog.id == new_blog.id)
-    )
-    blog_with_author = result.scalar_one()
-
-    logger.info(f"Blog created: {blog_with_author.title} (ID: {blog_with_author.id}, Slug: {blog_with_author.slug})")
-    return blog_with_author
+    logger.info(f"Blog created: {new_blog.title} (ID: {new_blog.id}, Slug: {new_blog.slug})")
+    return new_blog
 
 
 async def get_blog_by_id(db: AsyncSession, blog_id: int) -> Optional[Blog]:
@@ -85,7 +91,7 @@ async def get_blog_by_id(db: AsyncSession, blog_id: int) -> Optional[Blog]:
         Blog post if found, None otherwise
     """
     result = await db.execute(
-        select(Blog).options(selectinload(Blog.author)).where(Blog.id == blog_id)
+        select(Blog).where(Blog.id == blog_id)
     )
     return result.scalar_one_or_none()
 
@@ -102,7 +108,7 @@ async def get_blog_by_slug(db: AsyncSession, slug: str) -> Optional[Blog]:
         Blog post if found, None otherwise
     """
     result = await db.execute(
-        select(Blog).options(selectinload(Blog.author)).where(Blog.slug == slug)
+        select(Blog).where(Blog.slug == slug)
     )
     return result.scalar_one_or_none()
 
@@ -112,7 +118,8 @@ async def list_blogs(
     skip: int = 0,
     limit: int = 10,
     status: Optional[BlogStatus] = None,
-    author_id: Optional[int] = None
+    author_id: Optional[int] = None,
+    tag: Optional[str] = None
 ) -> tuple[List[Blog], int]:
     """
     List blog posts with pagination
@@ -123,12 +130,14 @@ async def list_blogs(
         limit: Maximum number of records to return
         status: Filter by status (optional)
         author_id: Filter by author ID (optional)
+        tag: Filter by tag name, case-insensitive (optional)
 
     Returns:
         Tuple of (blog list, total count)
     """
-    # Build query with eager loading
-    query = select(Blog).options(selectinload(Blog.author))
+    # Build query
+    # Full markdown content is never part of a list item, so it is not loaded
+    query = select(Blog).options(defer(Blog.content, raiseload=True))
 
     if status:
         query = query.where(Blog.status == status)
@@ -136,6 +145,11 @@ async def list_blogs(
     if author_id:
         query = query.where(Blog.author_id == author_id)
 
+    if tag:
+        # Indexed association lookup instead of a LIKE scan over Blog.tags
+        tag_id = select(Tag.id).where(Tag.key == tag_service.tag_key(tag)).scalar_subquery()
+        query = query.join(blog_tags, blog_tags.c.blog_id == Blog.id).where(blog_tags.c.tag_id == tag_id)
+
     # Order by published_at or created_at (descending)
     query = query.order_by(
         Blog.published_at.desc().nulls_last(),
@@ -171,6 +185,8 @@ async def update_blog(
     Returns:
         Updated blog post
     """
+    before = tag_service.tag_state(blog)
+
     # Update fields
     if blog_data.title is not None:
         blog.title = blog_data.title
@@ -196,10 +212,17 @@ async def update_blog(
             blog.published_at = datetime.utcnow()
 
     if blog_data.tags is not None:
-        blog.tags = ",".join(blog_data.tags) if blog_data.tags else None
-
+        tags = tag_service.normalize_tags(blog_data.tags)
+        blog.tags = ",".join(tags) if tags else None
+
+    after = tag_service.tag_state(blog)
+    await tag_service.sync_blog_tags(db, blog.id, before, after)
+    if before[1] or after[1]:
+        await related_service.enqueue_update(db, blog.id)
+        await feed_service.enqueue_regenerate(db)
     await db.commit()
     await db.refresh(blog)
+    await search_service.index_blog(db, blog)
 
     logger.info(f"Blog updated: {blog.title} (ID: {blog.id})")
     return blog
@@ -216,8 +239,14 @@ async def delete_blog(db: AsyncSession, blog: Blog) -> None:
     blog_id = blog.id
     blog_title = blog.title
 
+    before = tag_service.tag_state(blog)
+    await tag_service.sync_blog_tags(db, blog_id, before, tag_service.tag_state(None))
+    if before[1]:
+        await related_service.enqueue_update(db, blog_id)
+        await feed_service.enqueue_regenerate(db)
     await db.delete(blog)
     await db.commit()
+    await search_service.remove_blog(blog_id)
 
     logger.info(f"Blog deleted: {blog_title} (ID: {blog_id})")
 
@@ -234,6 +263,7 @@ async def increment_view_count(db: AsyncSession, blog: Blog) -> Blog:
         Updated blog post
     """
     blog.view_count += 1
+    await trending_service.record_view(db, "blog", blog.id)
     await db.commit()
     await db.refresh(blog)
     return blog
@@ -251,10 +281,15 @@ async def publish_blog(db: AsyncSession, blog: Blog) -> Blog:
         Published blog post
     """
     if blog.status != BlogStatus.PUBLISHED:
+        before = tag_service.tag_state(blog)
         blog.status = BlogStatus.PUBLISHED
         blog.published_at = datetime.utcnow()
+        await tag_service.sync_blog_tags(db, blog.id, before, tag_service.tag_state(blog))
+        await related_service.enqueue_update(db, blog.id)
+        await feed_service.enqueue_regenerate(db)
         await db.commit()
         await db.refresh(blog)
+        await search_service.index_blog(db, blog)
         logger.info(f"Blog published: {blog.title} (ID: {blog.id})")
 
     return blog
@@ -272,9 +307,34 @@ async def unpublish_blog(db: AsyncSession, blog: Blog) -> Blog:
         Unpublished blog post
     """
     if blog.status == BlogStatus.PUBLISHED:
+        before = tag_service.tag_state(blog)
         blog.status = BlogStatus.DRAFT
+        await tag_service.sync_blog_tags(db, blog.id, before, tag_service.tag_state(blog))
+        await related_service.enqueue_update(db, blog.id)
+        await feed_service.enqueue_regenerate(db)
         await db.commit()
         await db.refresh(blog)
+        await search_service.index_blog(db, blog)
         logger.info(f"Blog unpublished: {blog.title} (ID: {blog.id})")
 
     return blog
+
+
+async def sync_author_name(db: AsyncSession, author_id: int, author_name: str) -> None:
+    """
+    Update the denormalised author name on all posts of a user
+
+    The caller commits (together with the user rename).
+
+    Args:
+        db: Database session
+        author_id: Author user ID
+        author_name: New display name
+    """
+    await db.execute(
+        update(Blog)
+        .where(Blog.author_id == author_id)
+        # Keep updated_at: a rename is not an edit of the post
+        .values(author_name=author_name, updated_at=Blog.updated_at)
+    )
+    await feed_service.enqueue_regenerate(db)
@@ -0,0 +1,447 @@
+"""
+Cluster Scheduler
+
+Cron scheduling that is safe to run on several replicas:
+- leader election: only the replica holding the scheduler lock evaluates
+  schedules (PostgreSQL session advisory lock; a lease row with expiry on
+  databases without advisory locks, e.g. SQLite)
+- exactly-once: every firing is claimed by inserting a job_runs row keyed by
+  (job_name, scheduled_for); only the replica whose INSERT wins runs it, so
+  even overlapping leaders cannot double-fire
+- catch-up: after downtime the most recent missed firing within
+  SCHEDULER_CATCH_UP_HOURS runs once (older misses are coalesced); a job
+  with no job_runs rows yet (first deploy, newly added job) only runs
+  on-time firings, since earlier ones may have run under the old scheduler
+- run history: status, duration and result/error are recorded per firing
+"""
+import asyncio
+import os
+import socket
+import time
+import uuid
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import select, update, func, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from loguru import logger
+
+from core.config import settings
+from core.database import AsyncSessionLocal, engine, dialect_insert
+from models.job_run import JobRun, JobRunStatus, SchedulerLease
+
+
+JobFunc = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Datetimes read back from SQLite are naive (stored as UTC)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+# ============ Leader Election ============
+
+class LeaderLock:
+    """Cluster-wide lock held by at most one scheduler instance"""
+
+    def __init__(self, name: str, owner: str, lease_seconds: float):
+        """
+        Initialize lock
+
+        Args:
+            name: Lock name (one leader per name)
+            owner: This instance's ID
+            lease_seconds: Lease length for the table-based fallback
+        """
+        self.name = name
+        self.owner = owner
+        self.lease_seconds = lease_seconds
+        self.key = zlib.crc32(f"scheduler:{name}".encode())  # Advisory lock key
+        self._conn: Optional[AsyncConnection] = None
+
+    async def acquire_or_renew(self) -> bool:
+        """
+        Try to become (or stay) leader
+
+        Returns:
+            True if this instance holds the lock
+        """
+        if engine.dialect.name == "postgresql":
+            return await self._advisory_lock()
+        return await self._lease()
+
+    async def _advisory_lock(self) -> bool:
+        """Session advisory lock on a dedicated connection (released if it drops)"""
+        if self._conn is not None:
+            try:
+                await self._conn.execute(text("SELECT 1"))
+                return True
+            except Exception as e:
+                logger.warning(f"Scheduler lock connection lost: {e}")
+                await self._close()
+
+        conn = await engine.connect()
+        try:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            result = await conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key})
+            if result.scalar():
+                self._conn = conn
+                return True
+        except Exception as e:
+            logger.warning(f"Scheduler lock attempt failed: {e}")
+        await conn.close()
+        return False
+
+    async def _lease(self) -> bool:
+        """Lease row: take it if free, expired or already ours"""
+        now = _now()
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(SchedulerLease)
+                .where(
+                    SchedulerLease.name == self.name,
+                    (SchedulerLease.owner == self.owner) | (SchedulerLease.expires_at < now),
+                )
+                .values(owner=self.owner, expires_at=expires_at)
+            )
+            if result.rowcount == 1:
+                await db.commit()
+                return True
+
+            result = await db.execute(
+                dialect_insert(db, SchedulerLease)
+                .values(name=self.name, owner=self.owner, expires_at=expires_at)
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+            await db.commit()
+            return result.rowcount == 1
+
+    async def release(self) -> None:
+        """Give up leadership"""
+        if self._conn is not None:
+            try:
+                await self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+            except Exception:
+                pass
+            await self._close()
+            return
+
+        if engine.dialect.name != "postgresql":
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(SchedulerLease)
+                    .where(SchedulerLease.name == self.name, SchedulerLease.owner == self.owner)
+                    .values(expires_at=_now())
+                )
+                await db.commit()
+
+    async def _close(self) -> None:
+        try:
+            await self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
+
+
+# ============ Scheduler ============
+
+@dataclass
+class ScheduledJob:
+    """A cron job registered with the cluster scheduler"""
+    name: str
+    trigger: CronTrigger
+    func: JobFunc
+    catch_up: bool = True
+
+
+class ClusterScheduler:
+    """Leader-elected cron scheduler with exactly-once job runs"""
+
+    def __init__(
+        self,
+        name: str,
+        tick_seconds: float,
+        lease_seconds: float,
+        catch_up_hours: float,
+        run_timeout_seconds: float,
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            name: Scheduler name (replicas with the same name elect one leader)
+            tick_seconds: How often schedules are evaluated
+            lease_seconds: Leader lease length (table-based lock only)
+            catch_up_hours: How far back a missed firing is still run
+            run_timeout_seconds: RUNNING runs older than this are marked failed
+        """
+        self.name = name
+        self.tick_seconds = tick_seconds
+        self.catch_up = timedelta(hours=catch_up_hours)
+        self.run_timeout = timedelta(seconds=run_timeout_seconds)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.lock = LeaderLock(name, self.owner, lease_seconds)
+
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.is_leader = False
+        self._loop: Optional[asyncio.Task] = None
+        self._running: Dict[str, asyncio.Task] = {}
+
+    def add_job(self, name: str, trigger: CronTrigger, func: JobFunc, catch_up: bool = True) -> None:
+        """
+        Register (or replace) a job
+
+        Args:
+            name: Unique job name (also the job_runs key)
+            trigger: Cron trigger
+            func: Coroutine function; may return a JSON-serialisable result
+            catch_up: Run the latest missed firing after downtime
+        """
+        self.jobs[name] = ScheduledJob(name=name, trigger=trigger, func=func, catch_up=catch_up)
+
+    def next_run_time(self, name: str) -> Optional[datetime]:
+        """Next fire time of a job"""
+        job = self.jobs.get(name)
+        if not job:
+            return None
+        return job.trigger.get_next_fire_time(None, datetime.now(job.trigger.timezone))
+
+    # ============ Loop ============
+
+    async def _tick(self) -> None:
+        """Renew leadership and start due jobs"""
+        leader = await self.lock.acquire_or_renew()
+        if leader != self.is_leader:
+            logger.info(f"Scheduler '{self.name}': {'became leader' if leader else 'lost leadership'} ({self.owner})")
+            self.is_leader = leader
+        if not leader:
+            return
+
+        await self._fail_abandoned_runs()
+
+        now = _now()
+        for job in self.jobs.values():
+            if job.name in self._running:
+                continue
+
+            due = await self._due_fire_time(job, now)
+            if due is None:
+                continue
+
+            scheduled_for, is_catch_up = due
+            run_id = await self._claim(job.name, scheduled_for, is_catch_up)
+            if run_id is None:
+                continue
+
+            self._running[job.name] = asyncio.create_task(self._run(job, run_id, scheduled_for))
+
+    async def _due_fire_time(self, job: ScheduledJob, now: datetime) -> Optional[Tuple[datetime, bool]]:
+        """Latest fire time <= now that has no run yet (None if nothing is due)"""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(func.max(JobRun.scheduled_for)).where(JobRun.job_name == job.name)
+            )
+            last = result.scalar()
+        last = _as_utc(last) if last else None
+
+        # Without catch-up only firings within the last couple of ticks count.
+        # Neither without history: a firing before the job was known to
+        # job_runs was not missed by this scheduler
+        on_time = timedelta(seconds=self.tick_seconds * 2)
+        window = max(self.catch_up, on_time) if job.catch_up and last is not None else on_time
+        cursor = now - window
+        if last and last >= cursor:
+            cursor = last + timedelta(seconds=1)
+
+        latest = None
+        missed = 0
+        previous = None
+        while True:
+            fire_time = job.trigger.get_next_fire_time(previous, cursor.astimezone(job.trigger.timezone))
+            if fire_time is None or _as_utc(fire_time) > now:
+                break
+            if latest is not None:
+                missed += 1
+            latest = _as_utc(fire_time)
+            previous = fire_time
+            cursor = latest + timedelta(seconds=1)
+
+        if latest is None:
+            return None
+
+        if missed:
+            logger.warning(f"Job '{job.name}': coalescing {missed} missed run(s) into one")
+        is_catch_up = now - latest > on_time
+        return latest, is_catch_up
+
+    async def _claim(self, job_name: str, scheduled_for: datetime, is_catch_up: bool) -> Optional[int]:
+        """Insert the job_runs row; None if another instance already claimed this firing"""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                dialect_insert(db, JobRun)
+                .values(
+                    job_name=job_name,
+                    scheduled_for=scheduled_for,
+                    status=JobRunStatus.RUNNING,
+                    owner=self.owner,
+                    is_catch_up=is_catch_up,
+                    started_at=_now(),
+                )
+                .on_conflict_do_nothing(index_elements=["job_name", "scheduled_for"])
+                .returning(JobRun.id)
+            )
+            run_id = result.scalar()
+            await db.commit()
+
+        if run_id is None:
+            logger.info(f"Job '{job_name}' @ {scheduled_for.isoformat()} already claimed elsewhere")
+        return run_id
+
+    async def _run(self, job: ScheduledJob, run_id: int, scheduled_for: datetime) -> None:
+        """Run a claimed firing and record its outcome"""
+        logger.info(f"Running scheduled job '{job.name}' (scheduled for {scheduled_for.isoformat()})")
+        started = time.monotonic()
+        values: Dict[str, Any] = {}
+
+        try:
+            result = await job.func()
+            values = {"status": JobRunStatus.SUCCEEDED, "result": result}
+        except asyncio.CancelledError:
+            values = {"status": JobRunStatus.FAILED, "error": "Interrupted by scheduler shutdown"}
+            raise
+        except Exception as e:
+            logger.error(f"Scheduled job '{job.name}' failed: {e}", exc_info=True)
+            values = {"status": JobRunStatus.FAILED, "error": f"{e.__class__.__name__}: {e}"[:2000]}
+        finally:
+            duration = time.monotonic() - started
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(
+                        update(JobRun)
+                        .where(JobRun.id == run_id)
+                        .values(finished_at=_now(), duration_seconds=round(duration, 3), **values)
+                    )
+                    await db.commit()
+            except Exception as e:
+                logger.error(f"Failed to record run of '{job.name}': {e}")
+            self._running.pop(job.name, None)
+            logger.info(f"Scheduled job '{job.name}' finished in {duration:.1f}s ({values.get('status')})")
+
+    async def _fail_abandoned_runs(self) -> None:
+        """Mark runs left RUNNING by a dead instance as failed (they are not re-run)"""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(JobRun)
+                .where(
+                    JobRun.status == JobRunStatus.RUNNING,
+                    JobRun.started_at < _now() - self.run_timeout,
+                )
+                .values(status=JobRunStatus.FAILED, error="Abandoned (scheduler instance lost)", finished_at=_now())
+            )
+            await db.commit()
+
+        if result.rowcount:
+            logger.warning(f"Marked {result.rowcount} abandoned job run(s) as failed")
+
+    async def _loop_forever(self) -> None:
+        while True:
+            try:
+                await self._tick()
+            except Exception as e:
+                logger.error(f"Scheduler tick failed: {e}")
+            await asyncio.sleep(self.tick_seconds)
+
+    # ============ Lifecycle ============
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(self) -> None:
+        """Start the scheduling loop (idempotent: several schedulers may share one instance)"""
+        if self.running:
+            return
+        self._loop = asyncio.create_task(self._loop_forever())
+        logger.info(f"Cluster scheduler '{self.name}' started ({self.owner})")
+
+    async def stop(self, grace_seconds: float = 30.0) -> None:
+        """
+        Stop scheduling, wait for running jobs, then release leadership
+
+        Args:
+            grace_seconds: How long to wait for running jobs before cancelling
+        """
+        if self._loop is not None:
+            self._loop.cancel()
+            await asyncio.gather(self._loop, return_exceptions=True)
+            self._loop = None
+
+        running = list(self._running.values())
+        if running:
+            _, pending = await asyncio.wait(running, timeout=grace_seconds)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        await self.lock.release()
+        self.is_leader = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Leadership and job state of this instance"""
+        jobs = {}
+        for name in self.jobs:
+            next_run = self.next_run_time(name)
+            jobs[name] = {"next_run_time": next_run.isoformat() if next_run else None}
+
+        return {
+            "name": self.name,
+            "owner": self.owner,
+            "is_leader": self.is_leader,
+            "running_jobs": sorted(self._running),
+            "jobs": jobs,
+        }
+
+
+async def list_job_runs(
+    db: AsyncSession,
+    job_name: Optional[str] = None,
+    limit: int = 50,
+) -> List[JobRun]:
+    """
+    List recent scheduled job runs, newest first
+
+    Args:
+        db: Database session
+        job_name: Filter by job (optional)
+        limit: Maximum number of runs
+
+    Returns:
+        Job run list
+    """
+    query = select(JobRun)
+    if job_name:
+        query = query.where(JobRun.job_name == job_name)
+
+    result = await db.execute(query.order_by(JobRun.scheduled_for.desc()).limit(limit))
+    return list(result.scalars().all())
+
+
+# Shared by BlogScheduler / NewsletterScheduler, so one process elects one leader
+cluster_scheduler = ClusterScheduler(
+    name="automation",
+    tick_seconds=settings.SCHEDULER_TICK_SECONDS,
+    lease_seconds=settings.SCHEDULER_LEASE_SECONDS,
+    catch_up_hours=settings.SCHEDULER_CATCH_UP_HOURS,
+    run_timeout_seconds=settings.SCHEDULER_RUN_TIMEOUT_SECONDS,
+)
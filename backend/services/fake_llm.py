@@ -0,0 +1,233 @@
+"""
+Fake LLM Backend
+
+Deterministic local stand-in for the OpenAI chat completions API, for load
+and regression testing without network access or API spend. The response
+format is picked from the prompt the same way the real model is instructed:
+
+- response_format=json_object with "html_content" in the prompt
+  -> NewsletterGenerator JSON (title, summary, html_content)
+- response_format=json_object otherwise
+  -> BlogGenerator JSON (title, excerpt, content, tags, slug)
+- "NAME:" in the prompt -> project info (NAME/DESCRIPTION/CATEGORY/TECH_STACK/CONTENT)
+- "EXCERPT:" in the prompt -> blog (TITLE/EXCERPT/TAGS/CONTENT)
+- otherwise -> newsletter (TITLE/CONTENT with HTML)
+
+The same messages always produce the same text. Timing is simulated as
+`latency` seconds to the first token, then `tokens_per_second`.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice, ChoiceDelta
+from openai.types.chat.chat_completion_message import ChatCompletionMessage
+from openai.types.completion_usage import CompletionUsage
+
+
+CHARS_PER_TOKEN = 4  # Rough size of one streamed "token"
+
+_WORDS = [
+    "FastAPI", "PostgreSQL", "비동기", "성능", "최적화", "캐시", "인덱스", "쿼리",
+    "파이프라인", "에이전트", "프롬프트", "배포", "모니터링", "확장성", "데이터",
+    "모델", "API", "테스트", "자동화", "워크플로", "벡터", "검색", "스트리밍", "안정성",
+]
+_TAGS = ["AI", "Python", "FastAPI", "Backend", "DevOps", "Tutorial", "Tips", "Cloud"]
+_CATEGORIES = ["AI/ML", "Finance", "Video", "DevOps", "Blockchain", "Web", "Mobile"]
+
+
+class FakeStream:
+    """Async iterator of ChatCompletionChunk, paced like a real stream"""
+
+    def __init__(self, text: str, model: str, latency: float, tokens_per_second: float):
+        self._text = text
+        self._model = model
+        self._latency = latency
+        self._tokens_per_second = tokens_per_second
+        self.closed = False
+
+    def __aiter__(self) -> AsyncIterator[ChatCompletionChunk]:
+        return self._chunks()
+
+    async def _chunks(self) -> AsyncIterator[ChatCompletionChunk]:
+        await asyncio.sleep(self._latency)
+        delay = 1 / self._tokens_per_second if self._tokens_per_second > 0 else 0
+
+        for i in range(0, len(self._text), CHARS_PER_TOKEN):
+            if self.closed:
+                return
+            if delay:
+                await asyncio.sleep(delay)
+            yield ChatCompletionChunk(
+                id="fake-stream",
+                object="chat.completion.chunk",
+                created=int(time.time()),
+                model=self._model,
+                choices=[ChunkChoice(
+                    index=0,
+                    delta=ChoiceDelta(content=self._text[i:i + CHARS_PER_TOKEN]),
+                    finish_reason=None,
+                )],
+            )
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeLLMBackend:
+    """Drop-in replacement for the OpenAI transport used by LLMClient"""
+
+    def __init__(self, latency: float = 0.5, tokens_per_second: float = 50.0, output_tokens: int = 400):
+        """
+        Initialize fake backend
+
+        Args:
+            latency: Seconds before the first token
+            tokens_per_second: Generation speed (0 = instant)
+            output_tokens: Approximate body length in tokens (capped by max_tokens)
+        """
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.output_tokens = output_tokens
+        self.requests = 0
+
+    async def create(self, **kwargs) -> Any:
+        """
+        Mimic chat.completions.create
+
+        Args:
+            **kwargs: model, messages, max_tokens, response_format, stream, ...
+
+        Returns:
+            ChatCompletion, or FakeStream when stream=True
+        """
+        self.requests += 1
+        model = kwargs.get("model", "fake")
+        text = self.render(kwargs.get("messages", []), kwargs.get("response_format"), kwargs.get("max_tokens"))
+
+        if kwargs.get("stream"):
+            return FakeStream(text, model, self.latency, self.tokens_per_second)
+
+        completion_tokens = max(1, len(text) // CHARS_PER_TOKEN)
+        duration = self.latency
+        if self.tokens_per_second > 0:
+            duration += completion_tokens / self.tokens_per_second
+        await asyncio.sleep(duration)
+
+        prompt_tokens = sum(len(m.get("content", "")) for m in kwargs.get("messages", [])) // CHARS_PER_TOKEN
+        return ChatCompletion(
+            id="fake-completion",
+            object="chat.completion",
+            created=int(time.time()),
+            model=model,
+            choices=[Choice(
+                index=0,
+                finish_reason="stop",
+                message=ChatCompletionMessage(role="assistant", content=text),
+            )],
+            usage=CompletionUsage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+        )
+
+    async def close(self) -> None:
+        pass
+
+    def render(
+        self,
+        messages: List[Dict[str, str]],
+        response_format: Optional[Dict[str, str]] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Build the deterministic response text for a prompt
+
+        Args:
+            messages: Chat messages
+            response_format: OpenAI response_format (json_object -> JSON output)
+            max_tokens: Completion token limit
+
+        Returns:
+            Response text in the format the prompt asks for
+        """
+        prompt = messages[-1]["content"] if messages else ""
+        seed = hashlib.sha256(json.dumps(messages, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+        rng = random.Random(seed)
+
+        body_tokens = self.output_tokens
+        if max_tokens:
+            body_tokens = min(body_tokens, max_tokens - 50)
+        words = max(20, body_tokens * CHARS_PER_TOKEN // 6)
+
+        title = f"{' '.join(rng.sample(_WORDS, 3))} 가이드 #{seed[:6]}"
+        excerpt = f"{' '.join(rng.sample(_WORDS, 5))}에 대한 요약입니다."
+        tags = rng.sample(_TAGS, 4)
+        markdown = _markdown_body(rng, words)
+
+        if response_format and response_format.get("type") == "json_object":
+            if "html_content" in prompt:
+                return json.dumps({
+                    "title": title,
+                    "summary": excerpt,
+                    "html_content": _html_body(rng, words),
+                }, ensure_ascii=False)
+            return json.dumps({
+                "title": title,
+                "excerpt": excerpt,
+                "content": markdown,
+                "tags": tags,
+                "slug": f"fake-post-{seed[:8]}",
+            }, ensure_ascii=False)
+
+        if "NAME:" in prompt:
+            return (
+                f"NAME: {rng.choice(_WORDS)} {rng.choice(_WORDS)} 프로젝트\n\n"
+                f"DESCRIPTION: {excerpt}\n\n"
+                f"CATEGORY: {rng.choice(_CATEGORIES)}\n\n"
+                f"TECH_STACK: {', '.join(rng.sample(_TAGS, 3))}\n\n"
+                f"CONTENT:\n{markdown}\n\n---\n"
+            )
+
+        if "EXCERPT:" in prompt:
+            return (
+                f"TITLE: {title}\n\n"
+                f"EXCERPT: {excerpt}\n\n"
+                f"TAGS: {', '.join(tags)}\n\n"
+                f"CONTENT:\n{markdown}\n\n---\n"
+            )
+
+        return f"TITLE: {title}\n\nCONTENT:\n{_html_body(rng, words)}\n\n---\n"
+
+
+def _sentences(rng: random.Random, words: int) -> List[str]:
+    sentences = []
+    remaining = words
+    while remaining > 0:
+        n = min(remaining, rng.randint(6, 12))
+        sentences.append(" ".join(rng.choice(_WORDS) for _ in range(n)) + ".")
+        remaining -= n
+    return sentences
+
+
+def _markdown_body(rng: random.Random, words: int) -> str:
+    sentences = _sentences(rng, words)
+    sections = []
+    for i in range(0, len(sentences), 4):
+        sections.append(f"## {rng.choice(_WORDS)} {i // 4 + 1}\n\n" + " ".join(sentences[i:i + 4]))
+    sections.append("```python\nprint('hello')\n```")
+    return "\n\n".join(sections)
+
+
+def _html_body(rng: random.Random, words: int) -> str:
+    sentences = _sentences(rng, words)
+    parts = []
+    for i in range(0, len(sentences), 4):
+        parts.append(f"<h2>{rng.choice(_WORDS)}</h2>\n<p>{' '.join(sentences[i:i + 4])}</p>")
+    return "\n".join(parts)
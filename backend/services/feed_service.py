@@ -0,0 +1,353 @@
+"""
+Feed Service
+
+RSS (/feed.xml), Atom (/atom.xml) and sitemap (/sitemap.xml) documents,
+generated ahead of time instead of per crawler request:
+
+- enqueue_regenerate: called by the blog/project/activity write paths in the
+  same transaction; queues one `feeds.regenerate` task per
+  FEED_REGENERATE_DELAY_SECONDS window however many writes happen in it
+- regenerate_feeds: builds all three documents and rewrites a
+  feed_documents row only when its XML changed, stored gzip-compressed
+  with its SHA-256 (ETag) and the time it last changed (Last-Modified)
+- get_document: the stored document, cached in-process for
+  FEED_CACHE_SECONDS, so crawlers cost one primary-key read per document
+  per replica per interval (and nothing on a 304)
+
+Dates come from published_at / created_at / activity_date rather than
+updated_at, which also moves on every counted view.
+"""
+import asyncio
+import gzip
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+from xml.etree import ElementTree as ET
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from loguru import logger
+
+from core.config import settings
+from core.database import AsyncSessionLocal, dialect_insert
+from models.activity import Activity
+from models.blog import Blog, BlogStatus
+from models.feed import FeedDocument
+from models.project import Project, ProjectStatus
+from models.task import Task, TaskStatus
+from services import task_queue
+from utils.search_index import plain_text
+
+
+SUMMARY_CHARS = 300  # Feed entry summary length when a post has no excerpt
+SITEMAP_MAX_URLS = 50_000  # Sitemap protocol limit per file
+
+# name -> (checked at, document)
+_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_lock = asyncio.Lock()
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Naive datetimes are stored as UTC"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _url(path: str) -> str:
+    """Absolute site URL (Korean slugs percent-encoded, as sitemaps require)"""
+    return settings.SITE_URL.rstrip("/") + quote(path, safe="/#")
+
+
+# ============ Enqueueing ============
+
+async def enqueue_regenerate(db: AsyncSession) -> None:
+    """
+    Queue a regeneration after a content change (debounced)
+
+    Only flushed: the task is committed together with the caller's change.
+    Skipped when a regeneration is already queued to start later than one
+    second from now, which is then guaranteed to see this change.
+
+    Args:
+        db: Database session
+    """
+    pending = await db.execute(
+        select(Task.id)
+        .where(
+            Task.name == "feeds.regenerate",
+            Task.status == TaskStatus.QUEUED,
+            Task.run_at > datetime.now(timezone.utc) + timedelta(seconds=1),
+        )
+        .limit(1)
+    )
+    if pending.first() is None:
+        await task_queue.enqueue_task(
+            db, "feeds.regenerate", {}, delay_seconds=settings.FEED_REGENERATE_DELAY_SECONDS, commit=False,
+        )
+
+
+# ============ Building ============
+
+async def _feed_entries(db: AsyncSession) -> List[Dict[str, Any]]:
+    """Newest FEED_MAX_ITEMS blogs, projects and activities, newest first"""
+    limit = settings.FEED_MAX_ITEMS
+    entries = []
+
+    result = await db.execute(
+        select(Blog.title, Blog.slug, Blog.excerpt, Blog.content, Blog.tags, Blog.author_name,
+               func.coalesce(Blog.published_at, Blog.created_at))
+        .where(Blog.status == BlogStatus.PUBLISHED)
+        .order_by(Blog.published_at.desc().nulls_last(), Blog.created_at.desc())
+        .limit(limit)
+    )
+    for title, slug, excerpt, content, tags, author, published in result.all():
+        link = _url(f"/blog/{slug}")
+        entries.append({
+            "id": link, "title": title, "link": link, "published": _utc(published), "author": author,
+            "summary": excerpt or plain_text(content)[:SUMMARY_CHARS],
+            "categories": ["Blog"] + [tag for tag in (tags or "").split(",") if tag],
+        })
+
+    result = await db.execute(
+        select(Project.name, Project.slug, Project.description, Project.category, Project.created_at)
+        .where(Project.status != ProjectStatus.ARCHIVED)
+        .order_by(Project.created_at.desc())
+        .limit(limit)
+    )
+    for name, slug, description, category, created_at in result.all():
+        link = _url(f"/project/{slug}")
+        entries.append({
+            "id": link, "title": name, "link": link, "published": _utc(created_at), "author": None,
+            "summary": description or "",
+            "categories": ["Project"] + ([category] if category else []),
+        })
+
+    # Activities have no page of their own: link into the activity list
+    result = await db.execute(
+        select(Activity.id, Activity.title, Activity.description, Activity.type, Activity.activity_date)
+        .order_by(Activity.activity_date.desc(), Activity.id.desc())
+        .limit(limit)
+    )
+    for activity_id, title, description, activity_type, activity_date in result.all():
+        entries.append({
+            "id": _url(f"/activity#activity-{activity_id}"), "title": title, "link": _url("/activity"),
+            "published": _utc(activity_date), "author": None,
+            "summary": plain_text(description)[:SUMMARY_CHARS],
+            "categories": ["Activity", activity_type.value],
+        })
+
+    entries.sort(key=lambda entry: (entry["published"], entry["id"]), reverse=True)
+    return entries[:limit]
+
+
+def _xml(root: ET.Element) -> bytes:
+    return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+def _sub(parent: ET.Element, tag: str, text: Optional[str] = None, **attributes) -> ET.Element:
+    element = ET.SubElement(parent, tag, attributes)
+    if text is not None:
+        element.text = text
+    return element
+
+
+def build_rss(entries: List[Dict[str, Any]]) -> bytes:
+    """
+    RSS 2.0 feed
+
+    Args:
+        entries: _feed_entries() output
+
+    Returns:
+        UTF-8 XML
+    """
+    rss = ET.Element("rss", {"version": "2.0", "xmlns:atom": "http://www.w3.org/2005/Atom"})
+    channel = _sub(rss, "channel")
+    _sub(channel, "title", settings.SITE_NAME)
+    _sub(channel, "link", _url("/"))
+    _sub(channel, "description", settings.SITE_DESCRIPTION)
+    _sub(channel, "language", "ko")
+    _sub(channel, "atom:link", href=_url("/feed.xml"), rel="self", type="application/rss+xml")
+    if entries:
+        # Newest entry, not the build time: unchanged content gives identical bytes
+        _sub(channel, "lastBuildDate", format_datetime(entries[0]["published"], usegmt=True))
+
+    for entry in entries:
+        item = _sub(channel, "item")
+        _sub(item, "title", entry["title"])
+        _sub(item, "link", entry["link"])
+        _sub(item, "guid", entry["id"], isPermaLink="true" if entry["id"] == entry["link"] else "false")
+        _sub(item, "description", entry["summary"])
+        _sub(item, "pubDate", format_datetime(entry["published"], usegmt=True))
+        for category in entry["categories"]:
+            _sub(item, "category", category)
+    return _xml(rss)
+
+
+def build_atom(entries: List[Dict[str, Any]]) -> bytes:
+    """
+    Atom 1.0 feed
+
+    Args:
+        entries: _feed_entries() output
+
+    Returns:
+        UTF-8 XML
+    """
+    feed = ET.Element("feed", {"xmlns": "http://www.w3.org/2005/Atom", "xml:lang": "ko"})
+    _sub(feed, "title", settings.SITE_NAME)
+    _sub(feed, "subtitle", settings.SITE_DESCRIPTION)
+    _sub(feed, "link", href=_url("/"))
+    _sub(feed, "link", href=_url("/atom.xml"), rel="self", type="application/atom+xml")
+    _sub(feed, "id", _url("/"))
+    updated = entries[0]["published"] if entries else datetime(2025, 1, 1, tzinfo=timezone.utc)
+    _sub(feed, "updated", updated.isoformat())
+    _sub(_sub(feed, "author"), "name", settings.SITE_NAME)
+
+    for entry in entries:
+        element = _sub(feed, "entry")
+        _sub(element, "title", entry["title"])
+        _sub(element, "link", href=entry["link"])
+        _sub(element, "id", entry["id"])
+        _sub(element, "published", entry["published"].isoformat())
+        _sub(element, "updated", entry["published"].isoformat())
+        if entry["author"]:
+            _sub(_sub(element, "author"), "name", entry["author"])
+        _sub(element, "summary", entry["summary"])
+        for category in entry["categories"]:
+            _sub(element, "category", term=category)
+    return _xml(feed)
+
+
+async def build_sitemap(db: AsyncSession) -> bytes:
+    """
+    Sitemap of list pages, published blog posts and visible projects
+
+    Args:
+        db: Database session
+
+    Returns:
+        UTF-8 XML
+    """
+    blogs = (await db.execute(
+        select(Blog.slug, func.coalesce(Blog.published_at, Blog.created_at))
+        .where(Blog.status == BlogStatus.PUBLISHED)
+        .order_by(Blog.id)
+    )).all()
+    projects = (await db.execute(
+        select(Project.slug, Project.created_at)
+        .where(Project.status != ProjectStatus.ARCHIVED)
+        .order_by(Project.id)
+    )).all()
+    latest_activity = (await db.execute(select(func.max(Activity.activity_date)))).scalar()
+
+    latest_blog = max((_utc(date) for _, date in blogs), default=None)
+    latest_project = max((_utc(date) for _, date in projects), default=None)
+    urls = [
+        ("/", max(filter(None, (latest_blog, latest_project)), default=None)),
+        ("/blog", latest_blog),
+        ("/projects", latest_project),
+        ("/activity", _utc(latest_activity)),
+    ]
+    urls += [(f"/blog/{slug}", _utc(date)) for slug, date in blogs]
+    urls += [(f"/project/{slug}", _utc(date)) for slug, date in projects]
+    if len(urls) > SITEMAP_MAX_URLS:
+        logger.warning(f"Sitemap truncated to {SITEMAP_MAX_URLS} of {len(urls)} URLs")
+        urls = urls[:SITEMAP_MAX_URLS]
+
+    urlset = ET.Element("urlset", {"xmlns": "http://www.sitemaps.org/schemas/sitemap/0.9"})
+    for path, lastmod in urls:
+        url = _sub(urlset, "url")
+        _sub(url, "loc", _url(path))
+        if lastmod:
+            _sub(url, "lastmod", lastmod.replace(microsecond=0).isoformat())
+    return _xml(urlset)
+
+
+async def _store(db: AsyncSession, name: str, xml: bytes, now: datetime) -> bool:
+    """Write a document if its XML changed (else only mark it regenerated); the caller commits"""
+    etag = hashlib.sha256(xml).hexdigest()
+    current = (await db.execute(select(FeedDocument.etag).where(FeedDocument.name == name))).scalar()
+    if current == etag:
+        await db.execute(
+            FeedDocument.__table__.update().where(FeedDocument.name == name).values(generated_at=now)
+        )
+        return False
+
+    values = {
+        "name": name,
+        # mtime=0: identical XML always compresses to identical bytes
+        "content": gzip.compress(xml, compresslevel=9, mtime=0),
+        "etag": etag,
+        "size": len(xml),
+        "last_modified": now,
+        "generated_at": now,
+    }
+    statement = dialect_insert(db, FeedDocument).values(**values)
+    await db.execute(statement.on_conflict_do_update(
+        index_elements=["name"],
+        set_={key: value for key, value in values.items() if key != "name"},
+    ))
+    return True
+
+
+async def regenerate_feeds() -> Dict[str, bool]:
+    """
+    Rebuild the RSS/Atom feeds and sitemap
+
+    Returns:
+        Document name -> whether it changed
+    """
+    async with _lock:
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as db:
+            entries = await _feed_entries(db)
+            documents = {
+                "feed.xml": build_rss(entries),
+                "atom.xml": build_atom(entries),
+                "sitemap.xml": await build_sitemap(db),
+            }
+            changed = {name: await _store(db, name, xml, now) for name, xml in documents.items()}
+            await db.commit()
+
+    _cache.clear()
+    logger.info(f"Feeds regenerated: {changed}")
+    return changed
+
+
+# ============ Serving ============
+
+async def get_document(db: AsyncSession, name: str) -> Dict[str, Any]:
+    """
+    Stored feed or sitemap (generated on first use)
+
+    Args:
+        db: Database session
+        name: "feed.xml", "atom.xml" or "sitemap.xml"
+
+    Returns:
+        {"gzip", "xml", "etag", "last_modified"}
+    """
+    cached = _cache.get(name)
+    if cached and time.monotonic() - cached[0] < settings.FEED_CACHE_SECONDS:
+        return cached[1]
+
+    query = select(FeedDocument.content, FeedDocument.etag, FeedDocument.last_modified).where(FeedDocument.name == name)
+    row = (await db.execute(query)).first()
+    if row is None:
+        await regenerate_feeds()
+        row = (await db.execute(query)).first()
+
+    content, etag, last_modified = row
+    document = {
+        "gzip": content,
+        "xml": gzip.decompress(content),
+        "etag": etag,
+        "last_modified": _utc(last_modified),
+    }
+    _cache[name] = (time.monotonic(), document)
+    return document
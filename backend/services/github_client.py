@@ -0,0 +1,344 @@
+"""
+GitHub API Client
+
+Shared, pooled client for the GitHub REST API:
+- one httpx.AsyncClient (connection reuse), optional GITHUB_TOKEN auth
+- repo metadata and README fetched concurrently
+- ETag / If-None-Match cache persisted to disk; 304 responses do not count
+  against the rate limit and are served from the cache
+- X-RateLimit-* tracking: while the limit is exhausted, cached (possibly
+  stale) responses are served and uncached requests are skipped
+"""
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from uuid import uuid4
+
+import httpx
+from loguru import logger
+
+from core.config import settings
+
+
+GITHUB_URL_PATTERN = re.compile(r'https?://(?:www\.)?github\.com/([^/\s]+)/([^/\s#?]+)', re.IGNORECASE)
+
+
+def parse_github_url(github_url: str) -> Optional[Tuple[str, str]]:
+    """
+    Extract (owner, repo) from a GitHub repository URL
+
+    Args:
+        github_url: e.g. https://github.com/owner/repo(.git)(/tree/main)
+
+    Returns:
+        (owner, repo) or None if the URL is not a GitHub repository URL
+    """
+    match = GITHUB_URL_PATTERN.match(github_url.strip())
+    if not match:
+        return None
+
+    owner, repo = match.groups()
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    return owner, repo
+
+
+@dataclass
+class CachedResponse:
+    """Cached GitHub response body with its validators"""
+    status_code: int
+    text: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    from_cache: bool = False
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class GitHubClient:
+    """Pooled GitHub REST client with a persistent ETag cache"""
+
+    def __init__(
+        self,
+        base_url: str,
+        token: Optional[str],
+        cache_dir: str,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize client
+
+        Args:
+            base_url: API root (https://api.github.com, or a local stub)
+            token: Optional personal access token (raises the limit to 5000/h)
+            cache_dir: Directory for the ETag cache
+            timeout: Request timeout in seconds
+            transport: Optional httpx transport (tests / stubs)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.cache_dir = Path(cache_dir)
+        self.timeout = timeout
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Rate limit state (from the latest response headers)
+        self.rate_limit: Optional[int] = None
+        self.rate_remaining: Optional[int] = None
+        self.rate_reset: Optional[float] = None
+
+        # Metrics
+        self.requests = 0
+        self.not_modified = 0
+        self.cache_served = 0
+        self.rate_limited = 0
+        self.errors = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            headers = {
+                "Accept": "application/vnd.github+json",
+                "User-Agent": "gongjakso-tft-backend",
+                "X-GitHub-Api-Version": "2022-11-28",
+            }
+            if self.token:
+                headers["Authorization"] = f"Bearer {self.token}"
+
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                transport=self._transport,
+            )
+        return self._client
+
+    # ============ ETag Cache ============
+
+    def _cache_path(self, path: str, accept: str) -> Path:
+        key = hashlib.sha256(f"{self.base_url}{path}|{accept}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, path: str, accept: str) -> Optional[CachedResponse]:
+        try:
+            with self._cache_path(path, accept).open("r", encoding="utf-8") as f:
+                return CachedResponse(**json.load(f), from_cache=True)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Discarding unreadable GitHub cache entry for {path}: {e}")
+            return None
+
+    def _store(self, path: str, accept: str, response: CachedResponse) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        target = self._cache_path(path, accept)
+        # Unique per write: concurrent requests for the same path share a pid
+        tmp_path = target.with_suffix(f".{os.getpid()}.{uuid4().hex}.tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump({
+                    "status_code": response.status_code,
+                    "text": response.text,
+                    "etag": response.etag,
+                    "last_modified": response.last_modified,
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, target)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    # ============ Rate Limit ============
+
+    def _update_rate_limit(self, response: httpx.Response) -> None:
+        headers = response.headers
+        try:
+            if "x-ratelimit-limit" in headers:
+                self.rate_limit = int(headers["x-ratelimit-limit"])
+            if "x-ratelimit-remaining" in headers:
+                self.rate_remaining = int(headers["x-ratelimit-remaining"])
+            if "x-ratelimit-reset" in headers:
+                self.rate_reset = float(headers["x-ratelimit-reset"])
+        except ValueError:
+            return
+
+        if self.rate_remaining is not None and self.rate_remaining <= 5:
+            logger.warning(
+                f"GitHub rate limit nearly exhausted: {self.rate_remaining}/{self.rate_limit} "
+                f"(resets in {self.seconds_until_reset:.0f}s)"
+            )
+
+    @property
+    def seconds_until_reset(self) -> float:
+        if self.rate_reset is None:
+            return 0.0
+        return max(0.0, self.rate_reset - time.time())
+
+    @property
+    def is_rate_limited(self) -> bool:
+        return self.rate_remaining == 0 and self.seconds_until_reset > 0
+
+    # ============ Requests ============
+
+    async def get(self, path: str, accept: str = "application/vnd.github+json") -> Optional[CachedResponse]:
+        """
+        Conditional GET through the ETag cache
+
+        Args:
+            path: API path, e.g. /repos/owner/repo
+            accept: Accept header (e.g. application/vnd.github.raw for README)
+
+        Returns:
+            Fresh or cached response, or None (not found / unavailable)
+        """
+        cached = await asyncio.to_thread(self._load, path, accept)
+
+        if self.is_rate_limited:
+            self.rate_limited += 1
+            if cached:
+                self.cache_served += 1
+                return cached
+            logger.warning(f"GitHub rate limit exhausted, skipping {path}")
+            return None
+
+        headers = {"Accept": accept}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        elif cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            self.requests += 1
+            response = await self.client.get(path, headers=headers)
+        except httpx.HTTPError as e:
+            self.errors += 1
+            logger.warning(f"GitHub request failed for {path}: {e}")
+            if cached:
+                self.cache_served += 1
+            return cached
+
+        self._update_rate_limit(response)
+
+        if response.status_code == 304 and cached:
+            self.not_modified += 1
+            self.cache_served += 1
+            return cached
+
+        if response.status_code == 200:
+            fresh = CachedResponse(
+                status_code=200,
+                text=response.text,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
+            if fresh.etag or fresh.last_modified:
+                try:
+                    await asyncio.to_thread(self._store, path, accept, fresh)
+                except OSError as e:
+                    logger.warning(f"Failed to write GitHub cache entry for {path}: {e}")
+            return fresh
+
+        if response.status_code == 404:
+            return None
+
+        if response.status_code in (403, 429) and self.rate_remaining == 0:
+            self.rate_limited += 1
+            logger.warning(f"GitHub rate limit hit for {path}")
+        else:
+            self.errors += 1
+            logger.warning(f"GitHub API error {response.status_code} for {path}")
+
+        # Serve stale data rather than nothing
+        if cached:
+            self.cache_served += 1
+        return cached
+
+    async def get_repo(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+        """
+        Repository metadata
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            GitHub repo JSON or None
+        """
+        response = await self.get(f"/repos/{owner}/{repo}")
+        return response.json() if response else None
+
+    async def get_readme(self, owner: str, repo: str) -> Optional[str]:
+        """
+        Raw README text
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            README markdown or None
+        """
+        response = await self.get(f"/repos/{owner}/{repo}/readme", accept="application/vnd.github.raw")
+        return response.text if response else None
+
+    async def get_repo_with_readme(self, owner: str, repo: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch repository metadata and README concurrently
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            (repo JSON or None, README text or None)
+        """
+        repo_data, readme = await asyncio.gather(
+            self.get_repo(owner, repo),
+            self.get_readme(owner, repo),
+            return_exceptions=True,
+        )
+        if isinstance(repo_data, Exception):
+            logger.error(f"Failed to fetch GitHub repo {owner}/{repo}: {repo_data}")
+            repo_data = None
+        if isinstance(readme, Exception):
+            logger.warning(f"Failed to fetch README for {owner}/{repo}: {readme}")
+            readme = None
+        return repo_data, readme
+
+    def stats(self) -> Dict[str, Any]:
+        """Request, cache and rate limit counters"""
+        return {
+            "authenticated": bool(self.token),
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "cache_served": self.cache_served,
+            "rate_limited": self.rate_limited,
+            "errors": self.errors,
+            "rate_limit": {
+                "limit": self.rate_limit,
+                "remaining": self.rate_remaining,
+                "resets_in_seconds": round(self.seconds_until_reset),
+            },
+        }
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+github_client = GitHubClient(
+    base_url=settings.GITHUB_API_URL,
+    token=settings.GITHUB_TOKEN,
+    cache_dir=settings.GITHUB_CACHE_DIR,
+    timeout=settings.GITHUB_TIMEOUT_SECONDS,
+)
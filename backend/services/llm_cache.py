@@ -0,0 +1,223 @@
+"""
+LLM Completion Cache
+
+Content-addressed, disk-backed cache for chat completions. Entries are keyed
+by a SHA-256 of the model, generation parameters and the full message list,
+stored one JSON file per key, expired by TTL and evicted least-recently-used
+(file mtime is refreshed on every hit) once LLM_CACHE_MAX_ENTRIES is exceeded.
+
+Writes keep a running entry count instead of listing the directory; it is
+resynced by a full scan when it passes the limit (eviction then trims to
+90% of it) and every EVICT_CHECK_WRITES writes, which also bounds drift
+from other processes sharing the directory.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from loguru import logger
+
+from core.config import settings
+
+
+EVICT_CHECK_WRITES = 100  # Full directory scan at least this often
+EVICT_LOW_WATER = 0.9  # Eviction trims to this share of max_entries
+
+
+def make_cache_key(model: str, params: Dict[str, Any], messages: List[Dict[str, str]]) -> str:
+    """
+    Build the cache key for a completion request
+
+    Args:
+        model: Model name
+        params: Generation parameters (max_tokens, temperature, ...)
+        messages: Chat messages (system + built prompt)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        {"model": model, "params": params, "messages": messages},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Disk-backed completion cache with TTL/LRU eviction and hit/miss metrics"""
+
+    def __init__(self, directory: str, ttl_seconds: int, max_entries: int, enabled: bool = True):
+        """
+        Initialize cache
+
+        Args:
+            directory: Directory holding one JSON file per entry
+            ttl_seconds: Entry lifetime
+            max_entries: Maximum number of entries kept on disk
+            enabled: If False, get() always misses and set() is a no-op
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self._entries: Optional[int] = None  # Running count, None until the first scan
+        self._writes_since_scan = 0
+        self._count_lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable LLM cache entry {key}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            self.evictions += 1
+            return None
+
+        # Refresh mtime so LRU eviction keeps recently used entries
+        os.utime(path, None)
+        return entry["content"]
+
+    def _write(self, key: str, content: str, model: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write-then-rename so concurrent readers never see a partial file;
+        # unique per write, as same-key writes can overlap in one process
+        path = self._path(key)
+        is_new = not path.exists()
+        tmp_path = self.directory / f".{key}.{os.getpid()}.{uuid4().hex}.tmp"
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump({"model": model, "created_at": time.time(), "content": content}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        with self._count_lock:
+            self._writes_since_scan += 1
+            if self._entries is not None and is_new:
+                self._entries += 1
+            if (
+                self._entries is None
+                or self._entries > self.max_entries
+                or self._writes_since_scan >= EVICT_CHECK_WRITES
+            ):
+                self._evict()
+
+    def _evict(self) -> None:
+        """Scan the directory and drop least-recently-used entries beyond max_entries (count lock held)"""
+        entries = list(self.directory.glob("*.json"))
+        self._writes_since_scan = 0
+        self._entries = len(entries)
+        if len(entries) <= self.max_entries:
+            return
+
+        # Trim below the limit so the next writes do not trigger another scan
+        overflow = len(entries) - int(self.max_entries * EVICT_LOW_WATER)
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:overflow]:
+            path.unlink(missing_ok=True)
+            self.evictions += 1
+        self._entries -= overflow
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached completion
+
+        Args:
+            key: Key from make_cache_key
+
+        Returns:
+            Cached completion text or None
+        """
+        if not self.enabled:
+            return None
+
+        content = await asyncio.to_thread(self._read, key)
+        if content is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return content
+
+    async def set(self, key: str, content: str, model: str) -> None:
+        """
+        Store a completion (errors are logged, never raised)
+
+        Args:
+            key: Key from make_cache_key
+            content: Completion text
+            model: Model name (stored for inspection)
+        """
+        if not self.enabled or not content:
+            return
+
+        try:
+            await asyncio.to_thread(self._write, key, content, model)
+            self.writes += 1
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry {key}: {e}")
+
+    def clear(self) -> int:
+        """
+        Remove all entries
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        with self._count_lock:
+            self._entries = None
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        entries = len(list(self.directory.glob("*.json"))) if self.directory.exists() else 0
+        return {
+            "enabled": self.enabled,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+
+llm_cache = LLMCache(
+    directory=settings.LLM_CACHE_DIR,
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    enabled=settings.LLM_CACHE_ENABLED,
+)
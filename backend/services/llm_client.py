@@ -0,0 +1,422 @@
+"""
+Shared LLM Client
+
+One LLM client for the whole process. The transport is pluggable
+(LLM_BACKEND): "openai" uses a pooled AsyncOpenAI client, "fake" uses the
+deterministic local backend in services.fake_llm. Either way calls go through:
+- a global semaphore bounding concurrent LLM calls
+- a per-attempt timeout
+- retries with jittered exponential backoff (Retry-After aware)
+- a circuit breaker that fails fast while the API keeps erroring
+- queue depth / latency / token usage metrics
+"""
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Protocol
+
+import httpx
+import openai
+from openai import AsyncOpenAI
+from loguru import logger
+
+from core.config import settings
+from utils.prompt_budget import count_message_tokens
+
+
+# Errors worth retrying (and counted by the circuit breaker)
+RETRYABLE_ERRORS = (
+    asyncio.TimeoutError,
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+class LLMBackend(Protocol):
+    """Transport used by LLMClient (mirrors chat.completions.create)"""
+
+    async def create(self, **kwargs) -> Any:
+        """Return a ChatCompletion, or an async stream of chunks when stream=True"""
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class OpenAIBackend:
+    """OpenAI API transport with a tuned HTTP connection pool"""
+
+    def __init__(self, api_key: str, timeout: float, max_connections: int, max_keepalive: int):
+        """
+        Initialize backend
+
+        Args:
+            api_key: OpenAI API key
+            timeout: HTTP timeout in seconds
+            max_connections: HTTP connection pool size
+            max_keepalive: Idle keep-alive connections to retain
+        """
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=0,  # Retries are handled by LLMClient, with jitter and the breaker
+            timeout=timeout,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive,
+                    keepalive_expiry=60,
+                ),
+                timeout=httpx.Timeout(timeout, connect=10.0),
+            ),
+        )
+
+    async def create(self, **kwargs) -> Any:
+        return await self.client.chat.completions.create(**kwargs)
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the API while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half-open)"""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_progress = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half-open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may proceed"""
+        state = self.state
+        if state == "open":
+            raise CircuitOpenError("LLM circuit breaker is open")
+        if state == "half-open":
+            # Allow a single trial call; everyone else keeps failing fast
+            if self._trial_in_progress:
+                raise CircuitOpenError("LLM circuit breaker is half-open")
+            self._trial_in_progress = True
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info("LLM circuit breaker closed")
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_progress = False
+
+    def release_trial(self) -> None:
+        """Free the half-open trial slot of a call that ended without an outcome (e.g. cancelled)"""
+        self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_progress = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning(f"LLM circuit breaker opened after {self.failures} consecutive failures")
+            self.opened_at = time.monotonic()
+
+
+class LLMClient:
+    """Process-wide LLM client with concurrency limiting, retries and a circuit breaker"""
+
+    def __init__(
+        self,
+        backend: LLMBackend,
+        max_concurrency: int,
+        timeout: float,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float,
+        failure_threshold: int,
+        reset_seconds: float,
+    ):
+        """
+        Initialize client
+
+        Args:
+            backend: Transport (OpenAIBackend or FakeLLMBackend)
+            max_concurrency: Maximum concurrent LLM calls (process-wide)
+            timeout: Per-attempt timeout in seconds
+            max_retries: Retries after the first attempt
+            backoff_base: Base delay for exponential backoff
+            backoff_max: Backoff ceiling
+            failure_threshold: Consecutive failures before the circuit opens
+            reset_seconds: How long the circuit stays open
+        """
+        self.backend = backend
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_concurrency = max_concurrency
+        self.breaker = CircuitBreaker(failure_threshold, reset_seconds)
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Metrics
+        self.waiting = 0
+        self.active = 0
+        self.calls = 0
+        self.failures = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._latencies: deque = deque(maxlen=500)
+        self._prompt_sizes: deque = deque(maxlen=500)
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential backoff, honouring Retry-After on 429s"""
+        if isinstance(error, openai.RateLimitError):
+            retry_after = error.response.headers.get("retry-after")
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except (TypeError, ValueError):
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        """Hold one of the max_concurrency slots"""
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+    async def _with_retries(self, attempt_call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run attempt_call through the circuit breaker, retrying retryable errors"""
+        attempt = 0
+        while True:
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                self.rejected += 1
+                raise
+
+            try:
+                result = await attempt_call()
+            except RETRYABLE_ERRORS as e:
+                self.failures += 1
+                if isinstance(e, (asyncio.TimeoutError, openai.APITimeoutError)):
+                    self.timeouts += 1
+                self.breaker.record_failure()
+
+                if attempt >= self.max_retries:
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise TimeoutError(f"LLM call timed out after {self.timeout}s") from e
+                    raise
+
+                delay = self._backoff(attempt, e)
+                attempt += 1
+                self.retries += 1
+                logger.warning(
+                    f"LLM call failed ({e.__class__.__name__}), "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                # Non-retryable (bad request, auth, ...): the API itself is reachable
+                self.failures += 1
+                self.breaker.record_success()
+                raise
+            except BaseException:
+                # Cancelled (job timeout, client disconnect, shutdown): says nothing
+                # about the API, but a half-open trial must not keep its slot forever
+                self.breaker.release_trial()
+                raise
+
+            self.breaker.record_success()
+            return result
+
+    async def _create(self, **kwargs) -> Any:
+        """One timed API attempt (caller holds a concurrency slot)"""
+        self.calls += 1
+        started = time.monotonic()
+        result = await asyncio.wait_for(
+            self.backend.create(**kwargs),
+            timeout=self.timeout,
+        )
+        self._latencies.append(time.monotonic() - started)
+        return result
+
+    def _record_tokens(self, kwargs: Dict[str, Any], usage: Any = None) -> None:
+        """Record and log prompt size (API usage if reported, else an estimate)"""
+        model = kwargs.get("model", "")
+        if usage is not None:
+            prompt_tokens = usage.prompt_tokens
+            completion_tokens = usage.completion_tokens
+        else:
+            prompt_tokens = count_message_tokens(kwargs.get("messages", []), model)
+            completion_tokens = None
+
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens or 0
+        self._prompt_sizes.append(prompt_tokens)
+
+        estimated = "" if usage is not None else "~"
+        completion = f", completion {completion_tokens}" if completion_tokens is not None else ""
+        logger.info(f"LLM call ({model}): prompt {estimated}{prompt_tokens} tokens{completion}")
+
+    async def chat(self, **kwargs) -> Any:
+        """
+        Create a chat completion
+
+        Each attempt holds a concurrency slot; backoff sleeps do not.
+
+        Args:
+            **kwargs: chat.completions.create arguments (model, messages, ...)
+
+        Returns:
+            ChatCompletion
+        """
+        async def attempt_call():
+            async with self._slot():
+                return await self._create(**kwargs)
+
+        result = await self._with_retries(attempt_call)
+        self._record_tokens(kwargs, getattr(result, "usage", None))
+        return result
+
+    @asynccontextmanager
+    async def stream_chat(self, **kwargs) -> AsyncIterator[Any]:
+        """
+        Create a streaming chat completion
+
+        The concurrency slot is held until the stream is closed. Only opening
+        the stream is retried; errors mid-stream propagate.
+
+        Args:
+            **kwargs: chat.completions.create arguments (stream=True is implied)
+
+        Yields:
+            AsyncStream of ChatCompletionChunk
+        """
+        async with self._slot():
+            stream = await self._with_retries(lambda: self._create(stream=True, **kwargs))
+            self._record_tokens(kwargs)
+            try:
+                yield stream
+            finally:
+                await stream.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Queue depth, concurrency, error counters, token usage and latency percentiles
+
+        Latency is per attempt, excluding queue wait (time to the first
+        response chunk for streams).
+        """
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 3)
+
+        return {
+            "backend": self.backend.__class__.__name__,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.waiting,
+            "active": self.active,
+            "calls": self.calls,
+            "failures": self.failures,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "rejected_by_circuit": self.rejected,
+            "circuit_state": self.breaker.state,
+            "tokens": {
+                "prompt_total": self.prompt_tokens,
+                "completion_total": self.completion_tokens,
+                "prompt_avg": round(sum(self._prompt_sizes) / len(self._prompt_sizes)) if self._prompt_sizes else None,
+                "prompt_max": max(self._prompt_sizes, default=None),
+            },
+            "latency_seconds": {
+                "samples": len(latencies),
+                "avg": round(sum(latencies) / len(latencies), 3) if latencies else None,
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "max": round(latencies[-1], 3) if latencies else None,
+            },
+        }
+
+    async def aclose(self) -> None:
+        """Close the backend (HTTP connection pool)"""
+        await self.backend.close()
+
+
+def _build_client() -> Optional[LLMClient]:
+    if settings.LLM_BACKEND == "fake":
+        from services.fake_llm import FakeLLMBackend
+
+        backend = FakeLLMBackend(
+            latency=settings.FAKE_LLM_LATENCY_SECONDS,
+            tokens_per_second=settings.FAKE_LLM_TOKENS_PER_SECOND,
+            output_tokens=settings.FAKE_LLM_OUTPUT_TOKENS,
+        )
+        logger.warning("Using the fake LLM backend (LLM_BACKEND=fake)")
+    elif settings.OPENAI_API_KEY:
+        backend = OpenAIBackend(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            max_keepalive=settings.LLM_MAX_CONCURRENCY,
+        )
+    else:
+        return None
+
+    return LLMClient(
+        backend=backend,
+        max_concurrency=settings.LLM_MAX_CONCURRENCY,
+        timeout=settings.LLM_TIMEOUT_SECONDS,
+        max_retries=settings.LLM_MAX_RETRIES,
+        backoff_base=settings.LLM_BACKOFF_BASE_SECONDS,
+        backoff_max=settings.LLM_BACKOFF_MAX_SECONDS,
+        failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds=settings.LLM_CIRCUIT_RESET_SECONDS,
+    )
+
+
+# Shared client (None when the openai backend has no OPENAI_API_KEY)
+llm_client: Optional[LLMClient] = _build_client()
+
+
+def ensure_configured() -> LLMClient:
+    """
+    Return the shared client, or raise if no LLM backend is available
+
+    Returns:
+        Shared LLMClient
+
+    Raises:
+        ValueError: If LLM_BACKEND=openai and OPENAI_API_KEY is not set
+    """
+    if llm_client is None:
+        raise ValueError("OPENAI_API_KEY is not configured")
+    return llm_client
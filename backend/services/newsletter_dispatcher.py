@@ -0,0 +1,129 @@
+"""
+Newsletter Dispatcher
+
+Sends newsletters at their scheduled_at time. Due newsletters are claimed
+(SCHEDULED -> SENDING) and a `newsletter.send` task is enqueued in the same
+transaction, so delivery runs on the task queue workers and every
+newsletter is handed off exactly once even with several dispatchers.
+
+Instead of polling on a fixed interval, the dispatcher sleeps until the
+earliest pending scheduled_at (one indexed MIN lookup), capped at
+NEWSLETTER_DISPATCH_MAX_WAIT_SECONDS, and is woken immediately when a
+newsletter is scheduled in this process.
+"""
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from loguru import logger
+
+from core.config import settings
+from core.database import AsyncSessionLocal
+from services import newsletter_service, task_queue
+from services.task_worker import task_worker
+
+
+class NewsletterDispatcher:
+    """Hands due scheduled newsletters to the task queue"""
+
+    def __init__(self, max_wait_seconds: float, batch_size: int):
+        """
+        Initialize dispatcher
+
+        Args:
+            max_wait_seconds: Longest sleep between due-time checks
+            batch_size: Newsletters claimed per transaction
+        """
+        self.max_wait_seconds = max_wait_seconds
+        self.batch_size = batch_size
+        self.dispatched = 0
+
+        self._loop: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def notify(self) -> None:
+        """Re-check due times now (a newsletter was scheduled or rescheduled)"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def dispatch_due(self) -> int:
+        """
+        Claim due newsletters and enqueue their delivery
+
+        Returns:
+            Number of newsletters dispatched
+        """
+        async with AsyncSessionLocal() as db:
+            newsletter_ids = await newsletter_service.claim_due_newsletters(
+                db, self.batch_size, commit=False,
+            )
+            for newsletter_id in newsletter_ids:
+                # Sending is not idempotent: never retried automatically
+                await task_queue.enqueue_task(
+                    db, "newsletter.send", {"newsletter_id": newsletter_id},
+                    priority=10, max_attempts=1, commit=False,
+                )
+            await db.commit()
+
+        if newsletter_ids:
+            self.dispatched += len(newsletter_ids)
+            task_worker.notify()
+            logger.info(f"Dispatched scheduled newsletters: {newsletter_ids}")
+        return len(newsletter_ids)
+
+    async def _seconds_until_next(self) -> float:
+        """Sleep time until the earliest pending scheduled_at"""
+        async with AsyncSessionLocal() as db:
+            next_at = await newsletter_service.get_next_scheduled_at(db)
+        if next_at is None:
+            return self.max_wait_seconds
+
+        delay = (next_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(delay, 0.0), self.max_wait_seconds)
+
+    async def _run(self) -> None:
+        while True:
+            # Cleared before checking so a wakeup during dispatch is not lost
+            self._wakeup.clear()
+            wait = self.max_wait_seconds
+            try:
+                if await self.dispatch_due() == self.batch_size:
+                    continue  # More may be due
+                wait = await self._seconds_until_next()
+            except Exception as e:
+                logger.error(f"Newsletter dispatch failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+    # ============ Lifecycle ============
+
+    def start(self) -> None:
+        """Start dispatching"""
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        self._loop = asyncio.create_task(self._run())
+        logger.info("Newsletter dispatcher started")
+
+    async def stop(self) -> None:
+        """Stop dispatching (claims are transactional, nothing to drain)"""
+        if self._loop is None:
+            return
+        self._loop.cancel()
+        await asyncio.gather(self._loop, return_exceptions=True)
+        self._loop = None
+        logger.info("Newsletter dispatcher stopped")
+
+
+# Dispatcher embedded in the API process (started by main.py if NEWSLETTER_DISPATCHER_ENABLED)
+newsletter_dispatcher = NewsletterDispatcher(
+    max_wait_seconds=settings.NEWSLETTER_DISPATCH_MAX_WAIT_SECONDS,
+    batch_size=settings.NEWSLETTER_DISPATCH_BATCH_SIZE,
+)
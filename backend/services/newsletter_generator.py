@@ -8,15 +8,18 @@ Automatically creates newsletter content from:
 """
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta, timezone
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 
 from models.blog import Blog
 from models.project import Project
 from models.newsletter import Newsletter, NewsletterStatus
 from core.config import settings
+from services.llm_client import ensure_configured
+from utils.content_generator import collection_deadline, fetch_github_stats, fetch_rows
+from utils.prompt_budget import fit_lines, truncate_to_tokens
 from loguru import logger
-import openai
 
 
 class NewsletterContent:
@@ -45,10 +48,13 @@ class NewsletterGenerator:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        # Set OpenAI API key
-        if not settings.OPENAI_API_KEY:
-            raise ValueError("OPENAI_API_KEY is not configured")
-        openai.api_key = settings.OPENAI_API_KEY
+        self.llm = ensure_configured()
+
+    # Projects shown in the prompt (and looked up on GitHub)
+    PROMPT_PROJECTS = 5
+
+    # Content prefix loaded for blogs without an excerpt (excerpts are capped far below this)
+    CONTENT_HEAD_CHARS = 1000
 
     async def collect_weekly_content(
         self,
@@ -57,10 +63,17 @@ class NewsletterGenerator:
         """
         Collect content from the past N days
 
+        The blog query and the project query (followed by GitHub lookups for
+        the prompt's projects) run concurrently on separate sessions, load
+        only the fields the prompt needs, and finish within
+        NEWSLETTER_COLLECT_TIMEOUT_SECONDS; GitHub stats that miss the
+        deadline are left out.
+
         Returns:
             dict: {
-                'blogs': List[Blog],
-                'projects': List[Project],
+                'blogs': List[Row] (id, title, excerpt, content prefix),
+                'projects': List[Row] (id, name, description, github_url),
+                'github': Dict[github_url, dict],
                 'period_start': datetime,
                 'period_end': datetime
             }
@@ -68,12 +81,18 @@ class NewsletterGenerator:
         now = datetime.now(timezone.utc)
         period_start = now - timedelta(days=days)
         period_end = now
+        deadline = collection_deadline()
 
         logger.info(f"Collecting content from {period_start} to {period_end}")
 
         # 1. Recent blogs
         blog_stmt = (
-            select(Blog)
+            select(
+                Blog.id,
+                Blog.title,
+                Blog.excerpt,
+                func.substr(Blog.content, 1, self.CONTENT_HEAD_CHARS).label("content"),
+            )
             .where(
                 and_(
                     Blog.created_at >= period_start,
@@ -82,25 +101,51 @@ class NewsletterGenerator:
             )
             .order_by(Blog.created_at.desc())
         )
-        blog_result = await self.db.execute(blog_stmt)
-        blogs = list(blog_result.scalars().all())
 
-        # 2. Active projects (for GitHub updates)
-        project_stmt = select(Project).where(
-            Project.github_url.isnot(None)
+        # 2. Active projects (for GitHub updates), most recently updated first
+        project_stmt = (
+            select(Project.id, Project.name, Project.description, Project.github_url)
+            .where(Project.github_url.isnot(None))
+            .order_by(Project.updated_at.desc())
+        )
+
+        async def collect_projects():
+            projects = await fetch_rows(project_stmt, deadline)
+            github = await fetch_github_stats(
+                [proj.github_url for proj in projects[:self.PROMPT_PROJECTS]], deadline,
+            )
+            return projects, github
+
+        blogs, (projects, github) = await asyncio.gather(
+            fetch_rows(blog_stmt, deadline),
+            collect_projects(),
         )
-        project_result = await self.db.execute(project_stmt)
-        projects = list(project_result.scalars().all())
 
-        logger.info(f"Collected: {len(blogs)} blogs, {len(projects)} projects")
+        logger.info(f"Collected: {len(blogs)} blogs, {len(projects)} projects ({len(github)} with GitHub stats)")
 
         return {
             'blogs': blogs,
             'projects': projects,
+            'github': github,
             'period_start': period_start,
             'period_end': period_end,
         }
 
+    @staticmethod
+    def _github_note(info: Optional[Dict]) -> str:
+        """Short GitHub activity note for a project line"""
+        if not info:
+            return ""
+        note = f" (⭐ {info.get('stars', 0)}"
+        if info.get("updated_at"):
+            note += f", 최근 업데이트 {info['updated_at'][:10]}"
+        return note + ")"
+
+    @staticmethod
+    def _summary(text: Optional[str]) -> str:
+        """Single-line excerpt capped at PROMPT_EXCERPT_MAX_TOKENS"""
+        return truncate_to_tokens(" ".join((text or "").split()), settings.PROMPT_EXCERPT_MAX_TOKENS)
+
     async def generate_newsletter(
         self,
         content_data: Dict,
@@ -118,19 +163,21 @@ class NewsletterGenerator:
         """
         blogs = content_data['blogs']
         projects = content_data['projects']
+        github = content_data.get('github', {})
         period_start = content_data['period_start']
         period_end = content_data['period_end']
 
         # Prepare content summary for AI
-        blog_summaries = [
-            f"- {blog.title}: {blog.excerpt or blog.content[:200]}"
+        # Each summary is capped, and the lists stop once their token budget is used
+        blog_summaries = fit_lines([
+            f"- {blog.title}: {self._summary(blog.excerpt or blog.content)}"
             for blog in blogs
-        ]
+        ], settings.PROMPT_ITEMS_MAX_TOKENS)
 
-        project_summaries = [
-            f"- {proj.name}: {proj.description}"
-            for proj in projects[:5]  # Top 5 projects only
-        ]
+        project_summaries = fit_lines([
+            f"- {proj.name}: {self._summary(proj.description)}{self._github_note(github.get(proj.github_url))}"
+            for proj in projects[:self.PROMPT_PROJECTS]
+        ], settings.PROMPT_ITEMS_MAX_TOKENS)
 
         # AI Prompt
         prompt = f"""
@@ -182,11 +229,8 @@ HTML 작성 시 주의사항:
         logger.info("Generating newsletter with GPT-4...")
 
         import json
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
 
-        response = await client.chat.completions.create(
+        response = await self.llm.chat(
             model="gpt-4-turbo-preview",
             messages=[{
                 "role": "system",
@@ -203,11 +247,11 @@ HTML 작성 시 주의사항:
         # Parse response
         ai_response = response.choices[0].message.content
 
-        # Extract JSON from markdown code blocks if present
-        if "```json" in ai_response:
-            ai_response = ai_response.split("```json")[1].split("```")[0].strip()
-        elif "```" in ai_response:
-            ai_response = ai_response.split("```")[1].split("```")[0].strip()
+        # Extract JSON if the whole response is wrapped in a markdown code block
+        # (code blocks inside the JSON string values must be left alone)
+        ai_response = ai_response.strip()
+        if ai_response.startswith("```"):
+            ai_response = ai_response.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
 
         result = json.loads(ai_response)
 
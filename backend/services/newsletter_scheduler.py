@@ -2,13 +2,17 @@
 Newsletter Scheduler
 
 Automated weekly newsletter generation and sending
+
+Runs on the shared cluster scheduler, so the weekly issue is generated (and
+sent) exactly once even when several replicas run this scheduler.
 """
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
+from typing import Any, Dict
 from loguru import logger
 
 from core.database import AsyncSessionLocal
+from services.cluster_scheduler import cluster_scheduler
 from services.newsletter_generator import generate_weekly_newsletter
 
 
@@ -23,12 +27,12 @@ class NewsletterScheduler:
             auto_send: If True, automatically send after generation
                       If False, save as DRAFT for manual review
         """
-        self.scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
+        self.scheduler = cluster_scheduler
         self.auto_send = auto_send
         logger.info(f"NewsletterScheduler initialized (auto_send={auto_send})")
 
-    async def run_newsletter_generation(self):
-        """Generate newsletter (scheduled job)"""
+    async def run_newsletter_generation(self) -> Dict[str, Any]:
+        """Generate newsletter (scheduled job; raises so the run is recorded as failed)"""
         logger.info("=" * 70)
         logger.info("Starting scheduled newsletter generation")
         logger.info(f"Time: {datetime.now()}")
@@ -55,8 +59,11 @@ class NewsletterScheduler:
 
         except Exception as e:
             logger.error(f"❌ Newsletter generation failed: {e}", exc_info=True)
+            raise
+        finally:
+            logger.info("=" * 70)
 
-        logger.info("=" * 70)
+        return {"newsletter_id": newsletter.id, "recipient_count": newsletter.recipient_count}
 
     def start(
         self,
@@ -80,13 +87,7 @@ class NewsletterScheduler:
             timezone="Asia/Seoul"
         )
 
-        self.scheduler.add_job(
-            self.run_newsletter_generation,
-            trigger=trigger,
-            id="weekly_newsletter",
-            name="Weekly Newsletter Generation",
-            replace_existing=True,
-        )
+        self.scheduler.add_job("weekly_newsletter", trigger, self.run_newsletter_generation)
 
         logger.info(
             f"Scheduler started - will run every {day_of_week.upper()} at "
@@ -94,17 +95,20 @@ class NewsletterScheduler:
         )
 
         # Print next run time
-        job = self.scheduler.get_job("weekly_newsletter")
-        if job and job.next_run_time:
-            logger.info(f"Next run: {job.next_run_time}")
+        next_run_time = self.scheduler.next_run_time("weekly_newsletter")
+        if next_run_time:
+            logger.info(f"Next run: {next_run_time}")
 
-        # Start scheduler
+        # Start the shared scheduler (no-op if already running)
         self.scheduler.start()
 
     async def run_now(self):
         """Run newsletter generation immediately (for testing)"""
         logger.info("Running newsletter generation immediately (manual trigger)")
-        await self.run_newsletter_generation()
+        try:
+            await self.run_newsletter_generation()
+        except Exception:
+            pass  # Already logged
 
 
 def create_newsletter_scheduler(auto_send: bool = False) -> NewsletterScheduler:
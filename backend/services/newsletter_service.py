@@ -2,11 +2,18 @@
 Newsletter Service
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from typing import Optional, List
+from sqlalchemy import select, update, func, and_
+from typing import Optional, List, Dict, Iterable, Iterator, AsyncIterator
 from datetime import datetime, timezone
+from email_validator import validate_email, EmailNotValidError
+from itertools import islice
+import asyncio
+import csv
+import io
+import json
 import uuid
 
+from core.database import AsyncSessionLocal, dialect_insert
 from models.newsletter import Subscriber, Newsletter, NewsletterRequest, NewsletterStatus
 from schemas.newsletter import (
     SubscriberCreate,
@@ -122,6 +129,24 @@ async def get_active_subscribers(db: AsyncSession) -> List[Subscriber]:
     return list(subscribers)
 
 
+async def get_active_subscriber_emails(db: AsyncSession) -> List[str]:
+    """
+    Get emails of all active subscribers
+
+    Selects only the email column so the query is served by an
+    index-only scan on idx_subscriber_active_subscribed.
+
+    Args:
+        db: Database session
+
+    Returns:
+        List[str]: Active subscriber emails
+    """
+    stmt = select(Subscriber.email).where(Subscriber.is_active == True)
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
 async def get_subscriber_by_email(
     db: AsyncSession,
     email: str,
@@ -141,6 +166,221 @@ async def get_subscriber_by_email(
     return result.scalar_one_or_none()
 
 
+# ============ Bulk Import / Export Functions ============
+
+IMPORT_BATCH_SIZE = 1000
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = ["id", "email", "is_active", "subscribed_at", "unsubscribed_at", "created_at"]
+
+
+def iter_csv_emails(stream: io.TextIOBase) -> Iterator[str]:
+    """
+    Read email addresses from a CSV text stream row by row
+
+    The `email` column is used when a header row is present,
+    otherwise the first column of every row.
+
+    Args:
+        stream: Text stream of CSV data
+
+    Yields:
+        str: Raw email value of each row
+    """
+    reader = csv.reader(stream)
+    email_index = 0
+
+    for line_no, row in enumerate(reader):
+        if not row:
+            continue
+
+        if line_no == 0:
+            header = [cell.strip().lower() for cell in row]
+            if "email" in header:
+                email_index = header.index("email")
+                continue
+
+        if email_index < len(row):
+            yield row[email_index]
+        else:
+            yield ""
+
+
+def _normalize_email(raw: str) -> Optional[str]:
+    """Validate an email address and return its lowercased normalized form (or None if invalid)"""
+    try:
+        return validate_email(raw.strip(), check_deliverability=False).normalized.lower()
+    except EmailNotValidError:
+        return None
+
+
+async def _insert_subscriber_batch(db: AsyncSession, emails: List[str]) -> int:
+    """Insert a batch of new subscribers, skipping existing emails. Returns inserted count"""
+    # Rows stored by subscribe() keep the local part's case, which the unique
+    # index does not fold, so existing addresses are matched on lower(email)
+    existing = await db.execute(
+        select(func.lower(Subscriber.email)).where(func.lower(Subscriber.email).in_(emails))
+    )
+    existing_emails = set(existing.scalars().all())
+    emails = [email for email in emails if email not in existing_emails]
+    if not emails:
+        return 0
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "email": email,
+            "is_active": True,
+            "subscribed_at": now,
+            "unsubscribe_token": str(uuid.uuid4()),
+            "confirmation_token": str(uuid.uuid4()),
+        }
+        for email in emails
+    ]
+
+    stmt = (
+        dialect_insert(db, Subscriber)
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(Subscriber.id)
+    )
+    result = await db.execute(stmt, rows)
+    return len(result.all())
+
+
+async def import_subscribers(
+    db: AsyncSession,
+    emails: Iterable[str],
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Bulk import subscribers
+
+    Emails are validated, lowercased, de-duplicated and inserted in
+    batches with an ON CONFLICT DO NOTHING upsert, so existing subscribers
+    (matched case-insensitively) are left untouched. `emails` is consumed
+    in batches on a worker thread, so a blocking source such as an upload
+    spooled to disk does not stall the event loop.
+
+    Args:
+        db: Database session
+        emails: Iterable of raw email values (e.g. from iter_csv_emails)
+        batch_size: Number of rows per INSERT
+
+    Returns:
+        Dict[str, int]: Import statistics
+    """
+    stats = {
+        "total_rows": 0,
+        "invalid": 0,
+        "duplicates": 0,
+        "inserted": 0,
+        "already_subscribed": 0,
+    }
+    seen = set()
+    batch: List[str] = []
+
+    async def flush() -> None:
+        inserted = await _insert_subscriber_batch(db, batch)
+        stats["inserted"] += inserted
+        stats["already_subscribed"] += len(batch) - inserted
+        batch.clear()
+
+    rows = iter(emails)
+    while True:
+        chunk = await asyncio.to_thread(list, islice(rows, batch_size))
+        if not chunk:
+            break
+
+        for raw in chunk:
+            stats["total_rows"] += 1
+
+            email = _normalize_email(raw) if raw else None
+            if not email:
+                stats["invalid"] += 1
+                continue
+
+            if email in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(email)
+
+            batch.append(email)
+            if len(batch) >= batch_size:
+                await flush()
+
+    if batch:
+        await flush()
+
+    await db.commit()
+
+    logger.info(
+        f"Subscriber import finished: {stats['inserted']} inserted, "
+        f"{stats['already_subscribed']} existing, {stats['duplicates']} duplicates, "
+        f"{stats['invalid']} invalid (rows: {stats['total_rows']})"
+    )
+    return stats
+
+
+def _format_export_value(value):
+    """Convert a column value to its export representation"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def stream_subscribers(
+    status: Optional[str] = None,
+    fmt: str = "csv",
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[str]:
+    """
+    Stream all subscribers as CSV or JSON Lines
+
+    Uses its own session and a server-side cursor, so memory use stays
+    constant regardless of list size.
+
+    Args:
+        status: "active" or "unsubscribed" (optional)
+        fmt: "csv" or "jsonl"
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        str: Chunk of the export file
+    """
+    stmt = select(
+        Subscriber.id,
+        Subscriber.email,
+        Subscriber.is_active,
+        Subscriber.subscribed_at,
+        Subscriber.unsubscribed_at,
+        Subscriber.created_at,
+    ).order_by(Subscriber.id)
+
+    if status == "active":
+        stmt = stmt.where(Subscriber.is_active == True)
+    elif status == "unsubscribed":
+        stmt = stmt.where(Subscriber.is_active == False)
+
+    if fmt == "csv":
+        yield ",".join(EXPORT_COLUMNS) + "\r\n"
+
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt.execution_options(yield_per=batch_size))
+
+        async for rows in result.partitions():
+            buffer = io.StringIO()
+
+            if fmt == "csv":
+                writer = csv.writer(buffer)
+                for row in rows:
+                    writer.writerow([_format_export_value(value) for value in row])
+            else:
+                for row in rows:
+                    record = {key: _format_export_value(value) for key, value in row._mapping.items()}
+                    buffer.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            yield buffer.getvalue()
+
+
 # ============ Newsletter Functions ============
 
 async def create_newsletter(
@@ -199,6 +439,7 @@ async def get_newsletter_by_id(
 async def send_newsletter_to_all(
     db: AsyncSession,
     newsletter_id: int,
+    claimed: bool = False,
 ) -> int:
     """
     Send newsletter to all active subscribers
@@ -206,9 +447,15 @@ async def send_newsletter_to_all(
     Args:
         db: Database session
         newsletter_id: Newsletter ID
+        claimed: The caller already moved the newsletter to SENDING with
+            claim_newsletter_send (otherwise it is claimed here, and marked
+            FAILED if the send does not complete)
 
     Returns:
         int: Number of emails sent
+
+    Raises:
+        ValueError: Newsletter not found, or being sent by someone else
     """
     # Get newsletter
     newsletter = await get_newsletter_by_id(db, newsletter_id)
@@ -220,16 +467,31 @@ async def send_newsletter_to_all(
         logger.warning(f"Newsletter already sent: {newsletter_id}")
         return newsletter.recipient_count
 
+    if not claimed:
+        if not await claim_newsletter_send(db, newsletter_id):
+            raise ValueError("Newsletter is already being sent")
+        try:
+            return await _deliver_newsletter(db, newsletter)
+        finally:
+            await db.rollback()
+            await fail_unfinished_send(db, newsletter_id)
+
+    if newsletter.status != NewsletterStatus.SENDING:
+        raise ValueError(f"Newsletter is not claimed for sending (status {newsletter.status.value})")
+    return await _deliver_newsletter(db, newsletter)
+
+
+async def _deliver_newsletter(db: AsyncSession, newsletter: Newsletter) -> int:
+    """Email a claimed (SENDING) newsletter to all active subscribers and mark it SENT"""
     # Get active subscribers
-    subscribers = await get_active_subscribers(db)
-    if not subscribers:
+    subscriber_emails = await get_active_subscriber_emails(db)
+    if not subscriber_emails:
         logger.warning("No active subscribers")
         return 0
 
     # Send emails in batches
     batch_size = 50
     sent_count = 0
-    subscriber_emails = [sub.email for sub in subscribers]
 
     for i in range(0, len(subscriber_emails), batch_size):
         batch = subscriber_emails[i:i + batch_size]
@@ -255,6 +517,180 @@ async def send_newsletter_to_all(
     return sent_count
 
 
+# ============ Scheduled Dispatch Functions ============
+
+SCHEDULABLE_STATUSES = (NewsletterStatus.DRAFT, NewsletterStatus.SCHEDULED, NewsletterStatus.FAILED)
+
+
+async def claim_newsletter_send(db: AsyncSession, newsletter_id: int, commit: bool = True) -> bool:
+    """
+    Atomically move a newsletter to SENDING for a manual send
+
+    Same conditional claim as the dispatcher: only one caller can win, so a
+    newsletter is handed off for delivery exactly once.
+
+    Args:
+        db: Database session
+        newsletter_id: Newsletter ID
+        commit: Commit the claim (False to enqueue delivery in the same transaction)
+
+    Returns:
+        bool: False if the newsletter is already SENDING or SENT
+    """
+    result = await db.execute(
+        update(Newsletter)
+        .where(Newsletter.id == newsletter_id, Newsletter.status.in_(SCHEDULABLE_STATUSES))
+        .values(status=NewsletterStatus.SENDING)
+    )
+    if commit:
+        await db.commit()
+    return result.rowcount == 1
+
+
+async def schedule_newsletter(
+    db: AsyncSession,
+    newsletter: Newsletter,
+    scheduled_at: datetime,
+) -> Newsletter:
+    """
+    Schedule a newsletter for sending at a given time
+
+    Args:
+        db: Database session
+        newsletter: Newsletter (DRAFT, SCHEDULED or FAILED)
+        scheduled_at: Send time (naive datetimes are taken as UTC)
+
+    Returns:
+        Newsletter: Updated newsletter
+
+    Raises:
+        ValueError: Newsletter is being sent or already sent
+    """
+    if newsletter.status not in SCHEDULABLE_STATUSES:
+        raise ValueError(f"Newsletter cannot be scheduled in status {newsletter.status.value}")
+
+    if scheduled_at.tzinfo is None:
+        scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
+
+    newsletter.status = NewsletterStatus.SCHEDULED
+    newsletter.scheduled_at = scheduled_at.astimezone(timezone.utc)
+    await db.commit()
+    await db.refresh(newsletter)
+
+    logger.info(f"Newsletter {newsletter.id} scheduled for {newsletter.scheduled_at.isoformat()}")
+    return newsletter
+
+
+async def unschedule_newsletter(db: AsyncSession, newsletter_id: int) -> bool:
+    """
+    Cancel a scheduled send (back to DRAFT)
+
+    Args:
+        db: Database session
+        newsletter_id: Newsletter ID
+
+    Returns:
+        bool: False if the newsletter was not SCHEDULED (e.g. already claimed)
+    """
+    result = await db.execute(
+        update(Newsletter)
+        .where(Newsletter.id == newsletter_id, Newsletter.status == NewsletterStatus.SCHEDULED)
+        .values(status=NewsletterStatus.DRAFT, scheduled_at=None)
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def claim_due_newsletters(
+    db: AsyncSession,
+    limit: int,
+    commit: bool = True,
+) -> List[int]:
+    """
+    Atomically move due SCHEDULED newsletters to SENDING
+
+    Uses idx_newsletter_status_scheduled; rows claimed by another
+    dispatcher are skipped (FOR UPDATE SKIP LOCKED on PostgreSQL).
+
+    Args:
+        db: Database session
+        limit: Maximum newsletters to claim
+        commit: Commit the claim (False to enqueue delivery in the same transaction)
+
+    Returns:
+        List[int]: Claimed newsletter IDs, earliest first
+    """
+    due = (
+        select(Newsletter.id)
+        .where(
+            Newsletter.status == NewsletterStatus.SCHEDULED,
+            Newsletter.scheduled_at <= datetime.now(timezone.utc),
+        )
+        .order_by(Newsletter.scheduled_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+    result = await db.execute(
+        update(Newsletter)
+        .where(
+            Newsletter.id.in_(due.scalar_subquery()),
+            Newsletter.status == NewsletterStatus.SCHEDULED,
+        )
+        .values(status=NewsletterStatus.SENDING)
+        .returning(Newsletter.id, Newsletter.scheduled_at)
+        .execution_options(synchronize_session=False)
+    )
+    claimed = sorted(result.all(), key=lambda row: row.scheduled_at)
+    if commit:
+        await db.commit()
+
+    return [row.id for row in claimed]
+
+
+async def get_next_scheduled_at(db: AsyncSession) -> Optional[datetime]:
+    """
+    Earliest pending scheduled send time (index-only lookup)
+
+    Args:
+        db: Database session
+
+    Returns:
+        Optional[datetime]: Next scheduled_at (UTC) or None
+    """
+    result = await db.execute(
+        select(func.min(Newsletter.scheduled_at))
+        .where(Newsletter.status == NewsletterStatus.SCHEDULED)
+    )
+    next_at = result.scalar()
+    if next_at is not None and next_at.tzinfo is None:
+        next_at = next_at.replace(tzinfo=timezone.utc)  # SQLite returns naive UTC
+    return next_at
+
+
+async def fail_unfinished_send(db: AsyncSession, newsletter_id: int) -> bool:
+    """
+    Mark a claimed newsletter FAILED if its send did not complete
+
+    Args:
+        db: Database session
+        newsletter_id: Newsletter ID
+
+    Returns:
+        bool: True if the newsletter was still SENDING
+    """
+    result = await db.execute(
+        update(Newsletter)
+        .where(Newsletter.id == newsletter_id, Newsletter.status == NewsletterStatus.SENDING)
+        .values(status=NewsletterStatus.FAILED)
+    )
+    await db.commit()
+
+    if result.rowcount:
+        logger.warning(f"Newsletter {newsletter_id} was not sent; marked FAILED")
+    return result.rowcount == 1
+
+
 # ============ Newsletter Request Functions ============
 
 async def create_newsletter_request(
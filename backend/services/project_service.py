@@ -2,13 +2,18 @@
 Project Service
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import List, Optional
+from sqlalchemy import select, func, or_, delete
+from sqlalchemy.orm import defer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from collections import OrderedDict
 from datetime import datetime
+import time
 from loguru import logger
 
-from models.project import Project, ProjectStatus
+from core.config import settings
+from models.project import Project, ProjectStatus, project_technologies
 from schemas.project import ProjectCreate, ProjectUpdate
+from services import feed_service, search_service, trending_service
 from utils.slug import slugify
 
 
@@ -45,7 +50,24 @@ async def create_project(
         counter += 1
 
     # Create project
-    new_project = Project(
+    new_project = _build_project(project_data, slug)
+
+    db.add(new_project)
+    await db.flush()
+    await _sync_technologies(db, [new_project])
+    await feed_service.enqueue_regenerate(db)
+    await db.commit()
+    await db.refresh(new_project)
+    invalidate_facets()
+    await search_service.index_project(db, new_project)
+
+    logger.info(f"Project created: {new_project.name} (ID: {new_project.id}, Slug: {new_project.slug})")
+    return new_project
+
+
+def _build_project(project_data: ProjectCreate, slug: str) -> Project:
+    """Build a (not yet added) Project row from creation data"""
+    return Project(
         name=project_data.name,
         slug=slug,
         description=project_data.description,
@@ -62,12 +84,101 @@ async def create_project(
         star_count=0
     )
 
-    db.add(new_project)
-    await db.commit()
-    await db.refresh(new_project)
 
-    logger.info(f"Project created: {new_project.name} (ID: {new_project.id}, Slug: {new_project.slug})")
-    return new_project
+async def create_projects_bulk(
+    db: AsyncSession,
+    projects_data: List[ProjectCreate]
+) -> List[Project]:
+    """
+    Create many projects in a single transaction
+
+    Slugs are made unique against the database and within the batch with
+    one query, instead of one lookup per candidate slug. Either every
+    project is inserted or none is.
+
+    Args:
+        db: Database session
+        projects_data: Project creation data
+
+    Returns:
+        Created projects, in input order
+    """
+    if not projects_data:
+        return []
+
+    base_slugs = [
+        project_data.slug or slugify(project_data.name) or "project"
+        for project_data in projects_data
+    ]
+
+    # Every existing slug that could collide: "<base>" or "<base>-<n>"
+    conditions = []
+    for base in set(base_slugs):
+        conditions.append(Project.slug == base)
+        conditions.append(Project.slug.like(f"{base}-%"))
+    result = await db.execute(select(Project.slug).where(or_(*conditions)))
+    taken = set(result.scalars().all())
+
+    new_projects = []
+    for project_data, base in zip(projects_data, base_slugs):
+        slug = base
+        counter = 1
+        while slug in taken:
+            slug = f"{base}-{counter}"
+            counter += 1
+        taken.add(slug)
+        new_projects.append(_build_project(project_data, slug))
+
+    try:
+        db.add_all(new_projects)
+        await db.flush()
+        await _sync_technologies(db, new_projects)
+        await feed_service.enqueue_regenerate(db)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    invalidate_facets()
+    await search_service.index_projects(db, new_projects)
+    logger.info(f"Projects created in bulk: {len(new_projects)}")
+    return new_projects
+
+
+async def get_projects_by_github_urls(db: AsyncSession, github_urls: List[str]) -> Dict[str, Project]:
+    """
+    Find projects already registered for any of the given GitHub URLs
+
+    Args:
+        db: Database session
+        github_urls: GitHub repository URLs
+
+    Returns:
+        Dict of normalised URL (lowercase, no trailing slash / .git) -> project
+    """
+    if not github_urls:
+        return {}
+
+    result = await db.execute(
+        select(Project)
+        .options(defer(Project.content, raiseload=True))
+        .where(Project.github_url.is_not(None))
+    )
+    wanted = {normalize_github_url(url) for url in github_urls}
+    found = {}
+    for project in result.scalars().all():
+        key = normalize_github_url(project.github_url)
+        if key in wanted:
+            found[key] = project
+    return found
+
+
+def normalize_github_url(url: str) -> str:
+    """Canonical form of a repository URL for duplicate detection"""
+    url = url.strip().lower().rstrip("/")
+    if url.endswith(".git"):
+        url = url[:-4]
+    return url.replace("://www.", "://").replace("http://", "https://")
 
 
 async def get_project_by_id(db: AsyncSession, project_id: int) -> Optional[Project]:
@@ -104,12 +215,99 @@ async def get_project_by_slug(db: AsyncSession, slug: str) -> Optional[Project]:
     return result.scalar_one_or_none()
 
 
+# ============ Technology Index ============
+
+def technology_key(name: str) -> str:
+    """Lookup key of a technology name ("  FastAPI " -> "fastapi")"""
+    return " ".join(name.split()).lower()[:100]
+
+
+async def _sync_technologies(db: AsyncSession, projects: Sequence[Project]) -> None:
+    """
+    Replace the project_technologies rows of flushed projects with their tech_stack
+
+    The caller commits.
+
+    Args:
+        db: Database session
+        projects: Projects (with IDs)
+    """
+    await db.execute(
+        delete(project_technologies)
+        .where(project_technologies.c.project_id.in_([project.id for project in projects]))
+    )
+
+    rows = []
+    for project in projects:
+        seen = set()
+        for name in project.tech_stack or []:
+            key = technology_key(name)
+            if key and key not in seen:
+                seen.add(key)
+                rows.append({"project_id": project.id, "key": key, "name": " ".join(name.split())[:100]})
+    if rows:
+        await db.execute(project_technologies.insert().values(rows))
+
+
+async def rebuild_technology_index(db: AsyncSession) -> int:
+    """
+    Rebuild project_technologies from Project.tech_stack
+
+    For projects written without this service (migration scripts, manual SQL).
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of projects indexed
+    """
+    result = await db.execute(select(Project).options(defer(Project.content, raiseload=True)))
+    projects = result.scalars().all()
+
+    await db.execute(delete(project_technologies))
+    if projects:
+        await _sync_technologies(db, projects)
+    await db.commit()
+    invalidate_facets()
+
+    logger.info(f"Technology index rebuilt: {len(projects)} projects")
+    return len(projects)
+
+
+def _apply_filters(
+    query,
+    status: Optional[ProjectStatus] = None,
+    category: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    tech: Optional[Sequence[str]] = None,
+):
+    """Add list/facet filters to a query over Project (tech: all must be used)"""
+    if status:
+        query = query.where(Project.status == status)
+
+    if category:
+        query = query.where(Project.category == category)
+
+    if difficulty:
+        query = query.where(Project.difficulty == difficulty)
+
+    for key in {technology_key(name) for name in tech or ()}:
+        # Indexed (key, project_id) lookup per technology
+        query = query.where(Project.id.in_(
+            select(project_technologies.c.project_id).where(project_technologies.c.key == key)
+        ))
+
+    return query
+
+
 async def list_projects(
     db: AsyncSession,
     skip: int = 0,
     limit: int = 10,
     status: Optional[ProjectStatus] = None,
-    category: Optional[str] = None
+    category: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    tech: Optional[Sequence[str]] = None
 ) -> tuple[List[Project], int]:
     """
     List projects with pagination
@@ -120,18 +318,16 @@ async def list_projects(
         limit: Maximum number of records to return
         status: Filter by status (optional)
         category: Filter by category (optional)
+        difficulty: Filter by difficulty (optional)
+        tech: Only projects using all of these technologies, case-insensitive (optional)
 
     Returns:
         Tuple of (project list, total count)
     """
     # Build query
-    query = select(Project)
-
-    if status:
-        query = query.where(Project.status == status)
-
-    if category:
-        query = query.where(Project.category == category)
+    # Detailed markdown content is never part of a list item, so it is not loaded
+    query = select(Project).options(defer(Project.content, raiseload=True))
+    query = _apply_filters(query, status, category, difficulty, tech)
 
     # Order by created_at (descending) - newest first
     query = query.order_by(Project.created_at.desc())
@@ -192,6 +388,7 @@ async def update_project(
 
     if project_data.tech_stack is not None:
         project.tech_stack = project_data.tech_stack
+        await _sync_technologies(db, [project])
 
     if project_data.status is not None:
         project.status = ProjectStatus(project_data.status)
@@ -202,8 +399,11 @@ async def update_project(
     if project_data.difficulty is not None:
         project.difficulty = project_data.difficulty
 
+    await feed_service.enqueue_regenerate(db)
     await db.commit()
     await db.refresh(project)
+    invalidate_facets()
+    await search_service.index_project(db, project)
 
     logger.info(f"Project updated: {project.name} (ID: {project.id})")
     return project
@@ -220,8 +420,12 @@ async def delete_project(db: AsyncSession, project: Project) -> None:
     project_id = project.id
     project_name = project.name
 
+    await db.execute(delete(project_technologies).where(project_technologies.c.project_id == project_id))
     await db.delete(project)
+    await feed_service.enqueue_regenerate(db)
     await db.commit()
+    invalidate_facets()
+    await search_service.remove_project(project_id)
 
     logger.info(f"Project deleted: {project_name} (ID: {project_id})")
 
@@ -238,6 +442,88 @@ async def increment_view_count(db: AsyncSession, project: Project) -> Project:
         Updated project
     """
     project.view_count += 1
+    await trending_service.record_view(db, "project", project.id)
     await db.commit()
     await db.refresh(project)
     return project
+
+
+# ============ Facets ============
+
+# Facet results by filter set; cleared on every project write in this process,
+# expired by PROJECT_FACETS_CACHE_TTL_SECONDS for writes made by other replicas
+_facet_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def invalidate_facets() -> None:
+    """Drop cached facet counts (a project was written)"""
+    _facet_cache.clear()
+
+
+async def get_project_facets(
+    db: AsyncSession,
+    status: Optional[ProjectStatus] = None,
+    category: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    tech: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Project counts per facet value for the current filter set
+
+    Category, difficulty and status counts ignore their own filter, so the
+    alternatives to a selected value keep their counts. Technology counts
+    apply every filter (selecting more technologies narrows the result).
+
+    Args:
+        db: Database session
+        status: Status filter (optional)
+        category: Category filter (optional)
+        difficulty: Difficulty filter (optional)
+        tech: Technology filters (optional)
+
+    Returns:
+        {"total", "tech_stack", "category", "difficulty", "status"} with
+        lists of {"value", "count"}, most common first
+    """
+    tech_keys = tuple(sorted({technology_key(name) for name in tech or ()}))
+    cache_key = (status, category, difficulty, tech_keys)
+    cached = _facet_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < settings.PROJECT_FACETS_CACHE_TTL_SECONDS:
+        _facet_cache.move_to_end(cache_key)
+        return cached[1]
+
+    filters = {"status": status, "category": category, "difficulty": difficulty, "tech": tech_keys}
+
+    async def counts(column, **overrides) -> List[Dict[str, Any]]:
+        query = _apply_filters(select(column, func.count()), **{**filters, **overrides})
+        result = await db.execute(
+            query.where(column.isnot(None)).group_by(column).order_by(func.count().desc(), column)
+        )
+        return [
+            {"value": value.value if isinstance(value, ProjectStatus) else value, "count": count}
+            for value, count in result.all()
+        ]
+
+    total = (await db.execute(_apply_filters(select(func.count(Project.id)), **filters))).scalar()
+
+    tech_query = _apply_filters(
+        select(func.min(project_technologies.c.name), func.count())
+        .join(Project, Project.id == project_technologies.c.project_id),
+        **filters,
+    )
+    result = await db.execute(
+        tech_query.group_by(project_technologies.c.key)
+        .order_by(func.count().desc(), project_technologies.c.key)
+    )
+    facets = {
+        "total": total,
+        "tech_stack": [{"value": name, "count": count} for name, count in result.all()],
+        "category": await counts(Project.category, category=None),
+        "difficulty": await counts(Project.difficulty, difficulty=None),
+        "status": await counts(Project.status, status=None),
+    }
+
+    _facet_cache[cache_key] = (time.monotonic(), facets)
+    while len(_facet_cache) > settings.PROJECT_FACETS_CACHE_MAX_ENTRIES:
+        _facet_cache.popitem(last=False)
+    return facets
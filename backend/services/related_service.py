@@ -0,0 +1,290 @@
+"""
+Related Posts Service
+
+Precomputed "related posts" for published blogs, stored as the top-k
+neighbours of each post in related_posts and served with one indexed query.
+
+- rebuild_related_posts: vectorise every published post (utils.related_posts)
+  and replace all neighbour lists. Runs as the `blog.related_rebuild` task:
+  nightly (register_rebuild_job), on demand and at startup when empty.
+- update_related_posts: after a post is published, edited, unpublished or
+  deleted (`blog.related_update`, enqueued by the blog service in the same
+  transaction), re-vectorise that post in the cached model and refresh only
+  the lists it enters or leaves.
+
+Every worker process keeps its own cached model. Before an incremental
+update it re-vectorises the posts whose `blog.related_update` tasks were
+queued since its model last read the database (changes handled by other
+workers), so no worker recomputes lists from stale vectors.
+
+CPU-bound work runs in a thread so an embedded task worker does not block
+the API event loop.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, func, or_
+from sqlalchemy.orm import defer
+from loguru import logger
+
+from core.config import settings
+from core.database import AsyncSessionLocal
+from models.blog import Blog, BlogStatus
+from models.related_post import RelatedPost
+from models.task import Task
+from services import task_queue
+from utils.related_posts import RelatedModel, post_terms
+
+
+LOAD_BATCH_SIZE = 500  # Posts read per query during a rebuild
+SYNC_SLACK_SECONDS = 60  # Task created_at is the enqueueing transaction's start time
+
+_model: Optional[RelatedModel] = None
+_model_built_at = 0.0
+_model_synced_at: Optional[datetime] = None  # Posts changed before this are in _model
+_lock = asyncio.Lock()
+
+
+# ============ Enqueueing ============
+
+async def enqueue_update(db: AsyncSession, blog_id: int) -> None:
+    """
+    Queue a neighbour refresh for a post
+
+    Only flushed: the task is committed together with the caller's change.
+
+    Args:
+        db: Database session
+        blog_id: Published, edited, unpublished or deleted post
+    """
+    await task_queue.enqueue_task(db, "blog.related_update", {"blog_id": blog_id}, commit=False)
+
+
+async def enqueue_rebuild() -> None:
+    """Queue a full rebuild (cluster scheduler job / admin endpoint)"""
+    async with AsyncSessionLocal() as db:
+        await task_queue.enqueue_task(db, "blog.related_rebuild", {})
+
+
+def register_rebuild_job(scheduler) -> None:
+    """
+    Schedule the nightly full rebuild on a cluster scheduler
+
+    Args:
+        scheduler: services.cluster_scheduler.ClusterScheduler
+    """
+    from apscheduler.triggers.cron import CronTrigger
+
+    trigger = CronTrigger.from_crontab(settings.RELATED_POSTS_REBUILD_SCHEDULE, timezone="Asia/Seoul")
+    scheduler.add_job("related_posts_rebuild", trigger, enqueue_rebuild)
+
+
+# ============ Building ============
+
+async def _load_terms(blog_ids: Optional[Sequence[int]] = None) -> List[Tuple[int, Dict[str, float]]]:
+    """post_terms() of published posts (all, or the given IDs), read in batches by ID"""
+    posts = []
+    last_id = 0
+    while True:
+        query = (
+            select(Blog.id, Blog.title, Blog.tags, Blog.content)
+            .where(Blog.status == BlogStatus.PUBLISHED, Blog.id > last_id)
+            .order_by(Blog.id)
+            .limit(LOAD_BATCH_SIZE)
+        )
+        if blog_ids is not None:
+            query = query.where(Blog.id.in_(blog_ids))
+
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(query)).all()
+        if not rows:
+            return posts
+
+        posts.extend(await asyncio.to_thread(
+            lambda: [(blog_id, post_terms(title, tags, content)) for blog_id, title, tags, content in rows]
+        ))
+        last_id = rows[-1][0]
+
+
+def _related_rows(neighbours: Dict[int, List[Tuple[int, float]]]) -> List[Dict[str, Any]]:
+    return [
+        {"blog_id": blog_id, "related_id": related_id, "score": score}
+        for blog_id, related in neighbours.items()
+        for related_id, score in related
+    ]
+
+
+async def _replace_lists(db: AsyncSession, blog_ids, neighbours: Dict[int, List[Tuple[int, float]]]) -> int:
+    """Replace the stored neighbour lists of blog_ids (None = all); the caller commits"""
+    statement = delete(RelatedPost)
+    if blog_ids is not None:
+        statement = statement.where(RelatedPost.blog_id.in_(blog_ids))
+    await db.execute(statement)
+
+    rows = _related_rows(neighbours)
+    for start in range(0, len(rows), 1000):
+        await db.execute(RelatedPost.__table__.insert().values(rows[start:start + 1000]))
+    return len(rows)
+
+
+async def _sync_model(blog_id: int) -> Optional[Dict[str, float]]:
+    """
+    Bring the cached model up to date before an incremental update
+
+    Re-vectorises (or drops) every post with a `blog.related_update` task
+    queued since the model last read the database, plus blog_id itself.
+
+    Returns:
+        post_terms() of blog_id, or None if it is not published
+    """
+    global _model_synced_at
+
+    synced_at = datetime.now(timezone.utc)
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Task.payload)
+            .where(
+                Task.name == "blog.related_update",
+                Task.created_at >= _model_synced_at - timedelta(seconds=SYNC_SLACK_SECONDS),
+            )
+        )
+        changed = {payload["blog_id"] for payload in result.scalars().all()} | {blog_id}
+
+    posts = dict(await _load_terms(sorted(changed)))
+    for other in changed:
+        if other in posts:
+            await asyncio.to_thread(_model.upsert, other, posts[other])
+        else:
+            _model.remove(other)
+
+    _model_synced_at = synced_at
+    if len(changed) > 1:
+        logger.debug(f"Related posts model synced: {len(changed)} changed posts")
+    return posts.get(blog_id)
+
+
+async def _rebuild() -> Dict[str, Any]:
+    global _model, _model_built_at, _model_synced_at
+
+    started = time.monotonic()
+    synced_at = datetime.now(timezone.utc)
+    posts = await _load_terms()
+    model = await asyncio.to_thread(RelatedModel, posts)
+    neighbours = await asyncio.to_thread(
+        model.neighbours, None, settings.RELATED_POSTS_TOP_K, settings.RELATED_POSTS_MIN_SCORE,
+    )
+
+    async with AsyncSessionLocal() as db:
+        pairs = await _replace_lists(db, None, neighbours)
+        await db.commit()
+
+    _model, _model_built_at, _model_synced_at = model, time.monotonic(), synced_at
+    seconds = round(time.monotonic() - started, 2)
+    logger.info(f"Related posts rebuilt: {len(posts)} posts, {pairs} pairs in {seconds}s")
+    return {"posts": len(posts), "pairs": pairs, "seconds": seconds}
+
+
+async def rebuild_related_posts() -> Dict[str, Any]:
+    """
+    Recompute every published post's neighbours
+
+    Returns:
+        {"posts", "pairs", "seconds"}
+    """
+    async with _lock:
+        return await _rebuild()
+
+
+async def update_related_posts(blog_id: int) -> Dict[str, Any]:
+    """
+    Refresh neighbour lists after one post changed
+
+    Recomputed lists: the post's own (if published), those that list it
+    now, and those it now beats (similarity above their weakest stored
+    neighbour, or fewer than k stored). Falls back to a full rebuild when no
+    model is cached or it is older than RELATED_POSTS_MODEL_MAX_AGE_SECONDS.
+
+    Args:
+        blog_id: Changed post
+
+    Returns:
+        {"blog_id", "updated"} (or the rebuild summary)
+    """
+    async with _lock:
+        if _model is None or time.monotonic() - _model_built_at > settings.RELATED_POSTS_MODEL_MAX_AGE_SECONDS:
+            return await _rebuild()
+
+        k = settings.RELATED_POSTS_TOP_K
+        min_score = settings.RELATED_POSTS_MIN_SCORE
+        terms = await _sync_model(blog_id)
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(RelatedPost.blog_id).where(RelatedPost.related_id == blog_id))
+            affected = set(result.scalars().all())
+
+            entering = set()
+            if terms is not None:
+                similarities = await asyncio.to_thread(_model.similarities, blog_id)
+                result = await db.execute(
+                    select(RelatedPost.blog_id, func.min(RelatedPost.score), func.count())
+                    .group_by(RelatedPost.blog_id)
+                )
+                weakest = {other: (score, count) for other, score, count in result.all()}
+                for other, score in similarities.items():
+                    stored_min, stored = weakest.get(other, (0.0, 0))
+                    if score > min_score and (stored < k or score > stored_min):
+                        entering.add(other)
+                affected |= entering | {blog_id}
+            else:
+                await db.execute(
+                    delete(RelatedPost).where(or_(RelatedPost.blog_id == blog_id, RelatedPost.related_id == blog_id))
+                )
+
+            neighbours = await asyncio.to_thread(_model.neighbours, sorted(affected), k, min_score)
+            await _replace_lists(db, sorted(affected), neighbours)
+            await db.commit()
+
+    logger.info(f"Related posts updated for blog {blog_id}: {len(neighbours)} lists")
+    return {"blog_id": blog_id, "updated": len(neighbours)}
+
+
+async def warm_up() -> None:
+    """Queue a rebuild at startup when nothing has been computed yet"""
+    try:
+        async with AsyncSessionLocal() as db:
+            has_rows = (await db.execute(select(RelatedPost.blog_id).limit(1))).first() is not None
+            has_posts = (await db.execute(
+                select(Blog.id).where(Blog.status == BlogStatus.PUBLISHED).limit(1)
+            )).first() is not None
+        if has_posts and not has_rows:
+            await enqueue_rebuild()
+    except Exception as e:
+        logger.error(f"Related posts warm-up failed: {e}")
+
+
+# ============ Queries ============
+
+async def get_related_posts(db: AsyncSession, blog_id: int, limit: int = 5) -> List[Tuple[Blog, float]]:
+    """
+    Published posts related to a post, most similar first
+
+    Args:
+        db: Database session
+        blog_id: Blog post ID
+        limit: Maximum posts
+
+    Returns:
+        (blog, score) pairs (content not loaded)
+    """
+    result = await db.execute(
+        select(Blog, RelatedPost.score)
+        .join(RelatedPost, RelatedPost.related_id == Blog.id)
+        .options(defer(Blog.content, raiseload=True))
+        .where(RelatedPost.blog_id == blog_id, Blog.status == BlogStatus.PUBLISHED)
+        .order_by(RelatedPost.score.desc())
+        .limit(limit)
+    )
+    return [(blog, score) for blog, score in result.all()]
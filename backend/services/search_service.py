@@ -0,0 +1,400 @@
+"""
+Search Service
+
+Full-text search over published blogs and all projects.
+
+Backends (SEARCH_BACKEND):
+- "postgres": a tsvector column with a GIN index on each table, filled
+  with the Korean-aware tokens of utils.search_index and ranked with
+  ts_rank_cd (field weights A-D)
+- "memory": the in-process BM25 index of utils.search_index, built in the
+  background at startup
+- "auto" (default): postgres on PostgreSQL, memory otherwise (SQLite)
+
+The blog/project service functions call index_blog / index_project /
+remove_* after every write, so both backends stay current without a
+rebuild. Hook failures are logged and never fail the write itself.
+
+The memory index is per process and only sees writes handled by that
+process: with several API workers on SQLite the indexes diverge until
+each is rebuilt (POST /api/search/rebuild only reaches the worker that
+serves it) or restarted. Run a single worker with the memory backend,
+or use PostgreSQL.
+"""
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, update, func, cast, literal, desc
+from sqlalchemy.dialects.postgresql import TSQUERY, TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from loguru import logger
+
+from core.config import settings
+from core.database import AsyncSessionLocal, engine
+from models.blog import Blog, BlogStatus
+from models.project import Project
+from utils.search_index import (
+    SearchIndex,
+    highlight,
+    plain_text,
+    query_terms,
+    tsquery_literal,
+    tsvector_literal,
+)
+
+
+KINDS = ("blog", "project")
+_BUILD_BATCH_SIZE = 1000
+
+
+def backend_name() -> str:
+    """Active search backend ("postgres" or "memory")"""
+    if settings.SEARCH_BACKEND == "auto":
+        return "postgres" if engine.dialect.name == "postgresql" else "memory"
+    return settings.SEARCH_BACKEND
+
+
+# ============ Document Fields ============
+
+def _content_head(column):
+    """Raw content prefix: enough to fill SEARCH_CONTENT_MAX_CHARS after markdown is stripped"""
+    return func.substr(column, 1, settings.SEARCH_CONTENT_MAX_CHARS * 2).label("content")
+
+
+def blog_fields(blog) -> Dict[str, Optional[str]]:
+    """Indexed fields of a blog (ORM object or row)"""
+    return {
+        "title": blog.title,
+        "tags": (blog.tags or "").replace(",", " "),
+        "summary": blog.excerpt,
+        "content": plain_text(blog.content)[:settings.SEARCH_CONTENT_MAX_CHARS],
+    }
+
+
+def project_fields(project) -> Dict[str, Optional[str]]:
+    """Indexed fields of a project (ORM object or row)"""
+    return {
+        "title": project.name,
+        "tags": " ".join(filter(None, [*(project.tech_stack or []), project.category])),
+        "summary": project.description,
+        "content": plain_text(project.content)[:settings.SEARCH_CONTENT_MAX_CHARS],
+    }
+
+
+_BLOG_COLUMNS = (Blog.id, Blog.title, Blog.tags, Blog.excerpt)
+_PROJECT_COLUMNS = (Project.id, Project.name, Project.tech_stack, Project.category, Project.description)
+
+
+async def _iter_rows(kind: str, where=None, batch_size: int = _BUILD_BATCH_SIZE):
+    """Yield batches of (id, fields) in ID order, one short session per batch"""
+    model, columns, fields = (
+        (Blog, (*_BLOG_COLUMNS, _content_head(Blog.content)), blog_fields)
+        if kind == "blog"
+        else (Project, (*_PROJECT_COLUMNS, _content_head(Project.content)), project_fields)
+    )
+
+    last_id = 0
+    while True:
+        query = select(*columns).where(model.id > last_id)
+        if where is not None:
+            query = query.where(where)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(query.order_by(model.id).limit(batch_size))
+            rows = result.all()
+        if not rows:
+            return
+        last_id = rows[-1].id
+        yield [(row.id, fields(row)) for row in rows]
+
+
+# ============ Memory Backend ============
+
+class MemorySearch:
+    """Holds the in-process index; writes during a build are replayed afterwards"""
+
+    def __init__(self):
+        self.index: Optional[SearchIndex] = None
+        self.built_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._pending: Optional[List[Tuple[str, str, int, Optional[Dict[str, Any]]]]] = None
+
+    async def ensure_built(self) -> SearchIndex:
+        """Build the index on first use"""
+        if self.index is None:
+            async with self._lock:
+                if self.index is None:
+                    await self._build()
+        return self.index
+
+    async def rebuild(self) -> SearchIndex:
+        """Rebuild from the database (drops tombstones)"""
+        async with self._lock:
+            await self._build()
+        return self.index
+
+    async def _build(self) -> None:
+        started = time.monotonic()
+        self._pending = []
+        index = SearchIndex()
+        try:
+            async for batch in _iter_rows("blog", Blog.status == BlogStatus.PUBLISHED):
+                for doc_id, fields in batch:
+                    index.add("blog", doc_id, fields)
+                await asyncio.sleep(0)  # Let requests run between batches
+            async for batch in _iter_rows("project"):
+                for doc_id, fields in batch:
+                    index.add("project", doc_id, fields)
+                await asyncio.sleep(0)
+
+            for op, kind, doc_id, fields in self._pending:
+                if op == "add":
+                    index.add(kind, doc_id, fields)
+                else:
+                    index.remove(kind, doc_id)
+            index.prepare()
+        finally:
+            self._pending = None
+
+        self.index = index
+        self.built_at = time.time()
+        logger.info(f"Search index built: {len(index)} documents in {time.monotonic() - started:.2f}s")
+
+    def apply(self, op: str, kind: str, doc_id: int, fields: Optional[Dict[str, Any]] = None) -> None:
+        """Apply a write hook (queued while a build is running)"""
+        if self._pending is not None:
+            self._pending.append((op, kind, doc_id, fields))
+        if self.index is None:
+            return  # Not built yet: the build reads the current rows
+        if op == "add":
+            self.index.add(kind, doc_id, fields)
+        else:
+            self.index.remove(kind, doc_id)
+
+
+memory_search = MemorySearch()
+
+
+# ============ Index Hooks ============
+
+async def _set_vectors(db: AsyncSession, model, vectors: Iterable[Tuple[int, Dict[str, Any]]]) -> None:
+    """Write search_vector for (id, fields) pairs and commit"""
+    for doc_id, fields in vectors:
+        await db.execute(
+            update(model)
+            .where(model.id == doc_id)
+            # Keep updated_at: indexing is not an edit
+            .values(search_vector=cast(literal(tsvector_literal(fields)), TSVECTOR), updated_at=model.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+    await db.commit()
+
+
+async def index_blog(db: AsyncSession, blog: Blog) -> None:
+    """
+    Index a created/updated blog (unpublished blogs are removed from results)
+
+    Args:
+        db: Database session (the caller's write is already committed)
+        blog: Blog post
+    """
+    try:
+        if backend_name() == "postgres":
+            await _set_vectors(db, Blog, [(blog.id, blog_fields(blog))])
+        elif blog.status == BlogStatus.PUBLISHED:
+            memory_search.apply("add", "blog", blog.id, blog_fields(blog))
+        else:
+            memory_search.apply("remove", "blog", blog.id)
+    except Exception as e:
+        logger.error(f"Failed to index blog {blog.id}: {e}")
+
+
+async def remove_blog(blog_id: int) -> None:
+    """Drop a deleted blog from the index (its tsvector went with the row)"""
+    if backend_name() == "memory":
+        memory_search.apply("remove", "blog", blog_id)
+
+
+async def index_projects(db: AsyncSession, projects: Sequence[Project]) -> None:
+    """
+    Index created/updated projects
+
+    Args:
+        db: Database session (the caller's write is already committed)
+        projects: Projects
+    """
+    try:
+        if backend_name() == "postgres":
+            await _set_vectors(db, Project, [(project.id, project_fields(project)) for project in projects])
+        else:
+            for project in projects:
+                memory_search.apply("add", "project", project.id, project_fields(project))
+    except Exception as e:
+        logger.error(f"Failed to index {len(projects)} project(s): {e}")
+
+
+async def index_project(db: AsyncSession, project: Project) -> None:
+    """Index a created/updated project"""
+    await index_projects(db, [project])
+
+
+async def remove_project(project_id: int) -> None:
+    """Drop a deleted project from the index"""
+    if backend_name() == "memory":
+        memory_search.apply("remove", "project", project_id)
+
+
+# ============ Startup ============
+
+async def backfill_search_vectors() -> int:
+    """
+    Fill missing tsvectors (rows written before the search backend existed)
+
+    Returns:
+        Number of rows indexed
+    """
+    total = 0
+    for kind, model in (("blog", Blog), ("project", Project)):
+        async for batch in _iter_rows(kind, model.search_vector.is_(None)):
+            async with AsyncSessionLocal() as db:
+                await _set_vectors(db, model, batch)
+            total += len(batch)
+
+    if total:
+        logger.info(f"Search vectors backfilled for {total} rows")
+    return total
+
+
+async def warm_up() -> None:
+    """Prepare the active backend (started in the background by main.py)"""
+    try:
+        if backend_name() == "postgres":
+            await backfill_search_vectors()
+        else:
+            await memory_search.ensure_built()
+    except Exception as e:
+        logger.error(f"Search warm-up failed: {e}")
+
+
+# ============ Search ============
+
+async def _rank_postgres(db: AsyncSession, terms: List[str], kinds: Sequence[str], limit: int) -> List[Tuple[str, int, float]]:
+    """GIN lookup + ts_rank_cd; all terms first, any term if nothing matches"""
+    for operator in ("&", "|"):
+        query = cast(literal(tsquery_literal(terms, operator)), TSQUERY)
+        hits: List[Tuple[str, int, float]] = []
+
+        for kind, model, visible in (
+            ("blog", Blog, Blog.status == BlogStatus.PUBLISHED),
+            ("project", Project, None),
+        ):
+            if kind not in kinds:
+                continue
+            rank = func.ts_rank_cd(model.search_vector, query, 32).label("rank")
+            stmt = select(model.id, rank).where(model.search_vector.op("@@")(query))
+            if visible is not None:
+                stmt = stmt.where(visible)
+            result = await db.execute(stmt.order_by(desc("rank")).limit(limit))
+            hits.extend((kind, row.id, round(float(row.rank), 4)) for row in result)
+
+        if hits or len(terms) == 1:
+            return sorted(hits, key=lambda hit: hit[2], reverse=True)[:limit]
+    return []
+
+
+async def _load_hits(db: AsyncSession, hits: List[Tuple[str, int, float]], query: str) -> List[Dict[str, Any]]:
+    """Load display fields for ranked hits and highlight them"""
+    ids = {kind: [doc_id for hit_kind, doc_id, _ in hits if hit_kind == kind] for kind in KINDS}
+    rows: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    if ids["blog"]:
+        result = await db.execute(
+            select(Blog.id, Blog.slug, Blog.title, Blog.excerpt, _content_head(Blog.content))
+            .where(Blog.id.in_(ids["blog"]), Blog.status == BlogStatus.PUBLISHED)
+        )
+        for row in result:
+            rows[("blog", row.id)] = {"slug": row.slug, "title": row.title, "summary": row.excerpt, "content": row.content}
+
+    if ids["project"]:
+        result = await db.execute(
+            select(Project.id, Project.slug, Project.name, Project.description, _content_head(Project.content))
+            .where(Project.id.in_(ids["project"]))
+        )
+        for row in result:
+            rows[("project", row.id)] = {"slug": row.slug, "title": row.name, "summary": row.description, "content": row.content}
+
+    items = []
+    for kind, doc_id, score in hits:
+        row = rows.get((kind, doc_id))
+        if row is None:
+            continue  # Deleted/unpublished since it was indexed
+
+        # Snippet from the summary if it matches, else from the content
+        summary_highlight = highlight(row["summary"], query, width=settings.SEARCH_SNIPPET_CHARS)
+        if "<mark>" not in summary_highlight:
+            content_highlight = highlight(plain_text(row["content"]), query, width=settings.SEARCH_SNIPPET_CHARS)
+            if "<mark>" in content_highlight or not row["summary"]:
+                summary_highlight = content_highlight
+
+        items.append({
+            "type": kind,
+            "id": doc_id,
+            "slug": row["slug"],
+            "title": row["title"],
+            "title_highlight": highlight(row["title"], query),
+            "snippet": summary_highlight,
+            "score": score,
+        })
+    return items
+
+
+async def search(
+    db: AsyncSession,
+    query: str,
+    kinds: Sequence[str] = KINDS,
+    limit: int = 20,
+) -> Dict[str, Any]:
+    """
+    Search published blogs and projects
+
+    Args:
+        db: Database session
+        query: Search text
+        kinds: Document kinds to include ("blog", "project")
+        limit: Maximum results
+
+    Returns:
+        Dict shaped like SearchResponse
+    """
+    started = time.perf_counter()
+    backend = backend_name()
+    terms = query_terms(query)
+
+    hits: List[Tuple[str, int, float]] = []
+    if terms:
+        if backend == "postgres":
+            hits = await _rank_postgres(db, terms, kinds, limit)
+        else:
+            index = await memory_search.ensure_built()
+            hits = index.search(query, limit=limit, kinds=kinds)
+
+    items = await _load_hits(db, hits, query) if hits else []
+
+    return {
+        "query": query,
+        "backend": backend,
+        "total": len(items),
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        "items": items,
+    }
+
+
+def get_search_stats() -> Dict[str, Any]:
+    """Backend and in-process index state"""
+    index = memory_search.index
+    return {
+        "backend": backend_name(),
+        "documents": len(index) if index is not None else None,
+        "tombstones": index.tombstones if index is not None else None,
+        "built_at": memory_search.built_at,
+    }
@@ -0,0 +1,203 @@
+"""
+Tag Service
+
+Maintains the normalised tag index (tags, blog_tags) next to the
+comma-separated Blog.tags display copy. Blog writers take a TagState
+snapshot before changing a post and call sync_blog_tags before committing,
+so associations and tag-cloud counts change in the same transaction as the
+post itself.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, update
+from typing import Dict, Iterable, List, Optional, Tuple
+from loguru import logger
+
+from core.database import dialect_insert
+from models.blog import Blog, BlogStatus
+from models.tag import Tag, blog_tags
+
+
+MAX_TAG_LENGTH = 100
+
+# (tag names, counted in the tag cloud i.e. PUBLISHED)
+TagState = Tuple[Tuple[str, ...], bool]
+
+
+def tag_key(name: str) -> str:
+    """Lookup key of a tag name ("  FastAPI " -> "fastapi")"""
+    return " ".join(name.split()).lower()
+
+
+def normalize_tags(names: Optional[Iterable[str]]) -> List[str]:
+    """
+    Clean up user-supplied tag names
+
+    Whitespace is collapsed, commas (the Blog.tags separator) removed, empty
+    names dropped and case-insensitive duplicates removed (first spelling wins).
+
+    Args:
+        names: Raw tag names
+
+    Returns:
+        Tag names in order
+    """
+    tags: Dict[str, str] = {}
+    for name in names or ():
+        name = " ".join(name.replace(",", " ").split())[:MAX_TAG_LENGTH]
+        if name:
+            tags.setdefault(name.lower(), name)
+    return list(tags.values())
+
+
+def tag_state(blog: Optional[Blog]) -> TagState:
+    """Snapshot of a post's tags and visibility (None = post does not exist)"""
+    if blog is None:
+        return (), False
+    return tuple(blog.tags_list), blog.status == BlogStatus.PUBLISHED
+
+
+async def _ensure_tags(db: AsyncSession, names: Dict[str, str]) -> Dict[str, int]:
+    """
+    Tag IDs by key, creating missing tags
+
+    Args:
+        db: Database session
+        names: Display name by key
+
+    Returns:
+        Tag ID by key
+    """
+    if not names:
+        return {}
+
+    result = await db.execute(select(Tag.key, Tag.id).where(Tag.key.in_(list(names))))
+    ids = dict(result.all())
+
+    missing = [{"key": key, "name": name} for key, name in names.items() if key not in ids]
+    if missing:
+        # Concurrent writers may create the same tag
+        await db.execute(
+            dialect_insert(db, Tag).values(missing).on_conflict_do_nothing(index_elements=["key"])
+        )
+        result = await db.execute(
+            select(Tag.key, Tag.id).where(Tag.key.in_([row["key"] for row in missing]))
+        )
+        ids.update(result.all())
+
+    return ids
+
+
+async def sync_blog_tags(db: AsyncSession, blog_id: int, before: TagState, after: TagState) -> None:
+    """
+    Apply a post's tag/visibility change to the tag index
+
+    Only the difference is written: changed associations and +1/-1 count
+    updates for tags entering or leaving the published set. The caller
+    commits.
+
+    Args:
+        db: Database session
+        blog_id: Blog post ID (flushed)
+        before: tag_state() before the change
+        after: tag_state() after the change (tag_state(None) for a deletion)
+    """
+    old = {tag_key(name): name for name in before[0]}
+    new = {tag_key(name): name for name in after[0]}
+    counted_before = set(old) if before[1] else set()
+    counted_after = set(new) if after[1] else set()
+
+    added = new.keys() - old.keys()
+    removed = old.keys() - new.keys()
+    if not added and not removed and counted_before == counted_after:
+        return
+
+    ids = await _ensure_tags(db, {**old, **new})
+
+    if removed:
+        await db.execute(
+            delete(blog_tags)
+            .where(blog_tags.c.blog_id == blog_id)
+            .where(blog_tags.c.tag_id.in_([ids[key] for key in removed]))
+        )
+    if added:
+        await db.execute(
+            dialect_insert(db, blog_tags)
+            .values([{"blog_id": blog_id, "tag_id": ids[key]} for key in added])
+            .on_conflict_do_nothing()
+        )
+
+    for keys, delta in ((counted_after - counted_before, 1), (counted_before - counted_after, -1)):
+        if keys:
+            await db.execute(
+                update(Tag)
+                .where(Tag.id.in_([ids[key] for key in keys]))
+                .values(post_count=Tag.post_count + delta)
+                .execution_options(synchronize_session=False)
+            )
+
+
+async def get_tag_cloud(db: AsyncSession, limit: int = 100) -> List[Dict]:
+    """
+    Tags of published posts with their post counts
+
+    Args:
+        db: Database session
+        limit: Maximum tags (most used first)
+
+    Returns:
+        List of {"name", "key", "count"}
+    """
+    result = await db.execute(
+        select(Tag.name, Tag.key, Tag.post_count)
+        .where(Tag.post_count > 0)
+        .order_by(Tag.post_count.desc(), Tag.name)
+        .limit(limit)
+    )
+    return [{"name": name, "key": key, "count": count} for name, key, count in result.all()]
+
+
+async def rebuild_tag_index(db: AsyncSession) -> int:
+    """
+    Rebuild tags/blog_tags and counts from Blog.tags
+
+    For posts written without the blog service (seed scripts, manual SQL).
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of associations written
+    """
+    result = await db.execute(select(Blog.id, Blog.tags, Blog.status).where(Blog.tags.isnot(None)))
+    rows = result.all()
+
+    names: Dict[str, str] = {}
+    links: List[Tuple[int, str]] = []
+    counts: Dict[str, int] = {}
+    for blog_id, tags, status in rows:
+        for name in normalize_tags(tags.split(",")):
+            key = tag_key(name)
+            names.setdefault(key, name)
+            links.append((blog_id, key))
+            if status == BlogStatus.PUBLISHED:
+                counts[key] = counts.get(key, 0) + 1
+
+    await db.execute(delete(blog_tags))
+    ids = await _ensure_tags(db, names)
+    if links:
+        await db.execute(
+            dialect_insert(db, blog_tags)
+            .values([{"blog_id": blog_id, "tag_id": ids[key]} for blog_id, key in links])
+            .on_conflict_do_nothing()
+        )
+
+    await db.execute(update(Tag).values(post_count=0).execution_options(synchronize_session=False))
+    for key, count in counts.items():
+        await db.execute(
+            update(Tag).where(Tag.id == ids[key]).values(post_count=count)
+            .execution_options(synchronize_session=False)
+        )
+    await db.commit()
+
+    logger.info(f"Tag index rebuilt: {len(names)} tags, {len(links)} associations")
+    return len(links)
@@ -0,0 +1,104 @@
+"""
+Task Handlers
+
+Handlers for the durable task queue, registered by name. Each handler
+receives the task payload and may return a JSON-serialisable result.
+Handlers open their own short-lived sessions.
+
+Tasks:
+    newsletter.send      {"newsletter_id": int}  send a newsletter to all subscribers
+    ai.job               {"job_id": str}         run an AI generation job (AI_JOB_RUNNER=queue)
+    github.sync_stars    {}                      refresh project star counts from GitHub
+    blog.related_rebuild {}                      recompute related posts for all published blogs
+    blog.related_update  {"blog_id": int}        refresh related posts after one blog changed
+    feeds.regenerate     {}                      rebuild the RSS/Atom feeds and sitemap
+"""
+from typing import Any, Dict
+
+from sqlalchemy import select
+from loguru import logger
+
+from core.database import AsyncSessionLocal
+from models.project import Project
+from services import ai_job_service, feed_service, newsletter_service, related_service
+from services.github_client import github_client, parse_github_url
+from services.task_queue import task_handler
+
+
+@task_handler("newsletter.send")
+async def send_newsletter(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Send a newsletter (enqueue with max_attempts=1: sending is not idempotent)"""
+    async with AsyncSessionLocal() as db:
+        try:
+            sent_count = await newsletter_service.send_newsletter_to_all(
+                db, payload["newsletter_id"], claimed=True,
+            )
+        finally:
+            # A dispatched (SENDING) newsletter that did not reach SENT is marked FAILED.
+            # Roll back first: after a database error the session is unusable.
+            await db.rollback()
+            await newsletter_service.fail_unfinished_send(db, payload["newsletter_id"])
+    return {"sent_count": sent_count}
+
+
+@task_handler("ai.job")
+async def run_ai_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Run an AI job; its outcome is persisted on the ai_jobs row"""
+    job_id = payload["job_id"]
+
+    # Holding this task's lease means no other worker runs the job, so a
+    # RUNNING job here was interrupted (lease expired) and can be re-claimed
+    await ai_job_service.reset_interrupted_job(job_id)
+    await ai_job_service.execute_job(job_id)
+
+    async with AsyncSessionLocal() as db:
+        job = await ai_job_service.get_job(db, job_id)
+    return {"job_id": job_id, "status": job.status.value if job else None}
+
+
+@task_handler("github.sync_stars")
+async def sync_github_stars(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Refresh Project.star_count from GitHub (served from the ETag cache when unchanged)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Project.id, Project.github_url).where(Project.github_url.is_not(None))
+        )
+        projects = result.all()
+
+    updated = 0
+    for project_id, github_url in projects:
+        parsed = parse_github_url(github_url)
+        if not parsed:
+            continue
+
+        repo = await github_client.get_repo(*parsed)
+        if not repo or repo.get("stargazers_count") is None:
+            continue
+
+        async with AsyncSessionLocal() as db:
+            project = await db.get(Project, project_id)
+            if project and project.star_count != repo["stargazers_count"]:
+                project.star_count = repo["stargazers_count"]
+                await db.commit()
+                updated += 1
+
+    logger.info(f"GitHub star sync: {updated} of {len(projects)} projects updated")
+    return {"projects": len(projects), "updated": updated}
+
+
+@task_handler("blog.related_rebuild")
+async def rebuild_related_posts(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Recompute every published post's related posts"""
+    return await related_service.rebuild_related_posts()
+
+
+@task_handler("blog.related_update")
+async def update_related_posts(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Refresh related posts around one published/edited/unpublished/deleted post"""
+    return await related_service.update_related_posts(payload["blog_id"])
+
+
+@task_handler("feeds.regenerate")
+async def regenerate_feeds(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the RSS/Atom feeds and sitemap after content changed"""
+    return await feed_service.regenerate_feeds()
@@ -0,0 +1,455 @@
+"""
+Task Queue Service
+
+Durable background task queue on the application database. Any process
+can enqueue; any number of worker processes (services.task_worker) dequeue
+with SELECT ... FOR UPDATE SKIP LOCKED, so concurrent workers never block
+on or double-claim the same row.
+
+- priorities: higher `priority` is dequeued first, then oldest `run_at`
+- delays: a task is not dequeued before `run_at`
+- visibility timeout: a dequeued task is leased until `locked_until`;
+  workers extend the lease while running, and a task whose lease expires
+  (worker died) is handed out again
+- retries: failed attempts are re-queued with exponential backoff until
+  `max_attempts`, then marked FAILED
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from loguru import logger
+
+from core.config import settings
+from models.task import Task, TaskStatus
+
+
+TaskHandler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+# Handler registry: task name -> coroutine function(payload) -> optional result
+TASK_HANDLERS: Dict[str, TaskHandler] = {}
+
+
+def task_handler(name: str) -> Callable[[TaskHandler], TaskHandler]:
+    """
+    Register a coroutine function as the handler for a task name
+
+    Example:
+        @task_handler("newsletter.send")
+        async def send_newsletter(payload):
+            ...
+    """
+    def decorator(fn: TaskHandler) -> TaskHandler:
+        TASK_HANDLERS[name] = fn
+        return fn
+    return decorator
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# ============ Producer API ============
+
+async def enqueue_task(
+    db: AsyncSession,
+    name: str,
+    payload: Optional[Dict[str, Any]] = None,
+    priority: int = 0,
+    delay_seconds: float = 0,
+    max_attempts: Optional[int] = None,
+    commit: bool = True,
+) -> Task:
+    """
+    Add a task to the queue
+
+    Args:
+        db: Database session
+        name: Handler name
+        payload: JSON-serialisable handler input
+        priority: Higher runs first (default 0)
+        delay_seconds: Do not run before now + delay
+        max_attempts: Attempts before the task is marked FAILED
+            (default TASK_MAX_ATTEMPTS; use 1 for non-idempotent work)
+        commit: If False, only flush (enqueue atomically with the caller's
+            own changes, committed by the caller)
+
+    Returns:
+        Created task
+    """
+    task = Task(
+        name=name,
+        payload=payload or {},
+        priority=priority,
+        status=TaskStatus.QUEUED,
+        attempts=0,
+        max_attempts=max_attempts or settings.TASK_MAX_ATTEMPTS,
+        run_at=_now() + timedelta(seconds=delay_seconds),
+    )
+    db.add(task)
+
+    if commit:
+        await db.commit()
+        await db.refresh(task)
+    else:
+        await db.flush()
+
+    logger.info(f"Task enqueued: {name} (ID: {task.id}, priority: {priority})")
+    return task
+
+
+async def get_task(db: AsyncSession, task_id: int) -> Optional[Task]:
+    """
+    Get task by ID
+
+    Args:
+        db: Database session
+        task_id: Task ID
+
+    Returns:
+        Task if found, None otherwise
+    """
+    result = await db.execute(select(Task).where(Task.id == task_id))
+    return result.scalar_one_or_none()
+
+
+async def list_tasks(
+    db: AsyncSession,
+    status: Optional[TaskStatus] = None,
+    name: Optional[str] = None,
+    limit: int = 50,
+) -> List[Task]:
+    """
+    List recent tasks, newest first
+
+    Args:
+        db: Database session
+        status: Filter by status (optional)
+        name: Filter by task name (optional)
+        limit: Maximum number of tasks
+
+    Returns:
+        Task list
+    """
+    query = select(Task)
+    if status:
+        query = query.where(Task.status == status)
+    if name:
+        query = query.where(Task.name == name)
+
+    result = await db.execute(query.order_by(Task.id.desc()).limit(limit))
+    return list(result.scalars().all())
+
+
+async def retry_task(db: AsyncSession, task: Task) -> Task:
+    """
+    Re-queue a FAILED task with a fresh set of attempts
+
+    Args:
+        db: Database session
+        task: Failed task
+
+    Returns:
+        Updated task
+    """
+    task.status = TaskStatus.QUEUED
+    task.attempts = 0
+    task.run_at = _now()
+    task.locked_by = None
+    task.locked_until = None
+    task.finished_at = None
+    await db.commit()
+    await db.refresh(task)
+
+    logger.info(f"Task re-queued: {task.name} (ID: {task.id})")
+    return task
+
+
+# ============ Worker API ============
+
+async def dequeue_tasks(
+    db: AsyncSession,
+    worker_id: str,
+    limit: int,
+    visibility_timeout: float,
+) -> List[Task]:
+    """
+    Claim up to `limit` ready tasks for a worker
+
+    Ready means QUEUED with run_at reached, or RUNNING with an expired lease
+    and attempts left. Rows locked by another worker's dequeue are skipped.
+
+    Args:
+        db: Database session
+        worker_id: Claiming worker
+        limit: Maximum tasks to claim
+        visibility_timeout: Lease length in seconds
+
+    Returns:
+        Claimed tasks (RUNNING, attempts incremented)
+    """
+    now = _now()
+    ready = (
+        select(Task.id)
+        .where(or_(
+            and_(Task.status == TaskStatus.QUEUED, Task.run_at <= now),
+            and_(
+                Task.status == TaskStatus.RUNNING,
+                Task.locked_until < now,
+                Task.attempts < Task.max_attempts,
+            ),
+        ))
+        .order_by(Task.priority.desc(), Task.run_at, Task.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+    result = await db.execute(
+        update(Task)
+        .where(Task.id.in_(ready.scalar_subquery()))
+        .values(
+            status=TaskStatus.RUNNING,
+            attempts=Task.attempts + 1,
+            locked_by=worker_id,
+            locked_until=now + timedelta(seconds=visibility_timeout),
+            started_at=now,
+        )
+        .returning(Task)
+        .execution_options(synchronize_session=False)
+    )
+    tasks = list(result.scalars().all())
+    await db.commit()
+
+    tasks.sort(key=lambda task: (-task.priority, task.id))
+    return tasks
+
+
+async def extend_lease(db: AsyncSession, task_id: int, worker_id: str, visibility_timeout: float) -> bool:
+    """
+    Push a running task's lease forward (heartbeat)
+
+    Args:
+        db: Database session
+        task_id: Task ID
+        worker_id: Worker holding the lease
+        visibility_timeout: New lease length in seconds
+
+    Returns:
+        False if the lease was lost (expired and claimed elsewhere)
+    """
+    result = await db.execute(
+        update(Task)
+        .where(Task.id == task_id, Task.locked_by == worker_id, Task.status == TaskStatus.RUNNING)
+        .values(locked_until=_now() + timedelta(seconds=visibility_timeout))
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def complete_task(
+    db: AsyncSession,
+    task_id: int,
+    worker_id: str,
+    result: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Mark a task SUCCEEDED
+
+    Args:
+        db: Database session
+        task_id: Task ID
+        worker_id: Worker holding the lease
+        result: JSON-serialisable handler result
+
+    Returns:
+        False if the lease had been lost (the result is discarded)
+    """
+    updated = await db.execute(
+        update(Task)
+        .where(Task.id == task_id, Task.locked_by == worker_id, Task.status == TaskStatus.RUNNING)
+        .values(
+            status=TaskStatus.SUCCEEDED,
+            result=result,
+            last_error=None,
+            locked_until=None,
+            finished_at=_now(),
+        )
+    )
+    await db.commit()
+    return updated.rowcount == 1
+
+
+async def fail_task(
+    db: AsyncSession,
+    task: Task,
+    worker_id: str,
+    error: str,
+) -> TaskStatus:
+    """
+    Record a failed attempt: re-queue with backoff, or mark FAILED
+
+    Args:
+        db: Database session
+        task: Task as claimed by dequeue_tasks
+        worker_id: Worker holding the lease
+        error: Error message
+
+    Returns:
+        New status (QUEUED for a retry, FAILED when out of attempts)
+    """
+    now = _now()
+    if task.attempts < task.max_attempts:
+        backoff = settings.TASK_RETRY_BACKOFF_SECONDS * 2 ** (task.attempts - 1)
+        values = {
+            "status": TaskStatus.QUEUED,
+            "run_at": now + timedelta(seconds=backoff),
+            "locked_until": None,
+        }
+    else:
+        values = {
+            "status": TaskStatus.FAILED,
+            "locked_until": None,
+            "finished_at": now,
+        }
+
+    await db.execute(
+        update(Task)
+        .where(Task.id == task.id, Task.locked_by == worker_id, Task.status == TaskStatus.RUNNING)
+        .values(last_error=error[:2000], **values)
+    )
+    await db.commit()
+    return values["status"]
+
+
+async def release_task(db: AsyncSession, task_id: int, worker_id: str) -> None:
+    """
+    Hand an interrupted task back to the queue without using up an attempt
+
+    Args:
+        db: Database session
+        task_id: Task ID
+        worker_id: Worker holding the lease
+    """
+    await db.execute(
+        update(Task)
+        .where(Task.id == task_id, Task.locked_by == worker_id, Task.status == TaskStatus.RUNNING)
+        .values(
+            status=TaskStatus.QUEUED,
+            attempts=Task.attempts - 1,
+            run_at=_now(),
+            locked_by=None,
+            locked_until=None,
+        )
+    )
+    await db.commit()
+
+
+async def fail_expired_tasks(db: AsyncSession) -> int:
+    """
+    Mark RUNNING tasks whose lease expired on their last attempt as FAILED
+
+    Returns:
+        Number of tasks failed
+    """
+    result = await db.execute(
+        update(Task)
+        .where(
+            Task.status == TaskStatus.RUNNING,
+            Task.locked_until < _now(),
+            Task.attempts >= Task.max_attempts,
+        )
+        .values(
+            status=TaskStatus.FAILED,
+            last_error="Lease expired on final attempt (worker lost)",
+            locked_until=None,
+            finished_at=_now(),
+        )
+    )
+    await db.commit()
+
+    if result.rowcount:
+        logger.warning(f"Marked {result.rowcount} abandoned task(s) as failed")
+    return result.rowcount
+
+
+async def purge_finished_tasks(db: AsyncSession, older_than_days: int) -> int:
+    """
+    Delete SUCCEEDED/FAILED tasks finished more than `older_than_days` ago
+
+    Returns:
+        Number of tasks deleted
+    """
+    result = await db.execute(
+        delete(Task).where(
+            Task.status.in_([TaskStatus.SUCCEEDED, TaskStatus.FAILED]),
+            Task.finished_at < _now() - timedelta(days=older_than_days),
+        )
+    )
+    await db.commit()
+
+    if result.rowcount:
+        logger.info(f"Purged {result.rowcount} finished task(s)")
+    return result.rowcount
+
+
+# ============ Statistics ============
+
+async def get_queue_stats(db: AsyncSession) -> Dict[str, Any]:
+    """
+    Queue depth and throughput
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dict with counts by status, ready depth, oldest ready age,
+        completions per window and per-name breakdown
+    """
+    now = _now()
+
+    result = await db.execute(
+        select(Task.name, Task.status, func.count())
+        .group_by(Task.name, Task.status)
+    )
+    by_status = {status.value: 0 for status in TaskStatus}
+    by_name: Dict[str, Dict[str, int]] = {}
+    for name, task_status, count in result.all():
+        by_status[task_status.value] += count
+        by_name.setdefault(name, {})[task_status.value] = count
+
+    ready_filter = and_(Task.status == TaskStatus.QUEUED, Task.run_at <= now)
+    result = await db.execute(select(func.count(), func.min(Task.run_at)).where(ready_filter))
+    ready, oldest_ready = result.one()
+
+    throughput = {}
+    for label, minutes in (("last_1m", 1), ("last_5m", 5), ("last_60m", 60)):
+        result = await db.execute(
+            select(Task.status, func.count())
+            .where(
+                Task.status.in_([TaskStatus.SUCCEEDED, TaskStatus.FAILED]),
+                Task.finished_at >= now - timedelta(minutes=minutes),
+            )
+            .group_by(Task.status)
+        )
+        counts = {task_status.value: count for task_status, count in result.all()}
+        throughput[label] = {
+            "succeeded": counts.get(TaskStatus.SUCCEEDED.value, 0),
+            "failed": counts.get(TaskStatus.FAILED.value, 0),
+            "per_minute": round(sum(counts.values()) / minutes, 2),
+        }
+
+    oldest_ready_seconds = None
+    if oldest_ready is not None:
+        if oldest_ready.tzinfo is None:
+            oldest_ready = oldest_ready.replace(tzinfo=timezone.utc)
+        oldest_ready_seconds = round((now - oldest_ready).total_seconds(), 1)
+
+    return {
+        "by_status": by_status,
+        "ready": ready,
+        "delayed": by_status[TaskStatus.QUEUED.value] - ready,
+        "oldest_ready_seconds": oldest_ready_seconds,
+        "throughput": throughput,
+        "by_name": by_name,
+    }
@@ -0,0 +1,269 @@
+"""
+Task Worker
+
+Async runner for the durable task queue (services.task_queue). One worker
+runs up to `concurrency` tasks at a time; scale out by running more
+processes (scripts/run_task_worker.py) — SKIP LOCKED keeps them from
+contending for the same rows.
+
+While a task runs its lease is extended every visibility_timeout / 3, so
+long tasks are not handed to another worker; if the process dies the lease
+lapses and the task is retried elsewhere.
+"""
+import asyncio
+import os
+import socket
+import time
+import uuid
+from collections import deque
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from core.config import settings
+from core.database import AsyncSessionLocal
+from models.task import Task, TaskStatus
+from services import task_queue
+
+
+class TaskWorker:
+    """Polls the task queue and runs handlers with bounded concurrency"""
+
+    def __init__(
+        self,
+        concurrency: int,
+        poll_interval: float,
+        visibility_timeout: float,
+        task_timeout: float,
+    ):
+        """
+        Initialize worker
+
+        Args:
+            concurrency: Maximum tasks running at once in this process
+            poll_interval: Seconds between polls while the queue is empty
+            visibility_timeout: Lease length in seconds (renewed while running)
+            task_timeout: Maximum run time of one attempt
+        """
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.visibility_timeout = visibility_timeout
+        self.task_timeout = task_timeout
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._loops: list = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+        # Metrics
+        self.started_at: Optional[float] = None
+        self.succeeded = 0
+        self.retried = 0
+        self.failed = 0
+        self._durations: deque = deque(maxlen=500)
+        self._finished_at: deque = deque(maxlen=10000)
+
+    @property
+    def running(self) -> bool:
+        return bool(self._loops)
+
+    def notify(self) -> None:
+        """Wake the poll loop (a task was enqueued by this process)"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    # ============ Loops ============
+
+    async def _poll(self) -> None:
+        """Claim tasks while there is free capacity"""
+        while not self._stopping:
+            # Cleared before polling so a wakeup during dequeue is not lost
+            self._wakeup.clear()
+            free = self.concurrency - len(self._tasks)
+            claimed = []
+            if free > 0:
+                try:
+                    async with AsyncSessionLocal() as db:
+                        claimed = await task_queue.dequeue_tasks(
+                            db, self.worker_id, free, self.visibility_timeout,
+                        )
+                except Exception as e:
+                    logger.error(f"Task dequeue failed: {e}")
+
+            for task in claimed:
+                self._tasks[task.id] = asyncio.create_task(self._run(task))
+
+            # Keep draining while tasks are available; otherwise sleep until
+            # woken (enqueue / a slot freed) or the poll interval passes
+            if claimed and len(claimed) == free:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _maintenance(self) -> None:
+        """Fail abandoned tasks and purge old finished ones"""
+        while not self._stopping:
+            try:
+                async with AsyncSessionLocal() as db:
+                    await task_queue.fail_expired_tasks(db)
+                    await task_queue.purge_finished_tasks(db, settings.TASK_RETENTION_DAYS)
+            except Exception as e:
+                logger.error(f"Task maintenance failed: {e}")
+            await asyncio.sleep(settings.TASK_MAINTENANCE_INTERVAL_SECONDS)
+
+    async def _heartbeat(self, task: Task) -> None:
+        """Extend the lease of a running task until cancelled"""
+        while True:
+            await asyncio.sleep(self.visibility_timeout / 3)
+            try:
+                async with AsyncSessionLocal() as db:
+                    if not await task_queue.extend_lease(db, task.id, self.worker_id, self.visibility_timeout):
+                        logger.warning(f"Lost lease on task {task.name} (ID: {task.id})")
+                        return
+            except Exception as e:
+                logger.warning(f"Heartbeat failed for task {task.id}: {e}")
+
+    async def _run(self, task: Task) -> None:
+        """Run one claimed task and record its outcome"""
+        started = time.monotonic()
+        heartbeat = asyncio.create_task(self._heartbeat(task))
+        handler = task_queue.TASK_HANDLERS.get(task.name)
+
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for task '{task.name}'")
+            result = await asyncio.wait_for(handler(task.payload or {}), timeout=self.task_timeout)
+        except asyncio.CancelledError:
+            # Worker shutting down: give the task back without using an attempt
+            heartbeat.cancel()
+            async with AsyncSessionLocal() as db:
+                await task_queue.release_task(db, task.id, self.worker_id)
+            logger.warning(f"Task interrupted and re-queued: {task.name} (ID: {task.id})")
+            raise
+        except Exception as e:
+            heartbeat.cancel()
+            error = f"{e.__class__.__name__}: {e}"
+            try:
+                async with AsyncSessionLocal() as db:
+                    new_status = await task_queue.fail_task(db, task, self.worker_id, error)
+            except Exception as db_error:
+                logger.error(f"Failed to record failure of task {task.id}: {db_error}")
+            else:
+                if new_status == TaskStatus.FAILED:
+                    self.failed += 1
+                    logger.error(f"Task failed permanently: {task.name} (ID: {task.id}): {error}")
+                else:
+                    self.retried += 1
+                    logger.warning(
+                        f"Task attempt {task.attempts}/{task.max_attempts} failed, will retry: "
+                        f"{task.name} (ID: {task.id}): {error}"
+                    )
+        else:
+            heartbeat.cancel()
+            try:
+                async with AsyncSessionLocal() as db:
+                    if not await task_queue.complete_task(db, task.id, self.worker_id, result):
+                        logger.warning(f"Task finished after losing its lease: {task.name} (ID: {task.id})")
+            except Exception as db_error:
+                logger.error(f"Failed to record completion of task {task.id}: {db_error}")
+            self.succeeded += 1
+        finally:
+            self._durations.append(time.monotonic() - started)
+            self._finished_at.append(time.monotonic())
+            self._tasks.pop(task.id, None)
+            self.notify()  # A slot is free
+
+    # ============ Lifecycle ============
+
+    def start(self) -> None:
+        """Start polling (handlers from services.task_handlers are registered on import)"""
+        if self.running:
+            return
+
+        import services.task_handlers  # noqa: F401  (registers TASK_HANDLERS)
+
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self.started_at = time.monotonic()
+        self._loops = [
+            asyncio.create_task(self._poll()),
+            asyncio.create_task(self._maintenance()),
+        ]
+        logger.info(f"Task worker started: {self.worker_id} (concurrency={self.concurrency})")
+
+    async def stop(self, grace_seconds: Optional[float] = None) -> None:
+        """
+        Stop polling and wait for running tasks
+
+        Tasks still running after `grace_seconds` are cancelled and handed
+        back to the queue.
+
+        Args:
+            grace_seconds: Drain timeout (default TASK_SHUTDOWN_GRACE_SECONDS)
+        """
+        if not self.running:
+            return
+
+        self._stopping = True
+        for loop in self._loops:
+            loop.cancel()
+        await asyncio.gather(*self._loops, return_exceptions=True)
+        self._loops = []
+
+        running = list(self._tasks.values())
+        if running:
+            grace = settings.TASK_SHUTDOWN_GRACE_SECONDS if grace_seconds is None else grace_seconds
+            logger.info(f"Waiting up to {grace}s for {len(running)} running task(s)...")
+            _, pending = await asyncio.wait(running, timeout=grace)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        logger.info(f"Task worker stopped: {self.worker_id}")
+
+    def stats(self) -> Dict[str, Any]:
+        """This process's worker state and throughput"""
+        now = time.monotonic()
+        last_minute = sum(1 for finished in self._finished_at if now - finished <= 60)
+        durations = sorted(self._durations)
+
+        return {
+            "worker_id": self.worker_id,
+            "running": self.running,
+            "concurrency": self.concurrency,
+            "active": len(self._tasks),
+            "uptime_seconds": round(now - self.started_at) if self.started_at else None,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "failed": self.failed,
+            "finished_last_minute": last_minute,
+            "duration_seconds": {
+                "avg": round(sum(durations) / len(durations), 3) if durations else None,
+                "p95": round(durations[min(len(durations) - 1, int(0.95 * len(durations)))], 3) if durations else None,
+            },
+        }
+
+
+def create_task_worker(concurrency: Optional[int] = None) -> TaskWorker:
+    """
+    Create a worker configured from settings
+
+    Args:
+        concurrency: Override TASK_WORKER_CONCURRENCY
+
+    Returns:
+        TaskWorker instance
+    """
+    return TaskWorker(
+        concurrency=concurrency or settings.TASK_WORKER_CONCURRENCY,
+        poll_interval=settings.TASK_POLL_INTERVAL_SECONDS,
+        visibility_timeout=settings.TASK_VISIBILITY_TIMEOUT_SECONDS,
+        task_timeout=settings.TASK_TIMEOUT_SECONDS,
+    )
+
+
+# Worker embedded in the API process (started by main.py if TASK_WORKER_EMBEDDED)
+task_worker = create_task_worker()
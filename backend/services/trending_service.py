@@ -0,0 +1,241 @@
+"""
+Trending Service
+
+"Trending this week" rankings from per-day view buckets instead of sorting
+whole tables by lifetime view_count:
+
+- record_view: +1 on today's (kind, id) bucket, in the view-count transaction
+- refresh_rankings: decay-weighted score per item over the last
+  TRENDING_WINDOW_DAYS (a view's weight halves every half-life), written to
+  trending_scores; run every TRENDING_REFRESH_SECONDS by TrendingRefresher
+- get_trending_blogs / get_popular_projects: top of trending_scores,
+  cached in-process for TRENDING_CACHE_SECONDS
+"""
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, and_, func
+from sqlalchemy.orm import defer
+from loguru import logger
+
+from core.config import settings
+from core.database import AsyncSessionLocal, dialect_insert
+from models.blog import Blog, BlogStatus
+from models.project import Project, ProjectStatus
+from models.view_stat import TrendingScore, ViewBucket
+from schemas.blog import BlogListItem
+from schemas.project import ProjectListItem
+from utils.serialization import serialize_row
+
+
+# (kind, limit) -> (cached at, items)
+_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+async def record_view(db: AsyncSession, kind: str, item_id: int) -> None:
+    """
+    Count a view in today's bucket (the caller commits)
+
+    Args:
+        db: Database session
+        kind: "blog" or "project"
+        item_id: Blog post / project ID
+    """
+    statement = dialect_insert(db, ViewBucket).values(kind=kind, item_id=item_id, day=_today(), views=1)
+    await db.execute(statement.on_conflict_do_update(
+        index_elements=["kind", "item_id", "day"],
+        set_={"views": ViewBucket.views + 1},
+    ))
+
+
+# ============ Ranking ============
+
+def decayed_scores(
+    buckets: List[Tuple[int, date, int]],
+    today: date,
+    half_life_days: float,
+) -> Dict[int, Tuple[float, int]]:
+    """
+    Decay-weighted view totals
+
+    Args:
+        buckets: (item_id, day, views) rows
+        today: Reference day (weight 1)
+        half_life_days: Days after which a view counts half
+
+    Returns:
+        item_id -> (score, raw views)
+    """
+    scores: Dict[int, Tuple[float, int]] = {}
+    for item_id, day, views in buckets:
+        weight = 0.5 ** (max((today - day).days, 0) / half_life_days)
+        score, total = scores.get(item_id, (0.0, 0))
+        scores[item_id] = (score + views * weight, total + views)
+    return scores
+
+
+async def refresh_rankings() -> Dict[str, int]:
+    """
+    Recompute trending_scores for blogs (published) and projects (not archived)
+
+    Returns:
+        Ranked items per kind
+    """
+    today = _today()
+    since = today - timedelta(days=settings.TRENDING_WINDOW_DAYS)
+    visible = {
+        "blog": (Blog, Blog.status == BlogStatus.PUBLISHED, settings.TRENDING_BLOG_HALF_LIFE_DAYS),
+        "project": (Project, Project.status != ProjectStatus.ARCHIVED, settings.TRENDING_PROJECT_HALF_LIFE_DAYS),
+    }
+
+    ranked = {}
+    async with AsyncSessionLocal() as db:
+        for kind, (model, condition, half_life) in visible.items():
+            result = await db.execute(
+                select(ViewBucket.item_id, ViewBucket.day, ViewBucket.views)
+                .join(model, model.id == ViewBucket.item_id)
+                .where(ViewBucket.kind == kind, ViewBucket.day > since, condition)
+            )
+            scores = decayed_scores(result.all(), today, half_life)
+
+            await db.execute(delete(TrendingScore).where(TrendingScore.kind == kind))
+            if scores:
+                # Upsert: another replica may be refreshing at the same time
+                statement = dialect_insert(db, TrendingScore).values([
+                    {"kind": kind, "item_id": item_id, "score": round(score, 4), "recent_views": views}
+                    for item_id, (score, views) in scores.items()
+                ])
+                await db.execute(statement.on_conflict_do_update(
+                    index_elements=["kind", "item_id"],
+                    set_={
+                        "score": statement.excluded.score,
+                        "recent_views": statement.excluded.recent_views,
+                        "computed_at": func.now(),
+                    },
+                ))
+            ranked[kind] = len(scores)
+
+        retention = today - timedelta(days=settings.VIEW_BUCKET_RETENTION_DAYS)
+        await db.execute(delete(ViewBucket).where(ViewBucket.day < retention))
+        await db.commit()
+
+    _cache.clear()
+    return ranked
+
+
+async def _top(db: AsyncSession, kind: str, limit: int) -> List[Dict[str, Any]]:
+    """Cached top items of a ranking, serialized like the list endpoints plus score fields"""
+    cached = _cache.get((kind, limit))
+    if cached and time.monotonic() - cached[0] < settings.TRENDING_CACHE_SECONDS:
+        return cached[1]
+
+    model, schema = (Blog, BlogListItem) if kind == "blog" else (Project, ProjectListItem)
+    query = (
+        select(model, TrendingScore.score, TrendingScore.recent_views)
+        .join(TrendingScore, and_(TrendingScore.kind == kind, TrendingScore.item_id == model.id))
+        .options(defer(model.content, raiseload=True))
+        .order_by(TrendingScore.score.desc(), model.id.desc())
+        .limit(limit)
+    )
+    # Scores are refreshed periodically, so re-check visibility at read time
+    if kind == "blog":
+        query = query.where(Blog.status == BlogStatus.PUBLISHED)
+    else:
+        query = query.where(Project.status != ProjectStatus.ARCHIVED)
+
+    result = await db.execute(query)
+    items = [
+        {**serialize_row(row, schema), "trending_score": score, "recent_views": recent_views}
+        for row, score, recent_views in result.all()
+    ]
+
+    _cache[(kind, limit)] = (time.monotonic(), items)
+    return items
+
+
+async def get_trending_blogs(db: AsyncSession, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Trending published blog posts
+
+    Args:
+        db: Database session
+        limit: Maximum posts
+
+    Returns:
+        BlogListItem-shaped dicts with trending_score and recent_views
+    """
+    return await _top(db, "blog", limit)
+
+
+async def get_popular_projects(db: AsyncSession, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Popular projects
+
+    Args:
+        db: Database session
+        limit: Maximum projects
+
+    Returns:
+        ProjectListItem-shaped dicts with trending_score and recent_views
+    """
+    return await _top(db, "project", limit)
+
+
+# ============ Periodic Refresh ============
+
+class TrendingRefresher:
+    """Recomputes rankings on an interval (idempotent, safe on every replica)"""
+
+    def __init__(self, interval_seconds: float):
+        """
+        Initialize refresher
+
+        Args:
+            interval_seconds: Seconds between recomputes
+        """
+        self.interval_seconds = interval_seconds
+        self.refreshed_at: Optional[datetime] = None
+        self._loop: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                ranked = await refresh_rankings()
+                self.refreshed_at = datetime.now(timezone.utc)
+                logger.debug(f"Trending rankings refreshed: {ranked}")
+            except Exception as e:
+                logger.error(f"Trending refresh failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    # ============ Lifecycle ============
+
+    def start(self) -> None:
+        """Start refreshing (first recompute runs immediately)"""
+        if self.running:
+            return
+        self._loop = asyncio.create_task(self._run())
+        logger.info("Trending refresher started")
+
+    async def stop(self) -> None:
+        """Stop refreshing"""
+        if self._loop is None:
+            return
+        self._loop.cancel()
+        await asyncio.gather(self._loop, return_exceptions=True)
+        self._loop = None
+        logger.info("Trending refresher stopped")
+
+
+# Refresher embedded in the API process (started by main.py if TRENDING_REFRESH_ENABLED)
+trending_refresher = TrendingRefresher(interval_seconds=settings.TRENDING_REFRESH_SECONDS)
@@ -3,13 +3,16 @@ Content Generator Utilities
 """
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta, timezone
-import httpx
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, Row, Select
 
+from core.config import settings
+from core.database import AsyncSessionLocal
 from models.blog import Blog
 from models.project import Project
 from services.ai_service import generate_blog_content, generate_newsletter_content
+from services.github_client import github_client, parse_github_url
 from loguru import logger
 
 
@@ -23,45 +26,70 @@ async def fetch_github_project_info(github_url: str) -> Optional[Dict[str, Any]]
     Returns:
         Optional[Dict]: Project information or None
     """
+    parsed = parse_github_url(github_url)
+    if not parsed:
+        logger.warning(f"Invalid GitHub URL: {github_url}")
+        return None
+
     try:
-        # Extract owner and repo from URL
-        # Example: https://github.com/owner/repo
-        parts = github_url.rstrip('/').split('/')
-        if len(parts) < 2:
-            logger.warning(f"Invalid GitHub URL: {github_url}")
+        data = await github_client.get_repo(*parsed)
+        if not data:
             return None
 
-        owner = parts[-2]
-        repo = parts[-1]
+        return {
+            "name": data.get("name"),
+            "full_name": data.get("full_name"),
+            "description": data.get("description"),
+            "stars": data.get("stargazers_count", 0),
+            "forks": data.get("forks_count", 0),
+            "language": data.get("language"),
+            "topics": data.get("topics", []),
+            "created_at": data.get("created_at"),
+            "updated_at": data.get("updated_at"),
+            "html_url": data.get("html_url"),
+        }
 
-        # Fetch from GitHub API
-        api_url = f"https://api.github.com/repos/{owner}/{repo}"
+    except Exception as e:
+        logger.error(f"Failed to fetch GitHub project info: {str(e)}")
+        return None
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(api_url)
 
-            if response.status_code != 200:
-                logger.warning(f"GitHub API request failed: {response.status_code}")
-                return None
+def _recent_blogs_query(columns: tuple, days: int, limit: int) -> Select:
+    """Published blogs in the last `days` days, newest first"""
+    from models.blog import BlogStatus
 
-            data = response.json()
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-            return {
-                "name": data.get("name"),
-                "full_name": data.get("full_name"),
-                "description": data.get("description"),
-                "stars": data.get("stargazers_count", 0),
-                "forks": data.get("forks_count", 0),
-                "language": data.get("language"),
-                "topics": data.get("topics", []),
-                "created_at": data.get("created_at"),
-                "updated_at": data.get("updated_at"),
-                "html_url": data.get("html_url"),
-            }
+    return (
+        select(*columns)
+        .where(
+            and_(
+                Blog.status == BlogStatus.PUBLISHED,
+                Blog.published_at >= cutoff_date
+            )
+        )
+        .order_by(Blog.published_at.desc())
+        .limit(limit)
+    )
 
-    except Exception as e:
-        logger.error(f"Failed to fetch GitHub project info: {str(e)}")
-        return None
+
+def _recent_projects_query(columns: tuple, days: int, limit: int) -> Select:
+    """Active projects updated in the last `days` days, most recent first"""
+    from models.project import ProjectStatus
+
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+
+    return (
+        select(*columns)
+        .where(
+            and_(
+                Project.status.in_([ProjectStatus.ACTIVE, ProjectStatus.IN_PROGRESS]),
+                Project.updated_at >= cutoff_date
+            )
+        )
+        .order_by(Project.updated_at.desc())
+        .limit(limit)
+    )
 
 
 async def get_recent_blogs(
@@ -80,23 +108,7 @@ async def get_recent_blogs(
     Returns:
         List[Blog]: Recent blog posts
     """
-    from models.blog import BlogStatus
-
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-
-    stmt = (
-        select(Blog)
-        .where(
-            and_(
-                Blog.status == BlogStatus.PUBLISHED,
-                Blog.published_at >= cutoff_date
-            )
-        )
-        .order_by(Blog.published_at.desc())
-        .limit(limit)
-    )
-
-    result = await db.execute(stmt)
+    result = await db.execute(_recent_blogs_query((Blog,), days, limit))
     return list(result.scalars().all())
 
 
@@ -116,45 +128,83 @@ async def get_recent_projects(
     Returns:
         List[Project]: Recent projects
     """
-    from models.project import ProjectStatus
+    result = await db.execute(_recent_projects_query((Project,), days, limit))
+    return list(result.scalars().all())
 
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-    stmt = (
-        select(Project)
-        .where(
-            and_(
-                Project.status.in_([ProjectStatus.ACTIVE, ProjectStatus.IN_PROGRESS]),
-                Project.updated_at >= cutoff_date
-            )
-        )
-        .order_by(Project.updated_at.desc())
-        .limit(limit)
-    )
+# ============ Concurrent Collection ============
 
-    result = await db.execute(stmt)
-    return list(result.scalars().all())
+def collection_deadline() -> float:
+    """Event-loop time by which newsletter content collection must finish"""
+    return asyncio.get_running_loop().time() + settings.NEWSLETTER_COLLECT_TIMEOUT_SECONDS
 
 
-async def generate_blog_from_project(
-    db: AsyncSession,
-    project_id: int,
-    style: str = "technical",
-    length: str = "medium",
-) -> Dict[str, str]:
+def _remaining(deadline: float) -> float:
+    return max(deadline - asyncio.get_running_loop().time(), 0.0)
+
+
+async def fetch_rows(stmt: Select, deadline: float) -> List[Row]:
     """
-    Generate a blog post about a project
+    Run a read query on its own session, so independent queries can run
+    concurrently on separate connections
+
+    Args:
+        stmt: Column select (rows keep attribute access: row.title)
+        deadline: Event-loop time limit (see collection_deadline)
+
+    Returns:
+        List[Row]: Result rows
+
+    Raises:
+        asyncio.TimeoutError: Query did not finish before the deadline
+    """
+    async def run() -> List[Row]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(stmt)
+            return list(result.all())
+
+    return await asyncio.wait_for(run(), timeout=_remaining(deadline))
+
+
+async def fetch_github_stats(github_urls: List[str], deadline: float) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch GitHub info for several repositories concurrently
+
+    Lookups still pending at the deadline are left out rather than failing
+    the collection.
+
+    Args:
+        github_urls: Repository URLs (duplicates and empty values ignored)
+        deadline: Event-loop time limit (see collection_deadline)
+
+    Returns:
+        Dict: github_url -> fetch_github_project_info result
+    """
+    urls = list(dict.fromkeys(url for url in github_urls if url))
+    if not urls:
+        return {}
+
+    tasks = {url: asyncio.create_task(fetch_github_project_info(url)) for url in urls}
+    done, pending = await asyncio.wait(tasks.values(), timeout=_remaining(deadline))
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning(f"GitHub lookups: {len(pending)} of {len(urls)} missed the collection deadline")
+
+    return {url: task.result() for url, task in tasks.items() if task in done and task.result()}
+
+
+async def get_project_data(db: AsyncSession, project_id: int) -> Dict[str, Any]:
+    """
+    Load the project fields used in blog prompts
 
     Args:
         db: Database session
         project_id: Project ID
-        style: Writing style
-        length: Content length
 
     Returns:
-        Dict: Generated blog content
+        Dict: Project prompt data
     """
-    # Get project
     stmt = select(Project).where(Project.id == project_id)
     result = await db.execute(stmt)
     project = result.scalar_one_or_none()
@@ -162,8 +212,7 @@ async def generate_blog_from_project(
     if not project:
         raise ValueError(f"Project not found: {project_id}")
 
-    # Prepare project data
-    project_data = {
+    return {
         "name": project.name,
         "description": project.description,
         "tech_stack": project.tech_stack or [],
@@ -171,9 +220,21 @@ async def generate_blog_from_project(
         "demo_url": project.demo_url,
     }
 
-    # Fetch GitHub info if available
-    if project.github_url:
-        github_info = await fetch_github_project_info(project.github_url)
+
+async def enrich_project_data(project_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add GitHub stats (stars, language, topics) to project prompt data
+
+    Args:
+        project_data: Output of get_project_data
+
+    Returns:
+        Dict: Copy of project_data, enriched when GitHub info is available
+    """
+    project_data = dict(project_data)
+
+    if project_data.get("github_url"):
+        github_info = await fetch_github_project_info(project_data["github_url"])
         if github_info:
             project_data.update({
                 "stars": github_info.get("stars"),
@@ -181,63 +242,130 @@ async def generate_blog_from_project(
                 "topics": github_info.get("topics", []),
             })
 
+    return project_data
+
+
+async def generate_blog_from_project_data(
+    project_data: Dict[str, Any],
+    style: str = "technical",
+    length: str = "medium",
+    use_cache: bool = True,
+) -> Dict[str, str]:
+    """
+    Generate a blog post from already-loaded project data (no DB access)
+
+    Args:
+        project_data: Output of get_project_data
+        style: Writing style
+        length: Content length
+        use_cache: If False, bypass the LLM cache
+
+    Returns:
+        Dict: Generated blog content
+    """
+    project_data = await enrich_project_data(project_data)
+
     # Generate blog content
-    topic = f"{project.name} 프로젝트 소개"
+    topic = f"{project_data['name']} 프로젝트 소개"
 
     blog_content = await generate_blog_content(
         topic=topic,
         style=style,
         length=length,
         project_data=project_data,
+        use_cache=use_cache,
     )
 
     return blog_content
 
 
-async def generate_newsletter_from_recent_content(
+async def generate_blog_from_project(
     db: AsyncSession,
-    period_days: int = 7,
+    project_id: int,
+    style: str = "technical",
+    length: str = "medium",
 ) -> Dict[str, str]:
     """
-    Generate newsletter from recent blog posts and projects
+    Generate a blog post about a project
 
     Args:
         db: Database session
+        project_id: Project ID
+        style: Writing style
+        length: Content length
+
+    Returns:
+        Dict: Generated blog content
+    """
+    project_data = await get_project_data(db, project_id)
+    return await generate_blog_from_project_data(project_data, style=style, length=length)
+
+
+async def collect_recent_content(period_days: int = 7) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Collect recent blog posts and projects for a newsletter
+
+    Both queries run concurrently on their own sessions and load only the
+    fields the prompt uses, within NEWSLETTER_COLLECT_TIMEOUT_SECONDS.
+
+    Args:
         period_days: Period in days (7 for weekly, 30 for monthly)
 
     Returns:
-        Dict: Generated newsletter content
+        Dict with "blog_posts" and "projects" lists
     """
-    # Get recent blogs
-    blogs = await get_recent_blogs(db, days=period_days, limit=5)
-    blog_data = [
-        {
-            "title": blog.title,
-            "excerpt": blog.excerpt,
-            "slug": blog.slug,
-        }
-        for blog in blogs
-    ]
-
-    # Get recent projects
-    projects = await get_recent_projects(db, days=period_days * 2, limit=5)
-    project_data = [
-        {
-            "name": project.name,
-            "description": project.description,
-            "slug": project.slug,
-        }
-        for project in projects
-    ]
+    deadline = collection_deadline()
+
+    blogs, projects = await asyncio.gather(
+        fetch_rows(_recent_blogs_query((Blog.title, Blog.excerpt, Blog.slug), period_days, 5), deadline),
+        fetch_rows(
+            _recent_projects_query((Project.name, Project.description, Project.slug), period_days * 2, 5),
+            deadline,
+        ),
+    )
+
+    return {
+        "blog_posts": [dict(row._mapping) for row in blogs],
+        "projects": [dict(row._mapping) for row in projects],
+    }
 
-    # Generate newsletter
-    newsletter_content = await generate_newsletter_content(
+
+async def generate_newsletter_from_collected_content(
+    collected: Dict[str, List[Dict[str, Any]]],
+    period_days: int = 7,
+    use_cache: bool = True,
+) -> Dict[str, str]:
+    """
+    Generate newsletter from collect_recent_content output (no DB access)
+
+    Args:
+        collected: Output of collect_recent_content
+        period_days: Period in days
+        use_cache: If False, bypass the LLM cache
+
+    Returns:
+        Dict: Generated newsletter content
+    """
+    return await generate_newsletter_content(
         period_days=period_days,
-        blog_posts=blog_data if blog_data else None,
-        projects=project_data if project_data else None,
+        blog_posts=collected["blog_posts"] or None,
+        projects=collected["projects"] or None,
+        use_cache=use_cache,
     )
 
-    return newsletter_content
+
+async def generate_newsletter_from_recent_content(period_days: int = 7) -> Dict[str, str]:
+    """
+    Generate newsletter from recent blog posts and projects
+
+    Args:
+        period_days: Period in days (7 for weekly, 30 for monthly)
+
+    Returns:
+        Dict: Generated newsletter content
+    """
+    collected = await collect_recent_content(period_days=period_days)
+    return await generate_newsletter_from_collected_content(collected, period_days=period_days)
 
 
 def format_markdown_content(content: str) -> str:
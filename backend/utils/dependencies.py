@@ -50,6 +50,11 @@ async def get_current_user(
     )
     user = result.scalar_one_or_none()
 
+    # End the lookup transaction so the pooled connection is released while
+    # long-running handlers (AI generation, SSE streams) do non-DB work.
+    # The session reconnects on its next query.
+    await db.commit()
+
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
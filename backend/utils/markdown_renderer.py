@@ -0,0 +1,153 @@
+"""
+Markdown Renderer
+
+Server-side rendering of blog/project content and activity descriptions:
+Markdown -> sanitised HTML with heading anchors, a table of contents and
+an estimated reading time.
+
+Results are cached in-process by the SHA-256 of the source (plus the
+renderer version), so an unchanged document is rendered once per process
+however often it is read, and the hash doubles as a stable cache key for
+the edge.
+"""
+import hashlib
+import math
+import re
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+import markdown
+import nh3
+from markdown.extensions.toc import slugify_unicode
+
+from core.config import settings
+from utils.search_index import plain_text
+
+
+RENDERER_VERSION = "1"  # Bump when the output changes so cached HTML is not reused
+KOREAN_CHARS_PER_MINUTE = 500
+WORDS_PER_MINUTE = 200  # Non-Hangul words (English, code identifiers)
+TOC_MAX_LEVEL = 3  # Deepest heading level listed in the table of contents
+
+EXTENSIONS = ["extra", "sane_lists", "toc"]
+EXTENSION_CONFIGS = {
+    "toc": {
+        "slugify": slugify_unicode,  # Keeps Hangul in anchors ("#설치-방법")
+        "permalink": "#",
+        "permalink_class": "heading-anchor",
+        "permalink_title": "",
+    },
+}
+
+# Sanitiser allow-list: what the Markdown above produces, nothing scriptable
+ALLOWED_TAGS = {
+    "a", "abbr", "blockquote", "br", "code", "dd", "del", "div", "dl", "dt", "em",
+    "h1", "h2", "h3", "h4", "h5", "h6", "hr", "img", "ins", "kbd", "li", "ol", "p",
+    "pre", "s", "span", "strong", "sub", "sup", "table", "tbody", "td", "tfoot", "th",
+    "thead", "tr", "ul",
+}
+HEADING_ATTRIBUTES = {"id"}
+ALLOWED_ATTRIBUTES = {
+    "a": {"href", "title", "class", "id"},
+    "abbr": {"title"},
+    "code": {"class"},  # language-* from fenced code blocks
+    "div": {"class"},
+    "img": {"src", "alt", "title", "width", "height"},
+    "li": {"id"},
+    "ol": {"start"},
+    "sup": {"id"},
+    "td": {"align"},
+    "th": {"align"},
+    **{f"h{level}": HEADING_ATTRIBUTES for level in range(1, 7)},
+}
+URL_SCHEMES = {"http", "https", "mailto"}
+
+HANGUL = re.compile(r"[가-힣]")
+WORD = re.compile(r"[A-Za-z0-9_]+")
+
+_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_cache_lock = Lock()
+
+
+def content_hash(source: str) -> str:
+    """SHA-256 of a document's source and the renderer version"""
+    return hashlib.sha256(f"{RENDERER_VERSION}\n{source}".encode("utf-8")).hexdigest()
+
+
+def reading_time_minutes(source: Optional[str]) -> int:
+    """
+    Estimated reading time
+
+    Hangul is counted per character, everything else per word.
+
+    Args:
+        source: Markdown source
+
+    Returns:
+        Minutes (at least 1)
+    """
+    text = plain_text(source)
+    korean = len(HANGUL.findall(text))
+    words = len(WORD.findall(HANGUL.sub(" ", text)))
+    return max(1, math.ceil(korean / KOREAN_CHARS_PER_MINUTE + words / WORDS_PER_MINUTE))
+
+
+def _toc(tokens: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Nested table of contents from toc extension tokens (down to TOC_MAX_LEVEL)"""
+    return [
+        {
+            "id": token["id"],
+            "title": token["name"],
+            "level": token["level"],
+            "children": _toc(token["children"]),
+        }
+        for token in tokens
+        if token["level"] <= TOC_MAX_LEVEL
+    ]
+
+
+def _render(source: str) -> Dict[str, Any]:
+    # A Markdown instance keeps per-document state, so one per call (thread safe)
+    md = markdown.Markdown(extensions=EXTENSIONS, extension_configs=EXTENSION_CONFIGS)
+    html = md.convert(source)
+    html = nh3.clean(
+        html,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        url_schemes=URL_SCHEMES,
+        link_rel="noopener noreferrer nofollow",
+    )
+    return {
+        "html": html,
+        "toc": _toc(md.toc_tokens),
+        "reading_time_minutes": reading_time_minutes(source),
+    }
+
+
+def render_markdown(source: Optional[str]) -> Dict[str, Any]:
+    """
+    Render Markdown to sanitised HTML (cached by content hash)
+
+    Args:
+        source: Markdown source
+
+    Returns:
+        {"html", "toc", "reading_time_minutes", "content_hash"} (shared, do not mutate)
+    """
+    source = source or ""
+    key = content_hash(source)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached
+
+    rendered = {**_render(source), "content_hash": key}
+
+    with _cache_lock:
+        _cache[key] = rendered
+        while len(_cache) > settings.MARKDOWN_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return rendered
+
@@ -0,0 +1,261 @@
+"""
+Prompt Budget Utility
+
+Token counting and size limits for LLM prompts:
+- count_tokens / count_message_tokens: exact with tiktoken when installed,
+  otherwise a conservative estimate (ASCII ~4 chars/token, Hangul and other
+  non-ASCII ~1 char/token)
+- truncate_to_tokens: cut text to a token budget at a word boundary
+- fit_lines: keep list items until a token budget is used up
+- compact_readme: shrink a README to a budget, keeping the heading outline
+  and dropping badges, images, HTML and long code blocks
+"""
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+try:
+    import tiktoken
+except ImportError:  # Optional dependency
+    tiktoken = None
+
+
+MESSAGE_OVERHEAD_TOKENS = 4  # Role/separator tokens per chat message
+TRUNCATION_MARK = "…"
+
+
+# ============ Token Counting ============
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """
+    Count (or estimate) the tokens in a text
+
+    Args:
+        text: Text to measure
+        model: Model whose tokenizer to use (tiktoken only)
+
+    Returns:
+        Token count
+    """
+    if not text:
+        return 0
+
+    if tiktoken is not None:
+        return len(_encoding(model).encode(text, disallowed_special=()))
+
+    ascii_chars = sum(1 for ch in text if ch < "\x80")
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def count_message_tokens(messages: List[Dict[str, str]], model: str = "gpt-4o") -> int:
+    """
+    Count (or estimate) the prompt tokens of chat messages
+
+    Args:
+        messages: Chat messages
+        model: Model whose tokenizer to use
+
+    Returns:
+        Prompt token count
+    """
+    return sum(
+        count_tokens(message.get("content", ""), model) + MESSAGE_OVERHEAD_TOKENS
+        for message in messages
+    )
+
+
+# ============ Budgeting ============
+
+def truncate_to_tokens(text: Optional[str], max_tokens: int, model: str = "gpt-4o") -> str:
+    """
+    Cut text to at most max_tokens, preferring a word boundary
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        model: Model whose tokenizer to use
+
+    Returns:
+        The text, or a shortened version ending with "…"
+    """
+    if not text:
+        return ""
+    # No token is longer than a few characters; skip measuring the rest
+    text = text[:max(max_tokens, 0) * 16].strip()
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+
+    # Binary search for the longest prefix that fits
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count_tokens(text[:middle], model) + 1 <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+
+    cut = text[:low]
+    boundary = cut.rfind(" ")
+    if boundary > low * 0.7:
+        cut = cut[:boundary]
+    return cut.rstrip(" ,.;:-") + TRUNCATION_MARK
+
+
+def fit_lines(lines: List[str], max_tokens: int, model: str = "gpt-4o") -> List[str]:
+    """
+    Keep lines, in order, while they fit the token budget
+
+    Args:
+        lines: Candidate lines (e.g. one per blog post)
+        max_tokens: Token budget for all lines together
+        model: Model whose tokenizer to use
+
+    Returns:
+        The lines that fit
+    """
+    kept = []
+    used = 0
+    for line in lines:
+        tokens = count_tokens(line, model) + 1  # newline
+        if used + tokens > max_tokens:
+            break
+        kept.append(line)
+        used += tokens
+    return kept
+
+
+# ============ README Compaction ============
+
+_HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_CODE_BLOCK = re.compile(r"^(```|~~~)[^\n]*\n(.*?)^\1[ \t]*$", re.DOTALL | re.MULTILINE)
+_BADGE_OR_IMAGE = re.compile(r"\[!\[[^\]]*\]\([^)]*\)\]\([^)]*\)|!\[[^\]]*\]\([^)]*\)")
+_HTML_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+_SETEXT_UNDERLINE = re.compile(r"^(=+|-+)\s*$")
+
+MAX_CODE_BLOCK_LINES = 6  # Longer code blocks are dropped (install commands survive)
+
+
+def _strip_noise(text: str) -> str:
+    """Remove comments, badges, images, HTML tags and long code blocks"""
+    text = _HTML_COMMENT.sub("", text)
+
+    def replace_code(match: re.Match) -> str:
+        body = match.group(2)
+        if body.count("\n") <= MAX_CODE_BLOCK_LINES:
+            return match.group(0)
+        return "(코드 생략)\n"
+
+    text = _CODE_BLOCK.sub(replace_code, text)
+    text = _BADGE_OR_IMAGE.sub("", text)
+    text = _HTML_TAG.sub("", text)
+
+    lines = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        # Lines left with only separators after removing badges/images
+        if line and not re.search(r"[^\s|·•]", line):
+            continue
+        lines.append(line)
+
+    text = "\n".join(lines)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def _split_sections(text: str) -> List[List[str]]:
+    """Split markdown into [heading, body] sections (heading may be "")"""
+    sections: List[List[str]] = [["", ""]]
+    lines = text.splitlines()
+    body: List[str] = []
+    in_code = False
+
+    for index, line in enumerate(lines):
+        if line.lstrip().startswith(("```", "~~~")):
+            in_code = not in_code
+        if in_code or line.lstrip().startswith(("```", "~~~")):
+            body.append(line)
+            continue
+
+        heading = _HEADING.match(line)
+        # Setext heading: "Title" followed by "====="/"-----"
+        is_setext_title = (
+            index + 1 < len(lines)
+            and line.strip()
+            and _SETEXT_UNDERLINE.match(lines[index + 1])
+        )
+        if heading or is_setext_title:
+            sections[-1][1] = "\n".join(body).strip()
+            title = f"{heading.group(1)} {heading.group(2).strip()}" if heading else f"## {line.strip()}"
+            sections.append([title, ""])
+            body = []
+        elif _SETEXT_UNDERLINE.match(line) and index > 0 and sections[-1][0] and not body:
+            continue
+        else:
+            body.append(line)
+
+    sections[-1][1] = "\n".join(body).strip()
+    return [section for section in sections if section[0] or section[1]]
+
+
+def compact_readme(readme: Optional[str], max_tokens: int, model: str = "gpt-4o") -> str:
+    """
+    Shrink a README to a token budget while keeping its structure
+
+    Noise (badges, images, HTML, long code blocks) is removed first. If the
+    result is still over budget, every heading is kept and the remaining
+    budget is shared between section bodies so one long section cannot
+    crowd out the rest.
+
+    Args:
+        readme: README markdown
+        max_tokens: Token budget
+        model: Model whose tokenizer to use
+
+    Returns:
+        Compacted README
+    """
+    if not readme:
+        return ""
+
+    text = _strip_noise(readme)
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    sections = _split_sections(text)
+
+    # Headings first: they are the cheapest summary of what the project covers
+    heading_tokens = sum(count_tokens(heading, model) + 1 for heading, _ in sections if heading)
+    if heading_tokens >= max_tokens:
+        headings = [heading for heading, _ in sections if heading]
+        return "\n".join(fit_lines(headings, max_tokens, model))
+
+    # Max-min fair share of the rest: short sections are kept whole, long ones
+    # split what is left equally
+    remaining = max_tokens - heading_tokens
+    sizes = [count_tokens(body, model) + 2 if body else 0 for _, body in sections]
+    allowance = [0] * len(sections)
+    pending = sorted((size, index) for index, size in enumerate(sizes) if size)
+    for position, (size, index) in enumerate(pending):
+        share = remaining // (len(pending) - position)
+        allowance[index] = min(size, share)
+        remaining -= allowance[index]
+
+    parts = []
+    for (heading, body), tokens in zip(sections, allowance):
+        if heading:
+            parts.append(heading)
+        if body and tokens > 10:
+            parts.append(truncate_to_tokens(body, tokens - 2, model))
+        parts.append("")
+
+    return "\n".join(parts).strip()
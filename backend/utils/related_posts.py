@@ -0,0 +1,214 @@
+"""
+Related Posts Model
+
+TF-IDF similarity between published blog posts, computed with sparse
+matrix products (NumPy/SciPy). Each post becomes an L2-normalised vector
+of weighted terms: title and content tokens (utils.search_index.tokenize,
+so Hangul is compared by bigrams) plus its tags as "#tag" features, which
+are boosted so shared tags weigh more than shared words. Cosine similarity
+is then a dot product, and top-k neighbours are picked per row block.
+
+The vocabulary and IDF weights are fixed when the model is built; posts
+added or edited afterwards are vectorised against them (new words are
+ignored until the next full build).
+"""
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from utils.search_index import plain_text, tokenize
+
+
+TITLE_WEIGHT = 3.0  # A title token counts as this many content tokens
+TAG_WEIGHT = 4.0  # Boost of "#tag" features after TF-IDF weighting
+CONTENT_MAX_CHARS = 5000  # Plain-text content considered per post
+MAX_TERMS_PER_POST = 128  # Highest-weighted terms kept per vector
+MIN_DF = 2  # Terms in fewer posts cannot relate two posts
+MAX_DF_RATIO = 0.5  # Terms in more than this share of posts carry no signal
+BLOCK_ROWS = 1024  # Rows per similarity block (bounds memory at N * BLOCK_ROWS floats)
+DENSE_MAX_BYTES = 256 * 1024 * 1024  # Multiply against a dense copy of the matrix up to this size
+
+
+def post_terms(title: Optional[str], tags: Optional[str], content: Optional[str]) -> Dict[str, float]:
+    """
+    Weighted term counts of a post
+
+    Args:
+        title: Post title
+        tags: Comma-separated tags (Blog.tags)
+        content: Markdown content
+
+    Returns:
+        Term -> weighted count ("#tag" keys for tags)
+    """
+    counts: Counter = Counter()
+    for token in tokenize(title):
+        counts[token] += TITLE_WEIGHT
+    counts.update(tokenize(plain_text(content)[:CONTENT_MAX_CHARS]))
+    for tag in (tags or "").split(","):
+        tag = " ".join(tag.split()).lower()
+        if tag:
+            counts[f"#{tag}"] = 1.0
+    return dict(counts)
+
+
+class RelatedModel:
+    """TF-IDF vectors of published posts with top-k neighbour queries"""
+
+    def __init__(self, posts: Sequence[Tuple[int, Dict[str, float]]]):
+        """
+        Build vocabulary, IDF weights and vectors
+
+        Args:
+            posts: (blog_id, post_terms()) pairs
+        """
+        n = len(posts)
+        document_frequency: Counter = Counter()
+        for _, terms in posts:
+            document_frequency.update(terms.keys())
+
+        max_df = max(MIN_DF, int(n * MAX_DF_RATIO))
+        vocabulary = sorted(
+            term for term, df in document_frequency.items()
+            if MIN_DF <= df <= max_df
+        )
+        self.vocabulary: Dict[str, int] = {term: i for i, term in enumerate(vocabulary)}
+        self.idf = np.array(
+            [math.log((1 + n) / (1 + document_frequency[term])) + 1 for term in vocabulary],
+            dtype=np.float32,
+        )
+        self.boost = np.array(
+            [TAG_WEIGHT if term.startswith("#") else 1.0 for term in vocabulary],
+            dtype=np.float32,
+        )
+
+        self.ids: List[int] = [blog_id for blog_id, _ in posts]
+        self._rows: Dict[int, int] = {blog_id: i for i, blog_id in enumerate(self.ids)}
+        self.matrix = self._vectorize([terms for _, terms in posts])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, blog_id: int) -> bool:
+        return blog_id in self._rows
+
+    def _vectorize(self, documents: Iterable[Dict[str, float]]) -> sparse.csr_matrix:
+        """CSR matrix of L2-normalised TF-IDF rows (sublinear TF, top terms only)"""
+        indptr = [0]
+        indices: List[int] = []
+        values: List[float] = []
+        for terms in documents:
+            columns = [self.vocabulary[term] for term in terms if term in self.vocabulary]
+            if columns:
+                column_array = np.array(columns, dtype=np.int32)
+                tf = np.array([terms[term] for term in terms if term in self.vocabulary], dtype=np.float32)
+                weights = (1 + np.log(tf)) * self.idf[column_array] * self.boost[column_array]
+                if len(weights) > MAX_TERMS_PER_POST:
+                    keep = np.argpartition(weights, -MAX_TERMS_PER_POST)[-MAX_TERMS_PER_POST:]
+                    column_array, weights = column_array[keep], weights[keep]
+                weights /= np.linalg.norm(weights)
+                indices.extend(column_array.tolist())
+                values.extend(weights.tolist())
+            indptr.append(len(indices))
+
+        return sparse.csr_matrix(
+            (np.array(values, dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr)),
+            shape=(len(indptr) - 1, len(self.vocabulary)),
+        )
+
+    # ============ Incremental Updates ============
+
+    def upsert(self, blog_id: int, terms: Dict[str, float]) -> None:
+        """Add or replace a post's vector (vocabulary and IDF stay fixed)"""
+        row = self._vectorize([terms])
+        index = self._rows.get(blog_id)
+        if index is None:
+            self._rows[blog_id] = len(self.ids)
+            self.ids.append(blog_id)
+            self.matrix = sparse.vstack([self.matrix, row], format="csr")
+        else:
+            self.matrix = sparse.vstack([self.matrix[:index], row, self.matrix[index + 1:]], format="csr")
+
+    def remove(self, blog_id: int) -> bool:
+        """Drop a post's vector"""
+        index = self._rows.pop(blog_id, None)
+        if index is None:
+            return False
+        del self.ids[index]
+        self.matrix = sparse.vstack([self.matrix[:index], self.matrix[index + 1:]], format="csr")
+        self._rows = {other: i for i, other in enumerate(self.ids)}
+        return True
+
+    # ============ Queries ============
+
+    def similarities(self, blog_id: int) -> Dict[int, float]:
+        """Cosine similarity of one post to every other post (non-zero only)"""
+        index = self._rows.get(blog_id)
+        if index is None:
+            return {}
+        scores = (self.matrix @ self.matrix[index].T).toarray().ravel()
+        scores[index] = 0.0
+        nonzero = np.flatnonzero(scores > 0)
+        return {self.ids[i]: float(scores[i]) for i in nonzero}
+
+    def neighbours(
+        self,
+        blog_ids: Optional[Sequence[int]] = None,
+        k: int = 5,
+        min_score: float = 0.0,
+    ) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        Top-k most similar posts
+
+        Similarities are computed one block of rows at a time and top-k is
+        picked with argpartition. Larger batches are multiplied against a
+        dense transposed copy of the matrix when it fits in DENSE_MAX_BYTES
+        (much faster when most posts share some terms), otherwise
+        sparse x sparse.
+
+        Args:
+            blog_ids: Posts to compute neighbours for (default: all)
+            k: Neighbours per post
+            min_score: Drop neighbours at or below this similarity
+
+        Returns:
+            blog_id -> [(related_id, score)], best first
+        """
+        rows = (
+            [self._rows[blog_id] for blog_id in blog_ids if blog_id in self._rows]
+            if blog_ids is not None else list(range(len(self.ids)))
+        )
+        if not rows or len(self.ids) < 2:
+            return {self.ids[row]: [] for row in rows}
+
+        k = min(k, len(self.ids) - 1)
+        if len(rows) > 64 and len(self.vocabulary) * len(self.ids) * 4 <= DENSE_MAX_BYTES:
+            transposed = self.matrix.T.toarray()
+        else:
+            transposed = self.matrix.T.tocsc()
+        result: Dict[int, List[Tuple[int, float]]] = {}
+
+        for start in range(0, len(rows), BLOCK_ROWS):
+            block_rows = np.array(rows[start:start + BLOCK_ROWS])
+            scores = self.matrix[block_rows] @ transposed
+            if sparse.issparse(scores):
+                scores = scores.toarray()
+            scores[np.arange(len(block_rows)), block_rows] = -1.0  # Not related to itself
+
+            top = np.argpartition(scores, -k, axis=1)[:, -k:]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            for row, columns, values in zip(block_rows, top, top_scores):
+                result[self.ids[row]] = [
+                    (self.ids[column], round(float(value), 4))
+                    for column, value in zip(columns, values)
+                    if value > min_score
+                ]
+
+        return result
@@ -0,0 +1,407 @@
+"""
+Search Index Utilities
+
+Korean-aware tokenization, an in-process BM25 inverted index and result
+highlighting, shared by both search backends (services.search_service).
+
+Hangul runs are split into overlapping character bigrams: Korean words
+carry particles and form compounds ("공작소에서", "데이터공작소"), so
+whitespace tokens rarely match what users type, while bigrams do. Other
+text becomes lowercase alphanumeric words.
+"""
+import heapq
+import html
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+_TOKEN_RE = re.compile(r"([가-힣]+)|([a-z0-9]+)")
+
+# Weighted term frequency per field (title matches count three times, ...)
+FIELD_WEIGHTS = {"title": 3, "tags": 2, "summary": 1, "content": 1}
+
+# Positional limits of PostgreSQL tsvectors
+_TSVECTOR_MAX_POSITION = 16383
+_TSVECTOR_MAX_POSITIONS_PER_LEXEME = 256
+_TSVECTOR_WEIGHTS = {"title": "A", "tags": "B", "summary": "C", "content": "D"}
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Split text into search tokens
+
+    Args:
+        text: Any text (None is treated as empty)
+
+    Returns:
+        Tokens in order: Hangul bigrams (single syllables stay whole) and
+        lowercase alphanumeric words
+
+    Example:
+        >>> tokenize("데이터공작소 FastAPI")
+        ['데이', '이터', '터공', '공작', '작소', 'fastapi']
+    """
+    tokens = []
+    for hangul, word in _TOKEN_RE.findall((text or "").lower()):
+        if hangul:
+            if len(hangul) == 1:
+                tokens.append(hangul)
+            else:
+                tokens.extend(hangul[i:i + 2] for i in range(len(hangul) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def query_terms(query: str) -> List[str]:
+    """Unique tokens of a query, in order"""
+    return list(dict.fromkeys(tokenize(query)))
+
+
+def plain_text(markdown: Optional[str]) -> str:
+    """Markdown reduced to plain text for indexing and snippets"""
+    text = re.sub(r"```.*?```", " ", markdown or "", flags=re.S)  # Code blocks
+    text = re.sub(r"!?\[([^\]]*)\]\([^)]*\)", r"\1", text)  # Links/images -> label
+    text = re.sub(r"<[^>]+>", " ", text)  # HTML tags
+    text = re.sub(r"[#>*_`|~]+", " ", text)
+    return " ".join(text.split())
+
+
+# ============ BM25 Index ============
+
+class SearchIndex:
+    """
+    In-process inverted index with BM25 ranking
+
+    Documents are keyed by (kind, id), e.g. ("blog", 12). Postings are
+    parallel arrays of ascending document numbers and weighted term
+    frequencies; re-adding a document tombstones its old number.
+
+    Terms with more than `exact_max` postings are only scored through
+    their champion list (the `champions` postings with the highest BM25
+    impact, kept up to date on add), which bounds query time on large
+    indexes at the cost of possibly missing weak matches of very common
+    terms. Removed documents stay in champion lists until more than
+    `champion_stale_ratio` of a list is stale; it is then recomputed from
+    the postings, so live documents get their slots back.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        champions: int = 1000,
+        exact_max: int = 5000,
+        champion_stale_ratio: float = 0.1,
+    ):
+        """
+        Initialize index
+
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalisation
+            champions: Champion list size for common terms
+            exact_max: Terms with at most this many postings are scored exhaustively
+            champion_stale_ratio: Share of removed documents at which a champion list is recomputed
+        """
+        self.k1 = k1
+        self.b = b
+        self.champions = champions
+        self.exact_max = exact_max
+        self.champion_stale_ratio = champion_stale_ratio
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._champions: Dict[str, List[Tuple[float, int]]] = {}  # Term -> min-heap of (impact, number)
+        self._champions_checked: Dict[str, int] = {}  # Term -> tombstone count when its heap was last checked
+        self._keys: List[Optional[Tuple[str, int]]] = []  # Document number -> key (None = removed)
+        self._lengths = array("f")
+        self._numbers: Dict[Tuple[str, int], int] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __contains__(self, key: Tuple[str, int]) -> bool:
+        return key in self._numbers
+
+    @property
+    def tombstones(self) -> int:
+        """Removed document numbers still referenced by postings"""
+        return len(self._keys) - len(self._numbers)
+
+    @property
+    def _average_length(self) -> float:
+        return (self._total_length / len(self._numbers) if self._numbers else 0.0) or 1.0
+
+    def add(self, kind: str, doc_id: int, fields: Dict[str, Optional[str]]) -> None:
+        """
+        Add or replace a document
+
+        Args:
+            kind: Document kind ("blog", "project")
+            doc_id: Document ID
+            fields: Field texts keyed by FIELD_WEIGHTS names
+        """
+        self.remove(kind, doc_id)
+
+        frequencies: Dict[str, int] = defaultdict(int)
+        length = 0
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS.get(field, 1)
+            for token in tokenize(text):
+                frequencies[token] += weight
+                length += weight
+
+        number = len(self._keys)
+        self._keys.append((kind, doc_id))
+        self._lengths.append(length)
+        self._numbers[(kind, doc_id)] = number
+        self._total_length += length
+        average_length = self._average_length
+
+        for term, frequency in frequencies.items():
+            frequency = min(frequency, 65535)
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = (array("I"), array("H"))
+            postings[0].append(number)
+            postings[1].append(frequency)
+
+            heap = self._champions.get(term)
+            if heap is not None:
+                item = (self._impact(frequency, number, average_length), number)
+                if len(heap) < self.champions:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+    def remove(self, kind: str, doc_id: int) -> bool:
+        """
+        Remove a document
+
+        Returns:
+            True if it was indexed
+        """
+        number = self._numbers.pop((kind, doc_id), None)
+        if number is None:
+            return False
+        self._keys[number] = None
+        self._total_length -= self._lengths[number]
+        return True
+
+    def prepare(self) -> None:
+        """Compute champion lists for all common terms up front (after a bulk build)"""
+        for term, postings in self._postings.items():
+            if len(postings[0]) > self.exact_max:
+                self._champion_numbers(term, postings)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        kinds: Optional[Sequence[str]] = None,
+    ) -> List[Tuple[str, int, float]]:
+        """
+        Rank documents for a query
+
+        All query terms must match; if nothing does, documents matching any
+        term are ranked instead.
+
+        Args:
+            query: Search text
+            limit: Maximum results
+            kinds: Restrict to these kinds (optional)
+
+        Returns:
+            (kind, id, score) tuples, best first
+        """
+        terms = query_terms(query)
+        present = [(term, self._postings[term]) for term in terms if term in self._postings]
+        if not present or not self._numbers:
+            return []
+
+        kinds = set(kinds) if kinds else None
+        scorers = [(numbers, frequencies, self._idf(len(numbers))) for _, (numbers, frequencies) in present]
+
+        top = []
+        if len(present) == len(terms):
+            top = heapq.nlargest(
+                limit,
+                self._score(self._candidates(present, conjunctive=True), scorers, kinds, require_all=True),
+                key=lambda hit: hit[1],
+            )
+        if not top:
+            top = heapq.nlargest(
+                limit,
+                self._score(self._candidates(present, conjunctive=False), scorers, kinds, require_all=False),
+                key=lambda hit: hit[1],
+            )
+
+        return [(*self._keys[number], round(score, 4)) for number, score in top]
+
+    # ============ Scoring ============
+
+    def _idf(self, document_frequency: int) -> float:
+        n = len(self._numbers)
+        return math.log(1 + max(n - document_frequency + 0.5, 0.5) / (document_frequency + 0.5))
+
+    def _impact(self, frequency: int, number: int, average_length: float) -> float:
+        """BM25 term-frequency component of one posting"""
+        norm = self.k1 * (1 - self.b + self.b * self._lengths[number] / average_length)
+        return frequency * (self.k1 + 1) / (frequency + norm)
+
+    def _champion_numbers(self, term: str, postings: Tuple[array, array]) -> List[int]:
+        """
+        Document numbers of a term's highest-impact live postings
+
+        The heap is computed once and then maintained by add. Removals are
+        not tracked per term, so the heap is recounted only when documents
+        were removed since its last check, and recomputed once too many of
+        its entries are stale.
+        """
+        keys = self._keys
+        tombstones = self.tombstones
+        heap = self._champions.get(term)
+
+        if heap is not None and self._champions_checked.get(term) != tombstones:
+            stale = sum(1 for _, number in heap if keys[number] is None)
+            if stale > len(heap) * self.champion_stale_ratio:
+                heap = None
+
+        if heap is None:
+            average_length = self._average_length
+            heap = heapq.nlargest(self.champions, (
+                (self._impact(frequency, number, average_length), number)
+                for number, frequency in zip(*postings)
+                if keys[number] is not None
+            ))
+            heapq.heapify(heap)
+            self._champions[term] = heap
+        self._champions_checked[term] = tombstones
+
+        return [number for _, number in heap if keys[number] is not None]
+
+    def _candidates(self, present, conjunctive: bool) -> Iterable[int]:
+        """Document numbers worth scoring (full postings of rare terms, champions of common ones)"""
+        if conjunctive:
+            _, postings = min(present, key=lambda item: len(item[1][0]))
+            if len(postings[0]) <= self.exact_max:
+                return postings[0]  # Every full match contains the rarest term
+
+        candidates = set()
+        for term, postings in present:
+            if len(postings[0]) <= self.exact_max:
+                candidates.update(postings[0])
+            else:
+                candidates.update(self._champion_numbers(term, postings))
+        return candidates
+
+    def _score(self, candidates, scorers, kinds, require_all: bool) -> Iterable[Tuple[int, float]]:
+        """BM25 scores of candidates, looking terms up in the full postings by binary search"""
+        k1, b = self.k1, self.b
+        keys, lengths = self._keys, self._lengths
+        average_length = self._average_length
+
+        for number in candidates:
+            key = keys[number]
+            if key is None or (kinds and key[0] not in kinds):
+                continue
+
+            norm = k1 * (1 - b + b * lengths[number] / average_length)
+            score = 0.0
+            for numbers, frequencies, idf in scorers:
+                j = bisect_left(numbers, number)
+                if j < len(numbers) and numbers[j] == number:
+                    frequency = frequencies[j]
+                    score += idf * frequency * (k1 + 1) / (frequency + norm)
+                elif require_all:
+                    break
+            else:
+                yield number, score
+
+
+# ============ PostgreSQL tsvector ============
+
+def tsvector_literal(fields: Dict[str, Optional[str]]) -> str:
+    """
+    tsvector text for the same tokens, with field weights as A-D labels
+
+    Cast with ::tsvector; lexemes are taken verbatim, so PostgreSQL's own
+    parser (which does not split Korean) is not involved.
+
+    Args:
+        fields: Field texts keyed by FIELD_WEIGHTS names
+
+    Returns:
+        str: e.g. "'공작':1A,5D 'fastapi':3B"
+    """
+    positions: Dict[str, List[str]] = defaultdict(list)
+    position = 0
+    for field, text in fields.items():
+        weight = _TSVECTOR_WEIGHTS.get(field, "D")
+        for token in tokenize(text):
+            position = min(position + 1, _TSVECTOR_MAX_POSITION)
+            lexeme_positions = positions[token]
+            if len(lexeme_positions) < _TSVECTOR_MAX_POSITIONS_PER_LEXEME:
+                lexeme_positions.append(f"{position}{weight}")
+
+    return " ".join(f"'{token}':{','.join(pos)}" for token, pos in positions.items())
+
+
+def tsquery_literal(terms: Sequence[str], operator: str = "&") -> str:
+    """tsquery text matching all (&) or any (|) of the terms; cast with ::tsquery"""
+    return f" {operator} ".join(f"'{term}'" for term in terms)
+
+
+# ============ Highlighting ============
+
+def _match_pattern(query: str) -> Optional[re.Pattern]:
+    """Regex for query words, falling back to their tokens (longest first)"""
+    words = {word for word in re.findall(r"[\w\-.+#]+", query.lower()) if len(word) > 1}
+    words.update(term for term in query_terms(query) if len(term) > 1)
+    if not words:
+        return None
+    alternatives = sorted(words, key=len, reverse=True)
+    return re.compile("|".join(re.escape(word) for word in alternatives), re.IGNORECASE)
+
+
+def highlight(text: Optional[str], query: str, width: Optional[int] = None) -> str:
+    """
+    HTML-escaped text with query matches wrapped in <mark>
+
+    Args:
+        text: Plain text
+        query: Search query
+        width: If set, return a window of about this many characters around
+            the first match ("…" marks cut ends)
+
+    Returns:
+        str: Highlighted HTML fragment
+    """
+    text = text or ""
+    pattern = _match_pattern(query)
+    match = pattern.search(text) if pattern else None
+
+    if width and len(text) > width:
+        start = max((match.start() if match else 0) - width // 3, 0)
+        end = min(start + width, len(text))
+        prefix = "…" if start > 0 else ""
+        suffix = "…" if end < len(text) else ""
+        text = text[start:end]
+    else:
+        prefix = suffix = ""
+
+    if not pattern:
+        return prefix + html.escape(text) + suffix
+
+    parts = []
+    last = 0
+    for found in pattern.finditer(text):
+        parts.append(html.escape(text[last:found.start()]))
+        parts.append(f"<mark>{html.escape(found.group())}</mark>")
+        last = found.end()
+    parts.append(html.escape(text[last:]))
+    return prefix + "".join(parts) + suffix
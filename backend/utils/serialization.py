@@ -0,0 +1,80 @@
+"""
+Fast JSON Serialization Utilities
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+import orjson
+from fastapi.responses import ORJSONResponse as _FastAPIORJSONResponse
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+
+class ORJSONResponse(_FastAPIORJSONResponse):
+    """
+    orjson-backed JSON response
+
+    OPT_UTC_Z renders UTC datetimes as "...Z", matching Pydantic's JSON
+    output, so rows serialized with serialize_rows() produce the same bytes
+    as the equivalent response_model path.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+@lru_cache(maxsize=None)
+def _field_accessors(schema: Type[BaseModel]) -> Tuple[Tuple[str, str, Any], ...]:
+    """
+    Resolve (attribute name, output key, default) for each schema field
+
+    Mirrors `schema.model_validate(obj)` (from_attributes, alias lookup)
+    followed by `model_dump(by_alias=True)`.
+    """
+    accessors = []
+    for name, field in schema.model_fields.items():
+        attribute = field.alias or name
+        key = field.serialization_alias or field.alias or name
+        default = None if field.default is PydanticUndefined else field.default
+        accessors.append((attribute, key, default))
+    return tuple(accessors)
+
+
+def serialize_row(row: Any, schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Convert an ORM row to a JSON-ready dict shaped like `schema`
+
+    Skips Pydantic validation; datetimes and enums are left as-is for orjson.
+
+    Args:
+        row: ORM instance (or any object with matching attributes)
+        schema: Pydantic list-item schema defining fields and aliases
+
+    Returns:
+        Dict keyed like schema.model_dump(by_alias=True)
+    """
+    return {
+        key: getattr(row, attribute, default)
+        for attribute, key, default in _field_accessors(schema)
+    }
+
+
+def serialize_rows(rows: Iterable[Any], schema: Type[BaseModel]) -> List[Dict[str, Any]]:
+    """
+    Convert ORM rows to JSON-ready dicts shaped like `schema`
+
+    Args:
+        rows: ORM instances
+        schema: Pydantic list-item schema
+
+    Returns:
+        List of dicts (see serialize_row)
+    """
+    accessors = _field_accessors(schema)
+    return [
+        {key: getattr(row, attribute, default) for attribute, key, default in accessors}
+        for row in rows
+    ]
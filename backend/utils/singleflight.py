@@ -0,0 +1,70 @@
+"""
+Single-flight Utility
+
+Collapses concurrent calls with the same key into one in-flight coroutine
+whose result (or exception) is shared by every caller.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    De-duplicate concurrent identical async calls
+
+    Example:
+        flights = SingleFlight()
+        info = await flights.do(("repo", "owner/name"), lambda: fetch(owner, name))
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.executed = 0  # Calls that actually ran
+        self.shared = 0  # Calls that joined an in-flight call
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `fn` unless a call with the same key is already in flight
+
+        The shared call runs as its own task, so a caller that is cancelled
+        (e.g. client disconnect) does not cancel it for the other waiters.
+
+        Args:
+            key: Hashable key identifying identical calls
+            fn: Zero-argument coroutine factory
+
+        Returns:
+            Result of the (shared) call
+        """
+        task = self._calls.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self.executed += 1
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """Executed/shared counters"""
+        return {
+            "in_flight": self.in_flight,
+            "executed": self.executed,
+            "shared": self.shared,
+        }